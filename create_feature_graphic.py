@@ -1,62 +1,261 @@
 # 피처 그래픽 생성 스크립트
 
 import os
-from PIL import Image, ImageDraw, ImageFont
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
-def create_feature_graphic():
-    # 피처 그래픽 크기 (1024x500)
-    width, height = 1024, 500
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from asset_cache import ArtifactCache
+
+OUTPUT_PATH = 'assets/store/graphics/feature_graphic.png'
+
+# 기본 배경: 위(#1a1a2e)에서 아래(#349ce0)로 선형 그라데이션
+DEFAULT_GRADIENT = {
+    'type': 'linear',
+    'angle': 90,
+    'stops': [[0.0, '#1a1a2e'], [1.0, '#349ce0']],
+}
+
+# 기본 폰트 후보 (앞에서부터 시도, 한글 지원 폰트 포함)
+DEFAULT_FONTS = [
+    "arial.ttf",
+    "malgun.ttf",                 # Windows 맑은 고딕
+    "AppleSDGothicNeo.ttc",       # macOS
+    "NotoSansCJK-Regular.ttc",    # Linux
+    "NanumGothic.ttf",
+]
+
+DEFAULT_COLORS = {
+    'title': '#ffffff',
+    'subtitle': '#e0e0e0',
+    'shadow': '#000000',
+}
+
+DEFAULT_VARIANT = {
+    'output': OUTPUT_PATH,
+    'size': [1024, 500],
+    'text': "SokSol",
+    'subtitle': "실시간 AI 채팅 - 개인정보 100% 비저장",
+    'gradient': DEFAULT_GRADIENT,
+    'fonts': DEFAULT_FONTS,
+    'colors': DEFAULT_COLORS,
+}
+
+LOCALE_OUTPUT = 'assets/store/graphics/{locale}/feature_graphic.png'
+
+@lru_cache(maxsize=None)
+def load_font(fonts, size):
+    """폰트 후보 중 처음 로드되는 폰트 반환 (프로세스 내 캐시)
+
+    모두 실패하면 기본 비트맵 폰트를 사용하고 경고를 출력한다.
+    """
+    for font_name in fonts:
+        try:
+            return ImageFont.truetype(font_name, size)
+        except OSError:
+            continue
+    print(f"⚠️  폰트를 찾을 수 없어 기본 폰트를 사용합니다: {', '.join(fonts)} ({size}px)")
+    return ImageFont.load_default()
+
+@lru_cache(maxsize=4096)
+def measure_text(text, fonts, size):
+    """텍스트 경계 상자 측정 (같은 문구/폰트 조합은 다시 측정하지 않음)"""
+    return load_font(fonts, size).getbbox(text)
+
+def gradient_positions(width, height, gradient):
+    """픽셀별 그라데이션 위치(0~1) 배열 계산"""
+    kind = gradient.get('type', 'linear')
+    ys, xs = np.mgrid[0:height, 0:width].astype(np.float64)
     
-    # 새 이미지 생성 (그라데이션 배경)
-    image = Image.new('RGB', (width, height), color='#1a1a2e')
-    draw = ImageDraw.Draw(image)
+    if kind == 'linear':
+        # angle: 0 = 왼쪽→오른쪽, 90 = 위→아래
+        angle = np.deg2rad(gradient.get('angle', 90))
+        dx, dy = np.cos(angle), np.sin(angle)
+        projection = xs * dx + ys * dy
+        corners = [0.0, width * dx, height * dy, width * dx + height * dy]
+        low, high = min(corners), max(corners)
+        return (projection - low) / (high - low)
+    
+    if kind == 'radial':
+        # center: 이미지 크기 대비 비율, radius: 대각선 절반 대비 비율
+        cx, cy = gradient.get('center', [0.5, 0.5])
+        radius = gradient.get('radius', 1.0) * np.hypot(width, height) / 2
+        distance = np.hypot(xs - cx * width, ys - cy * height)
+        return np.clip(distance / radius, 0.0, 1.0)
     
-    # 그라데이션 배경 생성
-    for y in range(height):
-        r = int(26 + (52 - 26) * y / height)  # 1a -> 34
-        g = int(26 + (156 - 26) * y / height)  # 1a -> 9c
-        b = int(46 + (224 - 46) * y / height)  # 2e -> e0
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+    raise ValueError(f"알 수 없는 그라데이션 종류: {kind} (linear 또는 radial)")
+
+def render_gradient(width, height, gradient=None):
+    """다중 색상 지점 그라데이션을 배열 연산으로 생성해 PIL 이미지로 반환"""
+    gradient = gradient or DEFAULT_GRADIENT
+    stops = sorted(gradient['stops'], key=lambda stop: stop[0])
+    offsets = [float(offset) for offset, _ in stops]
+    colors = np.array([ImageColor.getrgb(color)[:3] for _, color in stops], dtype=np.float64)
+    
+    positions = gradient_positions(width, height, gradient)
+    pixels = np.empty((height, width, 3), dtype=np.uint8)
+    for channel in range(3):
+        pixels[..., channel] = np.interp(positions, offsets, colors[:, channel])
+    return Image.fromarray(pixels, 'RGB')
+
+def load_variants(config_path):
+    """설정 파일(JSON)에서 그래픽 변형 목록 로드
+
+    {"variants": [{"output": ..., "text": ..., "subtitle": ..., "gradient": {...}}, ...]}
+    생략한 항목은 기본값을 사용한다.
+    """
+    config = json.loads(Path(config_path).read_text(encoding='utf-8'))
+    return [dict(DEFAULT_VARIANT, **variant) for variant in config.get('variants', [])]
+
+def load_manifest(manifest_path):
+    """다국어 매니페스트에서 그래픽 변형 목록 로드
+
+    {"defaults": {...}, "entries": [{"locale": "ko-KR", "title": ..., "subtitle": ...,
+    "colors": {"gradient": [[0, "#..."], [1, "#..."]], "title": "#...", ...}}, ...]}
+    출력 경로는 assets/store/graphics/<locale>/feature_graphic.png 이다.
+    """
+    manifest = json.loads(Path(manifest_path).read_text(encoding='utf-8'))
+    defaults = dict(DEFAULT_VARIANT, **manifest.get('defaults', {}))
     
-    # SokSol 텍스트 추가
+    variants = []
+    for entry in manifest.get('entries', []):
+        locale = entry['locale']
+        colors = dict(defaults['colors'], **entry.get('colors', {}))
+        gradient = dict(defaults['gradient'])
+        if 'gradient' in colors:
+            gradient['stops'] = colors.pop('gradient')
+        
+        variants.append(dict(
+            defaults,
+            locale=locale,
+            output=entry.get('output', LOCALE_OUTPUT.format(locale=locale)),
+            text=entry.get('title', defaults['text']),
+            subtitle=entry.get('subtitle', defaults['subtitle']),
+            fonts=entry.get('fonts', defaults['fonts']),
+            gradient=gradient,
+            colors=colors,
+        ))
+    return variants
+
+def create_feature_graphic(use_cache=True, variant=None, cache=None):
+    variant = variant or DEFAULT_VARIANT
+    output_path = variant['output']
+    outcome = _build_variant(variant, cache or ArtifactCache(enabled=use_cache))
+    if outcome == 'built':
+        print(f"✅ 피처 그래픽 생성 완료: {output_path}")
+    else:
+        print(f"♻️  변경 없음, 캐시 사용: {output_path}")
+    return outcome
+
+def _build_variant(variant, cache):
+    """캐시를 거쳐 변형 하나를 렌더링하고 결과('built' 등) 반환"""
+    # 스크립트 자체를 렌더러 버전으로 사용 (코드가 바뀌면 캐시 무효화)
+    options = {name: value for name, value in variant.items() if name != 'output'}
+    key = cache.key(Path(__file__), **options)
+    return cache.produce(key, variant['output'],
+                         lambda path: render_variant(variant).save(path, 'PNG', quality=95))
+
+_worker_cache = None
+
+def _render_job(args):
+    """워커 프로세스에서 변형 하나 처리 (폰트/측정 캐시는 워커 단위로 재사용)"""
+    global _worker_cache
+    variant, use_cache = args
+    if _worker_cache is None:
+        _worker_cache = ArtifactCache(enabled=use_cache)
     try:
-        # 시스템 폰트 사용 시도
-        font_large = ImageFont.truetype("arial.ttf", 120)
-        font_small = ImageFont.truetype("arial.ttf", 40)
-    except:
-        # 기본 폰트 사용
-        font_large = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+        return _build_variant(variant, _worker_cache), None
+    except Exception as e:
+        return None, str(e)
+
+def create_feature_graphics(variants, use_cache=True, jobs=1):
+    """여러 변형을 한 번에 일괄 생성 (jobs > 1이면 병렬 워커 사용)
+
+    결과는 입력 순서대로 출력하며, 모두 성공하면 True를 반환한다.
+    """
+    args = [(variant, use_cache) for variant in variants]
+    workers = max(1, min(jobs, len(args)))
+    if workers == 1:
+        results = [_render_job(arg) for arg in args]
+    else:
+        # 워커마다 여러 항목을 묶어 넘겨 폰트 캐시 재사용률을 높임
+        chunksize = max(1, len(args) // (workers * 2))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_render_job, args, chunksize=chunksize))
+    
+    failed = 0
+    for variant, (outcome, error) in zip(variants, results):
+        if error is not None:
+            failed += 1
+            print(f"❌ 피처 그래픽 생성 실패: {variant['output']} ({error})")
+        elif outcome == 'built':
+            print(f"✅ 피처 그래픽 생성 완료: {variant['output']}")
+        else:
+            print(f"♻️  변경 없음, 캐시 사용: {variant['output']}")
+    
+    print(f"📊 피처 그래픽 {len(variants) - failed}/{len(variants)}개 생성 (워커 {workers}개)")
+    return failed == 0
+
+def render_variant(variant):
+    """변형 설정으로 피처 그래픽 렌더링"""
+    width, height = variant['size']
+    return render_feature_graphic(width, height, variant['text'], variant['subtitle'],
+                                  variant['gradient'], variant['fonts'], variant['colors'])
+
+def render_feature_graphic(width, height, text, subtitle, gradient=None, fonts=None, colors=None):
+    # 그라데이션 배경 이미지 생성
+    image = render_gradient(width, height, gradient)
+    draw = ImageDraw.Draw(image)
+    fonts = tuple(fonts or DEFAULT_FONTS)
+    colors = dict(DEFAULT_COLORS, **(colors or {}))
+    
+    # SokSol 텍스트 추가 (폰트와 측정 결과는 캐시 사용)
+    font_large = load_font(fonts, 120)
+    font_small = load_font(fonts, 40)
     
     # 메인 텍스트
-    text = "SokSol"
-    text_bbox = draw.textbbox((0, 0), text, font=font_large)
+    text_bbox = measure_text(text, fonts, 120)
     text_width = text_bbox[2] - text_bbox[0]
     text_height = text_bbox[3] - text_bbox[1]
     text_x = (width - text_width) // 2
     text_y = (height - text_height) // 2 - 50
     
     # 텍스트 그림자
-    draw.text((text_x + 3, text_y + 3), text, font=font_large, fill='#000000')
+    draw.text((text_x + 3, text_y + 3), text, font=font_large, fill=colors['shadow'])
     # 메인 텍스트
-    draw.text((text_x, text_y), text, font=font_large, fill='#ffffff')
+    draw.text((text_x, text_y), text, font=font_large, fill=colors['title'])
     
     # 부제목
-    subtitle = "실시간 AI 채팅 - 개인정보 100% 비저장"
-    subtitle_bbox = draw.textbbox((0, 0), subtitle, font=font_small)
+    subtitle_bbox = measure_text(subtitle, fonts, 40)
     subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
     subtitle_x = (width - subtitle_width) // 2
     subtitle_y = text_y + text_height + 20
     
     # 부제목 그림자
-    draw.text((subtitle_x + 2, subtitle_y + 2), subtitle, font=font_small, fill='#000000')
+    draw.text((subtitle_x + 2, subtitle_y + 2), subtitle, font=font_small, fill=colors['shadow'])
     # 부제목
-    draw.text((subtitle_x, subtitle_y), subtitle, font=font_small, fill='#e0e0e0')
+    draw.text((subtitle_x, subtitle_y), subtitle, font=font_small, fill=colors['subtitle'])
     
-    # 저장
-    os.makedirs('assets/store/graphics', exist_ok=True)
-    image.save('assets/store/graphics/feature_graphic.png', 'PNG', quality=95)
-    print("✅ 피처 그래픽 생성 완료: assets/store/graphics/feature_graphic.png")
+    return image
 
 if __name__ == "__main__":
-    create_feature_graphic()
+    parser = argparse.ArgumentParser(description="SokSol 피처 그래픽 생성")
+    parser.add_argument('--no-cache', action='store_true', help="캐시를 무시하고 항상 다시 생성")
+    parser.add_argument('--config', metavar='JSON', help="여러 변형을 일괄 생성할 설정 파일")
+    parser.add_argument('--manifest', metavar='JSON',
+                        help="다국어 매니페스트 (예: assets/store/graphics_manifest.json)")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, metavar='N',
+                        help="일괄 생성 시 워커 프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+    if args.manifest or args.config:
+        variants = load_manifest(args.manifest) if args.manifest else load_variants(args.config)
+        success = create_feature_graphics(variants, use_cache=not args.no_cache, jobs=args.jobs)
+        sys.exit(0 if success else 1)
+    else:
+        create_feature_graphic(use_cache=not args.no_cache)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+ADB 화면 캡처 유틸리티
+`adb exec-out screencap`으로 프레임버퍼를 표준 출력으로 받아 메모리에서 바로 처리
+(디바이스 저장소에 임시 파일을 쓰지 않음)
+
+SOKSOL_ADB 환경변수로 adb 실행 파일을 바꿀 수 있다 (테스트용 가짜 adb: tests/fake_adb.py).
+"""
+
+import io
+import os
+import struct
+import subprocess
+
+from PIL import Image
+
+from tracing import span
+
+ADB = os.environ.get('SOKSOL_ADB', 'adb')
+ADB_TIMEOUT = 30  # 초
+
+# screencap raw 출력의 픽셀 포맷 (android PixelFormat) → (PIL 모드, raw 모드, 픽셀당 바이트)
+RAW_PIXEL_FORMATS = {
+    1: ('RGBA', 'RGBA', 4),      # RGBA_8888
+    2: ('RGB', 'RGBX', 4),       # RGBX_8888
+    3: ('RGB', 'RGB', 3),        # RGB_888
+    4: ('RGB', 'BGR;16', 2),     # RGB_565
+    5: ('RGBA', 'BGRA', 4),      # BGRA_8888
+}
+
+
+class AdbError(RuntimeError):
+    """adb 명령 실패"""
+
+
+def adb_command(device_id, *args):
+    """디바이스를 지정한 adb 명령 목록"""
+    cmd = [ADB]
+    if device_id:
+        cmd.extend(['-s', device_id])
+    cmd.extend(args)
+    return cmd
+
+
+def run_adb(device_id, *args, timeout=ADB_TIMEOUT):
+    """adb 명령 실행 후 표준 출력 바이트 반환"""
+    try:
+        with span(f"adb {' '.join(args[:2])}", 'adb', device=device_id or '', command=' '.join(args)):
+            result = subprocess.run(adb_command(device_id, *args), capture_output=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        raise AdbError(f"adb 명령 시간 초과 ({timeout}초): {' '.join(args)}")
+    except FileNotFoundError:
+        raise AdbError(f"adb를 찾을 수 없습니다: {ADB}")
+
+    if result.returncode != 0:
+        raise AdbError(result.stderr.decode('utf-8', 'replace').strip() or f"종료 코드 {result.returncode}")
+    return result.stdout
+
+
+def capture_frame(device_id, raw=False, timeout=ADB_TIMEOUT):
+    """화면을 캡처해 바이트로 반환
+
+    raw=False이면 디바이스에서 압축한 PNG, raw=True이면 압축하지 않은
+    screencap 원본(헤더 + 픽셀)을 반환한다. raw가 디바이스 CPU 부담이 적다.
+    """
+    args = ['exec-out', 'screencap'] if raw else ['exec-out', 'screencap', '-p']
+    data = run_adb(device_id, *args, timeout=timeout)
+    if not data:
+        raise AdbError("screencap 출력이 비어 있습니다")
+    return data
+
+
+def parse_raw_screencap(data):
+    """screencap raw 출력(width, height, format[, colorspace] + 픽셀)을 PIL 이미지로 변환"""
+    if len(data) < 12:
+        raise AdbError("screencap raw 헤더가 너무 짧습니다")
+
+    width, height, pixel_format = struct.unpack_from('<III', data)
+    if pixel_format not in RAW_PIXEL_FORMATS:
+        raise AdbError(f"지원하지 않는 픽셀 포맷: {pixel_format}")
+    mode, raw_mode, bytes_per_pixel = RAW_PIXEL_FORMATS[pixel_format]
+
+    # Android 9 이상은 colorspace 필드가 추가되어 헤더가 16바이트
+    pixel_bytes = width * height * bytes_per_pixel
+    for header_size in (16, 12):
+        if len(data) - header_size >= pixel_bytes:
+            break
+    else:
+        raise AdbError(f"screencap raw 데이터 크기 불일치: {len(data)} bytes ({width}x{height})")
+
+    return Image.frombuffer(mode, (width, height), data[header_size:header_size + pixel_bytes],
+                            'raw', raw_mode, 0, 1)
+
+
+def decode_frame(data, raw=False):
+    """capture_frame() 결과를 PIL 이미지로 디코딩"""
+    if raw:
+        return parse_raw_screencap(data)
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+def screen_info(device_id, timeout=ADB_TIMEOUT):
+    """디바이스 화면 크기와 밀도 조회 → (width, height, density)"""
+    size_output = run_adb(device_id, 'shell', 'wm', 'size', timeout=timeout).decode('utf-8', 'replace')
+    density_output = run_adb(device_id, 'shell', 'wm', 'density', timeout=timeout).decode('utf-8', 'replace')
+
+    # "Override size"가 있으면 그 값이 실제 화면에 적용된 값
+    size_line = [line for line in size_output.splitlines() if 'size:' in line][-1]
+    width, height = (int(value) for value in size_line.split(':')[1].strip().split('x'))
+    density_line = [line for line in density_output.splitlines() if 'density:' in line][-1]
+    density = int(density_line.split(':')[1].strip())
+    return width, height, density
+
+
+def classify_form_factor(width, height, density):
+    """화면 크기/밀도로 폼팩터 분류 (smallest width dp 기준)
+
+    phone: sw < 600dp, foldable: sw >= 600dp이면서 정사각형에 가까운 화면,
+    tablet_7: 600~719dp, tablet_10: 720dp 이상
+    """
+    smallest_width_dp = min(width, height) * 160 / density
+    aspect = max(width, height) / min(width, height)
+    if smallest_width_dp < 600:
+        return 'phone'
+    if aspect < 1.35:
+        return 'foldable'
+    if smallest_width_dp < 720:
+        return 'tablet_7'
+    return 'tablet_10'
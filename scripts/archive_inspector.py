@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+AAB/APK 구성 분석기
+아카이브를 디스크에 풀지 않고 메모리 매핑한 중앙 디렉터리만 읽어
+카테고리별(dex, res, assets, native, JS 번들) 압축/원본 크기와 큰 항목을 집계
+
+비압축(stored)으로 저장된 큰 항목은 앞부분만 샘플 압축해 압축 가능 여부를 판단한다.
+ZIP64(4GB 이상 또는 65535개 이상 항목) 아카이브도 지원한다.
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+EOCD_SIGNATURE = b'PK\x05\x06'
+ZIP64_LOCATOR_SIGNATURE = b'PK\x06\x07'
+ZIP64_EOCD_SIGNATURE = b'PK\x06\x06'
+CENTRAL_SIGNATURE = b'PK\x01\x02'
+LOCAL_HEADER_SIZE = 30
+MAX_COMMENT = 0xFFFF
+
+STORED = 0
+DEFLATED = 8
+
+# 카테고리 이름 (보고서 표시 순서)
+CATEGORIES = ('js_bundle', 'dex', 'native', 'res', 'assets', 'manifest', 'meta', 'other')
+
+# APK 최상위 디렉터리 (AAB는 이 앞에 base/ 같은 모듈 디렉터리가 붙음)
+APK_ROOTS = {'assets', 'res', 'lib', 'META-INF', 'kotlin', 'root'}
+AAB_MODULE_ENTRIES = {'dex', 'lib', 'res', 'assets', 'manifest', 'root', 'resources.pb', 'assets.pb', 'native.pb'}
+
+# 비압축 저장이 정상인 항목 (플랫폼이 직접 mmap하도록 비압축을 요구하거나 권장)
+INTENTIONALLY_STORED = {'resources.arsc'}
+INTENTIONALLY_STORED_SUFFIXES = {'.so', '.dex'}
+# 이미 압축된 형식
+PRECOMPRESSED_SUFFIXES = {
+    '.png', '.jpg', '.jpeg', '.webp', '.gif', '.mp3', '.ogg', '.m4a', '.mp4', '.webm',
+    '.zip', '.jar', '.apk', '.gz', '.xz', '.br', '.woff', '.woff2',
+}
+
+COMPRESSIBLE_MIN_SIZE = 4 * 1024   # 이보다 작은 비압축 항목은 무시
+SAMPLE_SIZE = 64 * 1024            # 압축 가능 여부 판단에 쓰는 앞부분 크기
+COMPRESSIBLE_RATIO = 0.9           # 샘플 압축률이 이보다 낮으면 압축 가능으로 판단
+
+
+class ArchiveError(ValueError):
+    """ZIP 구조 오류"""
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    name: str
+    method: int
+    compressed_size: int
+    size: int
+    header_offset: int
+
+    @property
+    def category(self):
+        return categorize(self.name)
+
+
+def categorize(name):
+    """항목 경로로 카테고리 결정 (AAB는 모듈 디렉터리 base/ 등을 떼고 판단)"""
+    parts = name.split('/')
+    if len(parts) > 1 and parts[0] not in APK_ROOTS and parts[1] in AAB_MODULE_ENTRIES:
+        parts = parts[1:]
+    top = parts[0]
+    filename = parts[-1]
+
+    if top == 'assets' and filename.endswith(('.bundle', '.hbc', '.jsbundle')):
+        return 'js_bundle'
+    if filename.endswith('.dex') or top == 'dex':
+        return 'dex'
+    if top == 'lib':
+        return 'native'
+    if top == 'res' or filename in ('resources.arsc', 'resources.pb'):
+        return 'res'
+    if top == 'assets' or filename == 'assets.pb':
+        return 'assets'
+    if top == 'manifest' or filename == 'AndroidManifest.xml':
+        return 'manifest'
+    if top in ('META-INF', 'BUNDLE-METADATA') or filename in ('BundleConfig.pb', 'native.pb'):
+        return 'meta'
+    return 'other'
+
+
+def _find_eocd(data):
+    """End of Central Directory 레코드 위치 (파일 끝의 주석까지 포함해 역방향 검색)"""
+    start = max(0, len(data) - 22 - MAX_COMMENT)
+    position = data.rfind(EOCD_SIGNATURE, start)
+    if position < 0:
+        raise ArchiveError("ZIP 아카이브가 아닙니다 (EOCD 없음)")
+    return position
+
+
+def _central_directory(data):
+    """(항목 수, 중앙 디렉터리 크기, 중앙 디렉터리 오프셋)"""
+    eocd = _find_eocd(data)
+    _, _, _, _, count, cd_size, cd_offset, _ = struct.unpack_from('<4sHHHHIIH', data, eocd)
+
+    # ZIP64: 값이 최대치로 채워져 있으면 ZIP64 EOCD 레코드를 따라감
+    locator = eocd - 20
+    if locator >= 0 and data[locator:locator + 4] == ZIP64_LOCATOR_SIGNATURE:
+        _, _, zip64_offset, _ = struct.unpack_from('<4sIQI', data, locator)
+        if data[zip64_offset:zip64_offset + 4] != ZIP64_EOCD_SIGNATURE:
+            raise ArchiveError("ZIP64 EOCD 레코드가 손상되었습니다")
+        _, count, cd_size, cd_offset = struct.unpack_from('<QQQQ', data, zip64_offset + 24)
+    return count, cd_size, cd_offset
+
+
+def _zip64_values(extra, sizes):
+    """ZIP64 extra 필드(0x0001)에서 0xFFFFFFFF로 표시된 값 채우기
+
+    sizes: [size, compressed_size, header_offset] 순서 (ZIP 사양의 순서)
+    """
+    position = 0
+    while position + 4 <= len(extra):
+        header_id, length = struct.unpack_from('<HH', extra, position)
+        if header_id == 0x0001:
+            field_position = position + 4
+            for i, value in enumerate(sizes):
+                if value == 0xFFFFFFFF:
+                    sizes[i] = struct.unpack_from('<Q', extra, field_position)[0]
+                    field_position += 8
+            break
+        position += 4 + length
+    return sizes
+
+
+def iter_entries(data):
+    """중앙 디렉터리를 순서대로 읽어 ArchiveEntry 생성"""
+    count, cd_size, cd_offset = _central_directory(data)
+    position = cd_offset
+    end = cd_offset + cd_size
+    for _ in range(count):
+        if position + 46 > end or data[position:position + 4] != CENTRAL_SIGNATURE:
+            raise ArchiveError(f"중앙 디렉터리 항목이 손상되었습니다 (offset {position})")
+        (method, compressed_size, size, name_length, extra_length,
+         comment_length, header_offset) = struct.unpack_from('<10xH8xIIHHH8xI', data, position)
+        name_start = position + 46
+        name = bytes(data[name_start:name_start + name_length]).decode('utf-8', 'replace')
+        extra = data[name_start + name_length:name_start + name_length + extra_length]
+        size, compressed_size, header_offset = _zip64_values(extra, [size, compressed_size, header_offset])
+        position = name_start + name_length + extra_length + comment_length
+        if not name.endswith('/'):
+            yield ArchiveEntry(name, method, compressed_size, size, header_offset)
+
+
+def _data_offset(data, entry):
+    """로컬 헤더 뒤 실제 데이터 시작 위치"""
+    name_length, extra_length = struct.unpack_from('<HH', data, entry.header_offset + 26)
+    return entry.header_offset + LOCAL_HEADER_SIZE + name_length + extra_length
+
+
+def find_entry(data, *names):
+    """names 중 하나와 이름이 일치하는 항목 (앞쪽 이름 우선, 없으면 None)"""
+    found = {}
+    for entry in iter_entries(data):
+        if entry.name in names:
+            found[entry.name] = entry
+    return next((found[name] for name in names if name in found), None)
+
+
+def read_entry(data, entry):
+    """항목 하나의 내용을 메모리에서 바로 압축 해제해 반환 (디스크에 쓰지 않음)"""
+    start = _data_offset(data, entry)
+    raw = data[start:start + entry.compressed_size]
+    if entry.method == STORED:
+        return bytes(raw)
+    if entry.method == DEFLATED:
+        return zlib.decompress(raw, -15)
+    raise ArchiveError(f"지원하지 않는 압축 방식: {entry.method} ({entry.name})")
+
+
+def _sample_ratio(data, entry):
+    """비압축 항목 앞부분을 압축해 본 압축률 (1.0에 가까우면 압축 효과 없음)"""
+    start = _data_offset(data, entry)
+    sample = data[start:start + min(entry.size, SAMPLE_SIZE)]
+    if not sample:
+        return 1.0
+    return len(zlib.compress(sample, 1)) / len(sample)
+
+
+def is_compressible_candidate(entry):
+    """압축 여부를 확인할 가치가 있는 비압축 항목인지"""
+    filename = entry.name.rsplit('/', 1)[-1]
+    suffix = Path(filename).suffix.lower()
+    return (entry.method == STORED and entry.size >= COMPRESSIBLE_MIN_SIZE
+            and filename not in INTENTIONALLY_STORED
+            and suffix not in INTENTIONALLY_STORED_SUFFIXES
+            and suffix not in PRECOMPRESSED_SUFFIXES)
+
+
+@contextmanager
+def map_archive(path):
+    """아카이브 파일을 읽기 전용 mmap으로 열기 (빈 파일이면 ArchiveError)"""
+    with open(path, 'rb') as f:
+        # 길이 0인 파일은 mmap할 수 없음 (빌드가 중단되어 남은 빈 산출물 등)
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ArchiveError("빈 아카이브입니다 (손상되었거나 빌드가 중단됨)")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def inspect_archive(path, top=10):
+    """아카이브 구성 요약 (JSON으로 저장 가능한 dict)
+
+    {'path', 'kind', 'file_size', 'entry_count',
+     'categories': {카테고리: {'count', 'compressed', 'size'}},
+     'largest': [{'name', 'category', 'compressed', 'size'}],
+     'compressible': [{'name', 'size', 'estimated_saving'}]}
+    """
+    path = Path(path)
+    categories = {name: {'count': 0, 'compressed': 0, 'size': 0} for name in CATEGORIES}
+    largest = []
+    compressible = []
+    entry_count = 0
+
+    with map_archive(path) as data:
+        for entry in iter_entries(data):
+            entry_count += 1
+            totals = categories[entry.category]
+            totals['count'] += 1
+            totals['compressed'] += entry.compressed_size
+            totals['size'] += entry.size
+            # 크기 상위 top개만 유지 (전체 항목 목록을 메모리에 두지 않음)
+            item = (entry.compressed_size, entry.name, entry)
+            if len(largest) < top:
+                heapq.heappush(largest, item)
+            elif top:
+                heapq.heappushpop(largest, item)
+
+            if is_compressible_candidate(entry):
+                ratio = _sample_ratio(data, entry)
+                if ratio < COMPRESSIBLE_RATIO:
+                    compressible.append({'name': entry.name, 'size': entry.size,
+                                         'estimated_saving': int(entry.size * (1 - ratio))})
+
+    largest = [entry for _, _, entry in sorted(largest, key=lambda item: (-item[0], item[1]))]
+    return {
+        'path': str(path),
+        'kind': path.suffix.lstrip('.').lower(),
+        'file_size': path.stat().st_size,
+        'entry_count': entry_count,
+        'categories': {name: totals for name, totals in categories.items() if totals['count']},
+        'largest': [{'name': entry.name, 'category': entry.category,
+                     'compressed': entry.compressed_size, 'size': entry.size} for entry in largest],
+        'compressible': sorted(compressible, key=lambda item: -item['estimated_saving']),
+    }
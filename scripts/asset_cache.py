@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+생성 에셋 캐시
+원본 바이트 + 대상 크기 + 렌더러 버전 + 옵션의 해시를 키로 산출물을 저장하고,
+변경이 없으면 재생성 대신 캐시에서 복사해 복원
+
+캐시 항목과 출력 파일은 하드링크하지 않는다. 출력 파일을 제자리에서 수정하는 도구
+(이미지 최적화기 등)가 캐시 항목까지 바꿔 이후 복원 결과가 키와 달라지기 때문이다.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent.parent
+DEFAULT_CACHE_DIR = BASE_PATH / ".cache" / "assets"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+# produce() 결과
+HIT_SKIPPED = 'skipped'    # 출력 파일이 이미 캐시와 동일
+HIT_RESTORED = 'restored'  # 캐시에서 복원
+MISS_BUILT = 'built'       # 새로 생성 후 캐시에 저장
+
+
+def file_digest(path):
+    """파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """크기 제한이 있는 LRU 방식의 콘텐츠 주소 캐시
+
+    항목의 mtime을 마지막 사용 시각으로 사용하며, 전체 크기가 max_bytes를
+    넘으면 가장 오래 사용되지 않은 항목부터 삭제한다.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=None, enabled=True):
+        self.cache_dir = Path(cache_dir or os.environ.get('SOKSOL_CACHE_DIR') or DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_mb = os.environ.get('SOKSOL_CACHE_MAX_MB')
+            max_bytes = int(max_mb) * 1024 * 1024 if max_mb else DEFAULT_MAX_BYTES
+        self.max_bytes = max_bytes
+        self.enabled = enabled and os.environ.get('SOKSOL_NO_CACHE') != '1'
+        self.stats = {HIT_SKIPPED: 0, HIT_RESTORED: 0, MISS_BUILT: 0}
+
+    def key(self, sources, **options):
+        """캐시 키 계산
+
+        sources는 bytes 또는 파일 경로(혹은 그 목록), options는 크기/렌더러 버전 등
+        결과에 영향을 주는 모든 값이다.
+        """
+        if isinstance(sources, (bytes, str, Path)):
+            sources = [sources]
+
+        digest = hashlib.sha256()
+        for source in sources:
+            if isinstance(source, bytes):
+                digest.update(hashlib.sha256(source).digest())
+            else:
+                digest.update(bytes.fromhex(file_digest(source)))
+        digest.update(json.dumps(options, sort_keys=True, default=str).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_path(self, key, suffix):
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def produce(self, key, output_path, build):
+        """캐시를 거쳐 산출물 생성
+
+        build(temp_path)는 캐시 미스일 때만 호출되며, 출력 파일 대신 임시 경로에
+        결과를 써야 한다. 완성된 파일만 출력 경로로 교체하기 위함이다.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # 같은 출력을 여러 스레드/프로세스가 만들 수 있으므로 임시 이름은 작업마다 다르게
+        # (렌더러가 형식을 확장자로 판단하므로 확장자는 유지)
+        temp_path = output_path.with_name(
+            f".{output_path.stem}.{os.getpid()}.{threading.get_ident()}.partial{output_path.suffix}")
+
+        try:
+            return self._produce(key, output_path, temp_path, build)
+        finally:
+            # 실패 시 남은 임시 파일 정리
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def _produce(self, key, output_path, temp_path, build):
+        if not self.enabled:
+            build(temp_path)
+            os.replace(temp_path, output_path)
+            self.stats[MISS_BUILT] += 1
+            return MISS_BUILT
+
+        entry = self._entry_path(key, output_path.suffix)
+        if entry.exists():
+            os.utime(entry)  # LRU 갱신
+            if output_path.exists() and self._same_content(entry, output_path):
+                self.stats[HIT_SKIPPED] += 1
+                return HIT_SKIPPED
+            shutil.copyfile(entry, temp_path)
+            os.replace(temp_path, output_path)
+            self.stats[HIT_RESTORED] += 1
+            return HIT_RESTORED
+
+        build(temp_path)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        entry_temp = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.copyfile(temp_path, entry_temp)
+        os.replace(entry_temp, entry)
+        os.replace(temp_path, output_path)
+        self.stats[MISS_BUILT] += 1
+        self.evict()
+        return MISS_BUILT
+
+    def _same_content(self, entry, output_path):
+        if entry.stat().st_size != output_path.stat().st_size:
+            return False
+        return file_digest(entry) == file_digest(output_path)
+
+    def evict(self):
+        """전체 크기가 제한을 넘으면 오래 사용되지 않은 항목부터 삭제"""
+        if not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*"):
+            if path.suffix == '.tmp':
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                # 다른 워커가 이미 삭제한 항목
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def summary(self):
+        """캐시 사용 결과 요약 문자열"""
+        if not self.enabled:
+            return "캐시 비활성화"
+        return (f"캐시: 재사용 {self.stats[HIT_SKIPPED]}개, 복원 {self.stats[HIT_RESTORED]}개, "
+                f"새로 생성 {self.stats[MISS_BUILT]}개")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+스토어/앱 에셋 규격 정의
+아이콘 변환 스크립트와 QA 검증 스크립트가 공유하는 크기 테이블
+"""
+
+# Android 런처 아이콘 밀도별 크기 (px)
+ANDROID_ICON_SIZES = {
+    'mipmap-mdpi': 48,
+    'mipmap-hdpi': 72,
+    'mipmap-xhdpi': 96,
+    'mipmap-xxhdpi': 144,
+    'mipmap-xxxhdpi': 192,
+}
+
+# Play Store 고해상도 아이콘 크기 (px)
+STORE_ICON_SIZE = 512
+STORE_ICON_MAX_BYTES = 1024 * 1024
+
+# Play Store 피처 그래픽 크기 (px, 가로 x 세로)
+FEATURE_GRAPHIC_SIZE = (1024, 500)
+FEATURE_GRAPHIC_MAX_BYTES = 15 * 1024 * 1024
+
+# Play Store 스크린샷 규칙 (기기 유형별 개수, 한 변 길이, 긴 변/짧은 변 비율)
+SCREENSHOT_COUNT = (2, 8)
+SCREENSHOT_SIDE = (320, 3840)
+SCREENSHOT_MAX_ASPECT = 2.0
+
+# Play Store 스크린샷 정규화 대상 크기 (세로 기준, px)
+SCREENSHOT_TARGETS = {
+    'phone': (1080, 1920),
+    'tablet_7': (1200, 1920),
+    'tablet_10': (1600, 2560),
+}
+
+# 폼팩터별 Play Store 정규화 대상 (폴더블은 7인치 태블릿 규격 사용)
+# 모든 디바이스 촬영은 screenshots/<폼팩터>/<디바이스>/ 아래에 저장된다
+FORM_FACTOR_TARGETS = {
+    'phone': 'phone',
+    'foldable': 'tablet_7',
+    'tablet_7': 'tablet_7',
+    'tablet_10': 'tablet_10',
+}
+
+# 리소스 밀도 한정자별 배율 (mdpi = 1.0 기준)
+DENSITY_SCALES = {
+    'ldpi': 0.75,
+    'mdpi': 1.0,
+    'hdpi': 1.5,
+    'xhdpi': 2.0,
+    'xxhdpi': 3.0,
+    'xxxhdpi': 4.0,
+}
+
+# res/ 이미지 하나의 최대 파일 크기 (이보다 크면 WebP 변환/최적화 권장)
+MAX_RESOURCE_IMAGE_BYTES = 512 * 1024
+
+# Play Console 그래픽 에셋 업로드 최대 크기 (스크린샷 기준 8MB)
+MAX_STORE_IMAGE_BYTES = 8 * 1024 * 1024
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+컴파일된 AndroidManifest.xml 읽기
+빌드 산출물에 실제로 포함된(라이브러리 매니페스트가 병합된) 매니페스트를
+aapt2/bundletool 없이 아카이브에서 바로 읽어 ElementTree 요소로 변환
+
+- AAB: base/manifest/AndroidManifest.xml (aapt2 protobuf XmlNode)
+- APK: AndroidManifest.xml (바이너리 AXML, ResXMLTree)
+"""
+
+import struct
+import zlib
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from archive_inspector import ArchiveError, find_entry, map_archive, read_entry
+from project_model import ManifestInfo, manifest_from_element
+
+AAB_MANIFEST = 'base/manifest/AndroidManifest.xml'
+APK_MANIFEST = 'AndroidManifest.xml'
+
+
+class ManifestFormatError(ValueError):
+    """컴파일된 매니페스트 구조 오류"""
+
+
+# --- protobuf (aapt2 Resources.proto의 XmlNode) ---
+
+def _varint(data, position):
+    result = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ManifestFormatError("protobuf varint가 잘렸습니다")
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def _fields(data):
+    """protobuf 메시지의 (필드 번호, 값) 목록 (길이 구분 필드는 bytes)"""
+    position = 0
+    while position < len(data):
+        key, position = _varint(data, position)
+        number, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            value, position = _varint(data, position)
+        elif wire_type == 1:
+            value = struct.unpack_from('<Q', data, position)[0]
+            position += 8
+        elif wire_type == 2:
+            length, position = _varint(data, position)
+            value = data[position:position + length]
+            position += length
+        elif wire_type == 5:
+            value = struct.unpack_from('<I', data, position)[0]
+            position += 4
+        else:
+            raise ManifestFormatError(f"지원하지 않는 protobuf wire type: {wire_type}")
+        yield number, value
+
+
+def _proto_primitive(item):
+    """Item.prim(7) → 문자열 (boolean_value=8, int_decimal_value=6)"""
+    for number, value in _fields(item):
+        if number == 7:
+            for prim_number, prim_value in _fields(value):
+                if prim_number == 8:
+                    return 'true' if prim_value else 'false'
+                if prim_number == 6:
+                    return str(prim_value)
+    return None
+
+
+def _proto_element(data):
+    """XmlElement → ET.Element (namespace_uri=2, name=3, attribute=4, child=5)"""
+    namespace = ''
+    name = ''
+    attributes = {}
+    children = []
+    for number, value in _fields(data):
+        if number == 2:
+            namespace = value.decode('utf-8')
+        elif number == 3:
+            name = value.decode('utf-8')
+        elif number == 4:
+            # XmlAttribute: namespace_uri=1, name=2, value=3, compiled_item=6
+            attr_namespace = attr_name = attr_value = ''
+            compiled = None
+            for attr_number, attr_field in _fields(value):
+                if attr_number == 1:
+                    attr_namespace = attr_field.decode('utf-8')
+                elif attr_number == 2:
+                    attr_name = attr_field.decode('utf-8')
+                elif attr_number == 3:
+                    attr_value = attr_field.decode('utf-8')
+                elif attr_number == 6:
+                    compiled = attr_field
+            if not attr_value and compiled is not None:
+                attr_value = _proto_primitive(compiled) or ''
+            key = f"{{{attr_namespace}}}{attr_name}" if attr_namespace else attr_name
+            attributes[key] = attr_value
+        elif number == 5:
+            child = _proto_node(value)
+            if child is not None:
+                children.append(child)
+
+    element = ET.Element(f"{{{namespace}}}{name}" if namespace else name, attributes)
+    element.extend(children)
+    return element
+
+
+def _proto_node(data):
+    """XmlNode (element=1, text=2) → ET.Element (텍스트 노드는 None)"""
+    for number, value in _fields(data):
+        if number == 1:
+            return _proto_element(value)
+    return None
+
+
+def parse_proto_manifest(data):
+    """AAB의 protobuf 매니페스트 바이트 → <manifest> 요소"""
+    root = _proto_node(bytes(data))
+    if root is None:
+        raise ManifestFormatError("protobuf 매니페스트에 루트 요소가 없습니다")
+    return root
+
+
+# --- 바이너리 AXML (APK) ---
+
+RES_STRING_POOL_TYPE = 0x0001
+RES_XML_TYPE = 0x0003
+RES_XML_RESOURCE_MAP_TYPE = 0x0180
+RES_XML_START_ELEMENT_TYPE = 0x0102
+RES_XML_END_ELEMENT_TYPE = 0x0103
+UTF8_FLAG = 0x100
+NO_INDEX = 0xFFFFFFFF
+
+TYPE_REFERENCE = 0x01
+TYPE_STRING = 0x03
+TYPE_INT_DEC = 0x10
+TYPE_INT_BOOLEAN = 0x12
+
+# 이름 문자열이 제거된 경우를 위한 android 속성 리소스 ID
+ANDROID_ATTRIBUTE_IDS = {
+    0x01010003: 'name',
+    0x01010280: 'allowBackup',
+    0x0101000f: 'debuggable',
+    0x01010271: 'maxSdkVersion',
+    0x010104ec: 'usesCleartextTraffic',
+}
+
+
+def _string_pool(data, offset):
+    header_size, = struct.unpack_from('<H', data, offset + 2)
+    count, _, flags, strings_start, _ = struct.unpack_from('<IIIII', data, offset + 8)
+    offsets = struct.unpack_from(f'<{count}I', data, offset + header_size)
+    utf8 = flags & UTF8_FLAG
+    strings = []
+    for string_offset in offsets:
+        position = offset + strings_start + string_offset
+        if utf8:
+            # UTF-16 길이, UTF-8 바이트 길이 순서 (각각 1~2바이트)
+            for _ in range(2):
+                length = data[position]
+                position += 1
+                if length & 0x80:
+                    length = ((length & 0x7F) << 8) | data[position]
+                    position += 1
+            strings.append(bytes(data[position:position + length]).decode('utf-8', 'replace'))
+        else:
+            length, = struct.unpack_from('<H', data, position)
+            position += 2
+            if length & 0x8000:
+                low, = struct.unpack_from('<H', data, position)
+                length = ((length & 0x7FFF) << 16) | low
+                position += 2
+            strings.append(bytes(data[position:position + length * 2]).decode('utf-16-le', 'replace'))
+    return strings
+
+
+def _axml_value(strings, raw_index, data_type, value):
+    if raw_index != NO_INDEX:
+        return strings[raw_index]
+    if data_type == TYPE_INT_BOOLEAN:
+        return 'true' if value else 'false'
+    if data_type == TYPE_STRING:
+        return strings[value]
+    if data_type == TYPE_INT_DEC:
+        return str(struct.unpack('<i', struct.pack('<I', value))[0])
+    if data_type == TYPE_REFERENCE:
+        return f"@0x{value:08x}"
+    return str(value)
+
+
+def parse_binary_manifest(data):
+    """APK의 바이너리 AXML 매니페스트 바이트 → <manifest> 요소"""
+    data = bytes(data)
+    chunk_type, header_size, total = struct.unpack_from('<HHI', data, 0)
+    if chunk_type != RES_XML_TYPE:
+        raise ManifestFormatError("바이너리 XML이 아닙니다")
+
+    strings = []
+    resource_ids = []
+    stack = []
+    root = None
+    position = header_size
+    while position + 8 <= min(total, len(data)):
+        chunk_type, chunk_header, chunk_size = struct.unpack_from('<HHI', data, position)
+        if chunk_size < 8:
+            raise ManifestFormatError(f"잘못된 청크 크기 (offset {position})")
+
+        if chunk_type == RES_STRING_POOL_TYPE:
+            strings = _string_pool(data, position)
+        elif chunk_type == RES_XML_RESOURCE_MAP_TYPE:
+            count = (chunk_size - chunk_header) // 4
+            resource_ids = struct.unpack_from(f'<{count}I', data, position + chunk_header)
+        elif chunk_type == RES_XML_START_ELEMENT_TYPE:
+            ext = position + chunk_header
+            ns_index, name_index, attr_start, attr_size, attr_count = struct.unpack_from('<IIHHH', data, ext)
+            attributes = {}
+            for i in range(attr_count):
+                attr = ext + attr_start + i * attr_size
+                attr_ns, attr_name, raw_index = struct.unpack_from('<III', data, attr)
+                data_type, value = struct.unpack_from('<xBI', data, attr + 14)
+                name = strings[attr_name] if attr_name != NO_INDEX else ''
+                if not name and attr_name < len(resource_ids):
+                    name = ANDROID_ATTRIBUTE_IDS.get(resource_ids[attr_name], '')
+                namespace = strings[attr_ns] if attr_ns != NO_INDEX else ''
+                key = f"{{{namespace}}}{name}" if namespace else name
+                attributes[key] = _axml_value(strings, raw_index, data_type, value)
+            tag = strings[name_index]
+            if ns_index != NO_INDEX:
+                tag = f"{{{strings[ns_index]}}}{tag}"
+            element = ET.Element(tag, attributes)
+            if stack:
+                stack[-1].append(element)
+            else:
+                root = element
+            stack.append(element)
+        elif chunk_type == RES_XML_END_ELEMENT_TYPE and stack:
+            stack.pop()
+        position += chunk_size
+
+    if root is None:
+        raise ManifestFormatError("바이너리 매니페스트에 루트 요소가 없습니다")
+    return root
+
+
+def read_compiled_manifest(archive_path):
+    """AAB/APK 안의 매니페스트를 읽어 ManifestInfo로 반환
+
+    매니페스트가 없거나 형식이 잘못되었으면 parse_error가 채워진 ManifestInfo를 반환한다.
+    """
+    archive_path = Path(archive_path)
+    try:
+        with map_archive(archive_path) as data:
+            entry = find_entry(data, AAB_MANIFEST, APK_MANIFEST)
+            if entry is None:
+                return ManifestInfo(archive_path, True, parse_error="매니페스트 항목이 없습니다")
+            content = read_entry(data, entry)
+            if entry.name == AAB_MANIFEST:
+                root = parse_proto_manifest(content)
+            else:
+                root = parse_binary_manifest(content)
+    except (ArchiveError, ManifestFormatError, OSError, struct.error, IndexError, zlib.error) as e:
+        return ManifestInfo(archive_path, True, parse_error=str(e))
+    return manifest_from_element(archive_path, root)
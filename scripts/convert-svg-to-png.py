@@ -6,43 +6,43 @@ SVG to PNG 변환 스크립트
 
 import os
 import sys
-import subprocess
+import argparse
 from pathlib import Path
 
-def check_dependencies():
-    """필요한 도구들이 설치되었는지 확인"""
-    dependencies = {
-        'inkscape': 'Inkscape (벡터 그래픽 편집기)',
-        'convert': 'ImageMagick (이미지 변환 도구)'
-    }
-    
-    available = {}
-    for cmd, desc in dependencies.items():
-        try:
-            result = subprocess.run([cmd, '--version'], 
-                                  capture_output=True, text=True)
-            available[cmd] = result.returncode == 0
-        except FileNotFoundError:
-            available[cmd] = False
-    
-    return available
+from asset_specs import ANDROID_ICON_SIZES, STORE_ICON_SIZE
+from script_runner import ScriptResult
+from svg_raster import (
+    BACKENDS, DEFAULT_SHARPEN, PyramidRasterizer, available_backends, create_rasterizer,
+    measure_pyramid_error, render_cached, resolve_backend, run_render_jobs,
+)
+from toolchain import detect_toolchain
+from tracing import session
+
+def check_dependencies(toolchain=None):
+    """사용 가능한 SVG 렌더링 백엔드 확인"""
+    installed = available_backends(toolchain)
+    return {backend: backend in installed for backend in BACKENDS}
 
 def install_guide():
     """설치 가이드 출력"""
     print("🔧 필요한 도구 설치 가이드:")
-    print("\n1. Inkscape 설치:")
+    print("\n1. cairosvg 설치 (권장, 프로세스 내부 렌더링):")
+    print("   - pip install cairosvg")
+    print("   - Windows는 GTK/Cairo 런타임 필요: https://github.com/tschoonj/GTK-for-Windows-Runtime-Environment-Installer")
+    
+    print("\n2. 또는 Inkscape 설치 (대체 백엔드):")
     print("   - Windows: https://inkscape.org/release/")
     print("   - 또는 winget install Inkscape.Inkscape")
     
-    print("\n2. ImageMagick 설치:")
-    print("   - Windows: https://imagemagick.org/script/download.php#windows")
-    print("   - 또는 winget install ImageMagick.ImageMagick")
-    
-    print("\n3. 설치 후 환경변수 PATH에 추가되었는지 확인")
+    print("\n3. Inkscape 사용 시 환경변수 PATH에 추가되었는지 확인")
     print("   - 새 터미널에서 'inkscape --version' 실행 가능해야 함")
 
-def convert_svg_to_png(svg_path, output_path, size):
-    """SVG를 PNG로 변환"""
+def convert_svg_to_png(svg_path, output_path, size, rasterizer=None, cache=None):
+    """SVG를 PNG로 변환
+
+    rasterizer를 넘기면 이미 파싱된 문서를 재사용한다.
+    cache를 넘기면 원본/크기/렌더러가 같은 산출물은 다시 렌더링하지 않는다.
+    """
     svg_path = Path(svg_path)
     output_path = Path(output_path)
     
@@ -53,67 +53,105 @@ def convert_svg_to_png(svg_path, output_path, size):
     # 출력 디렉토리 생성
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Inkscape를 사용한 변환 (더 좋은 품질)
     try:
-        cmd = [
-            'inkscape',
-            '--export-type=png',
-            f'--export-width={size}',
-            f'--export-height={size}',
-            f'--export-filename={output_path}',
-            str(svg_path)
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
+        if rasterizer is None:
+            rasterizer = create_rasterizer(svg_path)
+        outcome = render_cached(rasterizer, svg_path, output_path, size, cache)
+        if outcome == 'built':
             print(f"✅ 변환 완료: {output_path} ({size}x{size})")
-            return True
         else:
-            print(f"❌ Inkscape 변환 실패: {result.stderr}")
-            return False
-            
-    except FileNotFoundError:
-        print("❌ Inkscape가 설치되지 않았습니다.")
+            print(f"♻️  캐시 사용: {output_path} ({size}x{size})")
+        return True
+    except Exception as e:
+        print(f"❌ 변환 실패: {e}")
         return False
 
-def convert_app_icons():
-    """앱 아이콘 변환"""
+def print_pyramid_report(pyramid, sizes):
+    """피라미드 축소와 벡터 직접 렌더링의 크기별 픽셀 오차 출력"""
+    print("\n📐 피라미드 오차 (벡터 직접 렌더링 대비, 0-255):")
+    print("   크기     RMSE    최대 오차")
+    for row in measure_pyramid_error(pyramid, sizes):
+        print(f"   {row['size']:>4}px  {row['rmse']:6.2f}  {row['max_error']:>6}")
+
+def build_icon_jobs(base_path):
+    """렌더링 작업 목록 (출력 경로, 크기) 생성"""
+    android_base = base_path / "mobile" / "soksol_mobile" / "SokSol" / "android" / "app" / "src" / "main" / "res"
+    
+    jobs = []
+    for folder, size in ANDROID_ICON_SIZES.items():
+        jobs.append((android_base / folder / "ic_launcher.png", size))
+        # Round 아이콘도 생성
+        jobs.append((android_base / folder / "ic_launcher_round.png", size))
+    
+    # 512x512 피처 그래픽도 생성
+    jobs.append((base_path / "assets" / "store" / "graphics" / "feature_graphic.png", STORE_ICON_SIZE))
+    return jobs
+
+def convert_app_icons(backend='auto', pyramid=False, sharpen=DEFAULT_SHARPEN, pyramid_report=False,
+                      use_cache=True, jobs=None, toolchain=None):
+    """앱 아이콘 변환
+
+    pyramid가 True이면 512px 마스터를 한 번만 렌더링하고
+    밀도별 아이콘은 Lanczos 축소(+선택적 샤프닝)로 이 프로세스에서 생성한다.
+    pyramid_report는 피라미드 결과와 직접 렌더링을 비교하므로 pyramid를 켠다.
+    jobs는 동시에 실행할 워커 프로세스 수이다 (기본: CPU 코어 수, 피라미드 모드에서는 무시).
+    toolchain은 백엔드 선택에 사용할 도구 확인 결과이다 (toolchain.detect_toolchain).
+    """
+    pyramid = pyramid or pyramid_report
     base_path = Path(__file__).parent.parent
     svg_path = base_path / "assets" / "store" / "icons" / "soksol_icon.svg"
     
-    # Android 아이콘 크기와 경로
-    android_icons = {
-        'mipmap-mdpi': 48,
-        'mipmap-hdpi': 72,
-        'mipmap-xhdpi': 96,
-        'mipmap-xxhdpi': 144,
-        'mipmap-xxxhdpi': 192,
-    }
+    if not svg_path.exists():
+        print(f"❌ SVG 파일을 찾을 수 없습니다: {svg_path}")
+        return False
     
-    android_base = base_path / "mobile" / "soksol_mobile" / "SokSol" / "android" / "app" / "src" / "main" / "res"
+    icon_jobs = build_icon_jobs(base_path)
+    # 피라미드는 마스터 한 번 + 축소이므로 워커마다 마스터를 렌더링하지 않도록 이 프로세스에서 실행
+    workers = 1 if pyramid else max(1, min(jobs or os.cpu_count() or 1, len(icon_jobs)))
     
-    success_count = 0
-    total_count = len(android_icons)
+    # 백엔드 확인 (렌더러는 이 프로세스에서 렌더링할 때만 만들고, 워커 풀은 워커마다 생성)
+    try:
+        backend = resolve_backend(backend, toolchain)
+        rasterizer = None
+        if workers == 1:
+            rasterizer = create_rasterizer(svg_path, backend, toolchain)
+            if pyramid:
+                rasterizer = PyramidRasterizer(rasterizer, STORE_ICON_SIZE, sharpen)
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ {e}")
+        return False
     
-    print("📱 Android 앱 아이콘 변환 중...")
+    if rasterizer is not None:
+        print(f"🖌️  렌더링 백엔드: {rasterizer.name} ({rasterizer.version})")
+    else:
+        print(f"🖌️  렌더링 백엔드: {backend}")
+    print(f"⚙️  작업 {len(icon_jobs)}개, 워커 {workers}개")
+    print("📱 Android 앱 아이콘 및 피처 그래픽 변환 중...")
     
-    for folder, size in android_icons.items():
-        output_path = android_base / folder / "ic_launcher.png"
-        if convert_svg_to_png(svg_path, output_path, size):
-            success_count += 1
-        
-        # Round 아이콘도 생성
-        output_path_round = android_base / folder / "ic_launcher_round.png"
-        if convert_svg_to_png(svg_path, output_path_round, size):
-            pass  # 이미 카운트됨
+    results = run_render_jobs(svg_path, icon_jobs, backend, pyramid, sharpen,
+                              use_cache, workers, rasterizer, toolchain)
     
-    # 512x512 피처 그래픽도 생성
-    feature_graphic_path = base_path / "assets" / "store" / "graphics" / "feature_graphic.png"
-    print("\n🎨 피처 그래픽 생성 중...")
-    if convert_svg_to_png(svg_path, feature_graphic_path, 512):
-        print("✅ 피처 그래픽 생성 완료")
+    # 결과는 작업 목록 순서대로 출력
+    success_count = 0
+    total_count = len(icon_jobs)
+    outcomes = {'built': 0, 'restored': 0, 'skipped': 0}
+    for (output_path, size), (outcome, error) in zip(icon_jobs, results):
+        if error is not None:
+            print(f"❌ 변환 실패: {output_path} ({error})")
+            continue
+        success_count += 1
+        outcomes[outcome] += 1
+        if outcome == 'built':
+            print(f"✅ 변환 완료: {output_path} ({size}x{size})")
+        else:
+            print(f"♻️  캐시 사용: {output_path} ({size}x{size})")
+    
+    if pyramid_report:
+        print_pyramid_report(rasterizer, sorted(set(ANDROID_ICON_SIZES.values()), reverse=True))
     
     print(f"\n📊 변환 결과: {success_count}/{total_count} 성공")
+    if use_cache:
+        print(f"♻️  캐시: 재사용 {outcomes['skipped']}개, 복원 {outcomes['restored']}개, 새로 생성 {outcomes['built']}개")
     
     if success_count == total_count:
         print("🎉 모든 아이콘 변환이 완료되었습니다!")
@@ -122,36 +160,71 @@ def convert_app_icons():
         print("⚠️  일부 아이콘 변환에 실패했습니다.")
         return False
 
-def main():
-    """메인 함수"""
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="SokSol SVG to PNG 변환 도구")
+    parser.add_argument('--backend', choices=('auto',) + BACKENDS, default='auto',
+                        help="렌더링 백엔드 (기본: auto - cairosvg 우선, 없으면 inkscape)")
+    parser.add_argument('--pyramid', action='store_true',
+                        help=f"{STORE_ICON_SIZE}px 마스터를 한 번 렌더링하고 작은 아이콘은 Lanczos 축소로 생성")
+    parser.add_argument('--sharpen', type=int, default=DEFAULT_SHARPEN, metavar='PERCENT',
+                        help=f"피라미드 축소 후 언샤프 마스크 강도 (0: 비활성, 기본: {DEFAULT_SHARPEN})")
+    parser.add_argument('--pyramid-report', action='store_true',
+                        help="피라미드 축소 결과와 벡터 직접 렌더링의 크기별 픽셀 오차 출력 (--pyramid 포함)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="에셋 캐시를 사용하지 않고 모든 아이콘을 다시 렌더링")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, metavar='N',
+                        help="동시에 실행할 워커 프로세스 수 (기본: CPU 코어 수)")
+    return parser.parse_args(argv)
+
+def run(argv=None):
+    """프로그램에서 호출하는 진입점 (master-prep, playstore-prep 등)
+
+    ScriptResult를 반환하며 data에 사용한 백엔드 설정과 생성한 아이콘 경로가 들어간다.
+    """
+    args = parse_args(argv)
+    
     print("🎨 SokSol SVG to PNG 변환 도구")
     print("=" * 40)
     
-    # 의존성 확인
-    deps = check_dependencies()
-    missing_deps = [cmd for cmd, available in deps.items() if not available]
+    # 의존성 확인 (저장된 도구 확인 결과가 유효하면 --version을 실행하지 않음)
+    toolchain = detect_toolchain()
+    deps = check_dependencies(toolchain)
+    if args.backend == 'auto':
+        usable = any(deps.values())
+    else:
+        usable = deps[args.backend]
     
-    if missing_deps:
-        print("❌ 필요한 도구가 설치되지 않았습니다:")
-        for dep in missing_deps:
-            print(f"   - {dep}")
+    if not usable:
+        print("❌ 사용 가능한 렌더링 백엔드가 없습니다:")
+        for dep, available in deps.items():
+            icon = "✅" if available else "❌"
+            print(f"   {icon} {dep}")
         print()
         install_guide()
-        return 1
+        return ScriptResult("convert-svg-to-png.py", False, 1, {'backend': args.backend, 'dependencies': deps})
     
-    print("✅ 모든 필요한 도구가 설치되어 있습니다.")
+    print("✅ 렌더링 백엔드가 준비되어 있습니다.")
     print()
     
     # 아이콘 변환 실행
-    if convert_app_icons():
+    if convert_app_icons(args.backend, args.pyramid, args.sharpen, args.pyramid_report,
+                         not args.no_cache, args.jobs, toolchain):
         print("\n🚀 다음 단계:")
         print("1. mobile/soksol_mobile/SokSol 프로젝트를 Android Studio에서 열기")
         print("2. 빌드하여 아이콘이 제대로 적용되었는지 확인")
         print("3. Release APK/AAB 생성")
-        return 0
+        outputs = [str(path) for path, _ in build_icon_jobs(Path(__file__).parent.parent)]
+        return ScriptResult("convert-svg-to-png.py", True, 0,
+                            {'backend': args.backend, 'dependencies': deps, 'outputs': outputs})
     else:
         print("\n❌ 변환 과정에서 오류가 발생했습니다.")
-        return 1
+        return ScriptResult("convert-svg-to-png.py", False, 1, {'backend': args.backend, 'dependencies': deps})
+
+def main(argv=None):
+    """메인 함수"""
+    with session('convert-svg-to-png'):
+        return run(argv).exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
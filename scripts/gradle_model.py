@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+Gradle 빌드 파일 파서
+Groovy(build.gradle)와 Kotlin DSL(build.gradle.kts)을 토큰 단위로 한 번만 훑어
+블록(android.defaultConfig, android.buildTypes.release, android.signingConfigs.release,
+android.productFlavors.* 등)별 속성 인덱스를 만든다.
+
+- DSL 차이 정규화: isMinifyEnabled → minifyEnabled, getByName("release") { } → release 블록,
+  compileSdkVersion/targetSdkVersion → compileSdk/targetSdk
+- `def`/`val` 변수, 루트 프로젝트 ext 블록, gradle.properties 값으로 참조를 해석
+  (project.property("X"), findProperty("X"), X.toInteger() 포함)
+- gradle.properties 값은 문자열이므로 정수 설정(versionCode, SDK 수준)에 대입되면 int로 변환
+- settings.gradle(.kts)의 include 목록으로 멀티 모듈 프로젝트 전체를 색인
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+
+TOKEN_RE = re.compile(r'''
+    (?P<newline>\n)
+  | (?P<space>[ \t\r\f]+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"""(?:\\.|[^\\])*?"""|\'\'\'(?:\\.|[^\\])*?\'\'\'|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+  | (?P<number>\d[\d_]*(?:\.\d+)?[A-Za-z]?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<op>->|==|!=|&&|\|\||\?\.|.)
+''', re.VERBOSE | re.DOTALL)
+
+# 이름을 문자열 인자로 받아 블록을 만드는 Kotlin DSL/Groovy 메서드
+NAMED_BLOCK_CALLS = {'getByName', 'create', 'named', 'register', 'maybeCreate'}
+
+# 같은 설정의 다른 이름 → 정규화된 이름
+PROPERTY_ALIASES = {
+    'compileSdkVersion': 'compileSdk',
+    'minSdkVersion': 'minSdk',
+    'targetSdkVersion': 'targetSdk',
+}
+
+# 참조 해석 시 떼어내는 접두어 (rootProject.ext.x, project.extra["x"] 등)
+REFERENCE_PREFIXES = ('rootProject', 'project', 'ext', 'extra')
+
+# 속성 이름을 문자열 인자로 받는 조회 메서드 (project.property("VERSION_CODE"))
+PROPERTY_LOOKUP_CALLS = {'property', 'findProperty'}
+# 값을 바꾸지 않는 것으로 보는 변환 호출 (VERSION_CODE.toInteger(), x.toString())
+CONVERSION_CALLS = {'toInteger', 'toInt', 'toString', 'toLong'}
+
+# 정수 값이어야 하는 설정 (정규화된 이름)
+INTEGER_PROPERTIES = {'versionCode', 'minSdk', 'targetSdk', 'compileSdk', 'maxSdk'}
+
+# 문장이 다음 줄로 이어지는 끝 토큰
+CONTINUATION_OPS = {',', '=', '+', '-', '*', '.', '?.', '(', '[', '&&', '||', ':', '?'}
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str
+    text: str
+    line: int
+
+
+@dataclass(frozen=True)
+class Ref:
+    """해석하지 못한 참조나 식 (원문 그대로 보관)"""
+    expression: str
+
+    def __str__(self):
+        return self.expression
+
+
+@dataclass(frozen=True)
+class GradleBlock:
+    path: str
+    line: int
+    properties: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def name(self):
+        return self.path.rsplit('.', 1)[-1]
+
+
+@dataclass(frozen=True)
+class GradleBuildFile:
+    """빌드 파일 하나의 블록 인덱스"""
+    path: Path
+    exists: bool
+    dsl: str = 'groovy'
+    blocks: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))  # 경로 → GradleBlock
+    variables: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    plugins: tuple = ()
+
+    def block(self, path):
+        """블록 조회 (경로 끝부분 일치 허용: 'defaultConfig' → 'android.defaultConfig')"""
+        if path in self.blocks:
+            return self.blocks[path]
+        suffix = '.' + path
+        for block_path, block in self.blocks.items():
+            if block_path.endswith(suffix):
+                return block
+        return None
+
+    def children(self, path):
+        """블록 바로 아래 하위 블록 이름 목록 (예: children('buildTypes') → ('debug', 'release'))"""
+        parent = self.block(path)
+        if parent is None:
+            return ()
+        prefix = parent.path + '.'
+        return tuple(block.name for block_path, block in self.blocks.items()
+                     if block_path.startswith(prefix) and '.' not in block_path[len(prefix):])
+
+    def get(self, path, name, default=None):
+        """블록 속성 값 (해석된 str/int/float/bool 또는 Ref)"""
+        block = self.block(path)
+        if block is None:
+            return default
+        return block.properties.get(PROPERTY_ALIASES.get(name, name), default)
+
+
+@dataclass(frozen=True)
+class GradleProject:
+    """멀티 모듈 Gradle 프로젝트 (루트 빌드 파일 + 모듈별 빌드 파일)"""
+    root: Path
+    root_file: GradleBuildFile
+    modules: MappingProxyType  # ':app' → GradleBuildFile
+    extra: MappingProxyType     # 루트 ext 블록 + gradle.properties
+
+    @property
+    def application_modules(self):
+        """com.android.application 플러그인을 적용한 모듈 이름 목록"""
+        return tuple(name for name, build_file in self.modules.items()
+                     if 'com.android.application' in build_file.plugins)
+
+    @property
+    def app(self):
+        """앱 모듈 빌드 파일 (없으면 존재하지 않는 :app 항목)"""
+        names = self.application_modules
+        if names:
+            return self.modules[names[0]]
+        if ':app' in self.modules:
+            return self.modules[':app']
+        return GradleBuildFile(self.root / "app" / "build.gradle", False)
+
+
+def tokenize(text):
+    """공백/주석을 제외한 토큰 목록 (줄바꿈은 문장 경계로 남김)"""
+    tokens = []
+    line = 1
+    for match in TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        value = match.group()
+        if kind not in ('space', 'comment'):
+            if kind == 'string':
+                quote = 3 if value[:3] in ('"""', "'''") else 1
+                value = value[quote:-quote]
+            tokens.append(Token(kind, value, line))
+        line += value.count('\n') if kind != 'string' else match.group().count('\n')
+    return tokens
+
+
+def _literal(token):
+    if token.kind == 'string':
+        return token.text
+    if token.kind == 'number':
+        digits = token.text.rstrip('LlFfDd').replace('_', '')
+        try:
+            return float(digits) if '.' in digits else int(digits)
+        except ValueError:
+            return Ref(token.text)
+    if token.kind == 'ident' and token.text in ('true', 'false'):
+        return token.text == 'true'
+    return None
+
+
+def _reference_chain(tokens):
+    """a.b.c 또는 a.extra["c"] 형태면 ['a', 'b', 'c'], 아니면 None"""
+    chain = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.kind == 'ident' and (not chain or tokens[i - 1].text in ('.', '?.')):
+            chain.append(token.text)
+        elif token.text in ('.', '?.') and chain:
+            pass
+        elif (token.text == '[' and chain and i + 2 < len(tokens)
+              and tokens[i + 1].kind == 'string' and tokens[i + 2].text == ']'):
+            chain.append(tokens[i + 1].text)
+            i += 2
+        else:
+            return None
+        i += 1
+    return chain or None
+
+
+def _source(tokens):
+    """토큰 목록을 읽기 쉬운 식 문자열로 복원"""
+    text = ''
+    for i, token in enumerate(tokens):
+        value = f'"{token.text}"' if token.kind == 'string' else token.text
+        if i and not ((token.kind == 'op' and token.text in ('.', '?.', '(', ')', '[', ']', ','))
+                      or (tokens[i - 1].kind == 'op' and tokens[i - 1].text in ('.', '?.', '(', '['))):
+            text += ' '
+        text += value
+    return text
+
+
+def _wrapped(tokens):
+    """토큰 전체가 짝이 맞는 괄호 하나로 감싸져 있으면 True ((a).b() 같은 식은 False)"""
+    if len(tokens) < 2 or tokens[0].text != '(' or tokens[-1].text != ')':
+        return False
+    depth = 0
+    for i, token in enumerate(tokens):
+        if token.text == '(':
+            depth += 1
+        elif token.text == ')':
+            depth -= 1
+            if depth == 0:
+                return i == len(tokens) - 1
+    return False
+
+
+def _cast_start(tokens):
+    """끝에 붙은 캐스트(as Int, as String?, as? kotlin.String)의 시작 위치 (없으면 None)"""
+    for i in range(len(tokens) - 2, 0, -1):
+        token = tokens[i]
+        if token.kind == 'ident' and token.text == 'as':
+            tail = tokens[i + 1:]
+            if any(t.kind == 'ident' for t in tail) and all(t.kind == 'ident' or t.text in ('.', '?')
+                                                             for t in tail):
+                return i
+            return None
+        if not (token.kind == 'ident' or token.text in ('.', '?')):
+            return None
+    return None
+
+
+def _strip_conversions(tokens):
+    """캐스트(x as Int), 감싼 괄호, 변환 호출(.toInt())을 떼고 참조 식만 남김
+
+    (project.property("X") as String).toInt() → project.property("X")
+    """
+    while True:
+        cast = _cast_start(tokens)
+        if cast is not None:
+            tokens = tokens[:cast]
+        elif _wrapped(tokens):
+            tokens = tokens[1:-1]
+        elif (len(tokens) >= 5 and tokens[-4].text in ('.', '?.') and tokens[-3].text in CONVERSION_CALLS
+              and tokens[-2].text == '(' and tokens[-1].text == ')'):
+            tokens = tokens[:-4]
+        else:
+            return tokens
+
+
+def signing_config_name(value):
+    """signingConfig 값에서 서명 설정 이름 추출 (signingConfigs.release / getByName("release"))"""
+    match = re.search(r'signingConfigs\.(?:getByName\("([^"]+)"\)|(\w+))', str(value))
+    if match:
+        return match.group(1) or match.group(2)
+    return None
+
+
+def _normalize_name(name):
+    # Kotlin DSL의 boolean 속성: isMinifyEnabled → minifyEnabled
+    if len(name) > 2 and name.startswith('is') and name[2].isupper():
+        name = name[2].lower() + name[3:]
+    return PROPERTY_ALIASES.get(name, name)
+
+
+class _Parser:
+    def __init__(self, tokens, extra):
+        self.tokens = tokens
+        self.extra = extra
+        self.variables = {}
+        self.blocks = {}
+        self.plugins = []
+        self.stack = []
+
+    def resolve(self, tokens):
+        """값 토큰을 Python 값으로 변환 (변수/ext/gradle.properties 참조 해석)"""
+        # 캐스트/변환 호출은 떼고 참조만 해석 (정수 변환은 statement에서)
+        tokens = _strip_conversions(tokens)
+        if not tokens:
+            return None
+        if len(tokens) == 1:
+            value = _literal(tokens[0])
+            if value is not None:
+                return value
+        # project.property("X") / findProperty("X") / rootProject.property("X")
+        if (len(tokens) >= 4 and tokens[-4].text in PROPERTY_LOOKUP_CALLS and tokens[-3].text == '('
+                and tokens[-2].kind == 'string' and tokens[-1].text == ')'
+                and all(token.text in REFERENCE_PREFIXES + ('.', '?.') for token in tokens[:-4])):
+            name = tokens[-2].text
+            if name in self.extra:
+                return self.extra[name]
+            return Ref(_source(tokens))
+
+        chain = _reference_chain(tokens)
+        if chain:
+            name = chain[-1]
+            while len(chain) > 1 and chain[0] in REFERENCE_PREFIXES:
+                chain = chain[1:]
+            key = '.'.join(chain)
+            if key in self.variables:
+                return self.variables[key]
+            if key in self.extra:
+                return self.extra[key]
+            if len(chain) == 1 and name in self.extra:
+                return self.extra[name]
+        return Ref(_source(tokens))
+
+    def block_name(self, header):
+        """블록 여는 문장에서 블록 경로 조각 목록 추출"""
+        chain = []
+        for i, token in enumerate(header):
+            if token.kind == 'ident' and (i == 0 or header[i - 1].text == '.'):
+                chain.append(token.text)
+            elif token.text == '.':
+                continue
+            else:
+                # getByName("release") { / create("staging") {
+                if (token.text == '(' and chain and chain[-1] in NAMED_BLOCK_CALLS
+                        and i + 1 < len(header) and header[i + 1].kind == 'string'):
+                    chain[-1] = header[i + 1].text
+                break
+        return chain or ['{}']
+
+    def statement(self, tokens):
+        """블록 안의 문장 하나를 속성/변수로 기록"""
+        if not tokens or tokens[0].kind != 'ident':
+            return
+        current = self.blocks[self.path()] if self.stack else None
+
+        # apply plugin: "com.android.application"
+        if tokens[0].text == 'apply' and len(tokens) >= 4 and tokens[1].text == 'plugin':
+            self.plugins.append(tokens[3].text)
+            return
+        # plugins { id("com.android.application") } / id 'com.android.application'
+        if self.stack and self.stack[-1] == 'plugins' and tokens[0].text == 'id':
+            strings = [token.text for token in tokens if token.kind == 'string']
+            if strings:
+                self.plugins.append(strings[0])
+            return
+
+        is_variable = tokens[0].text in ('def', 'val', 'var')
+        if is_variable:
+            tokens = tokens[1:]
+        # 이름: 선두 식별자 체인 (ext.foo = 1 → 'ext.foo')
+        end = 1
+        while end + 1 < len(tokens) and tokens[end].text == '.' and tokens[end + 1].kind == 'ident':
+            end += 2
+        if not tokens or tokens[0].kind != 'ident':
+            return
+        name = '.'.join(token.text for token in tokens[:end:2])
+        rest = tokens[end:]
+        if (name in ('ext', 'extra') and len(rest) >= 3 and rest[0].text == '['
+                and rest[1].kind == 'string' and rest[2].text == ']'):
+            # Kotlin DSL: extra["minSdk"] = 24
+            name = f"ext.{rest[1].text}"
+            rest = rest[3:]
+        if rest and rest[0].text == ':':
+            # Kotlin 타입 표기 (val x: Boolean = true)
+            rest = rest[2:] if len(rest) > 1 else []
+        if len(rest) >= 2 and rest[0].text == 'by' and rest[1].text in ('extra', 'ext'):
+            # Kotlin DSL: val targetSdk by extra(35)
+            self.variables[f"ext.{name}"] = self.resolve(rest[2:])
+            rest = rest[2:]
+        if len(rest) >= 2 and rest[0].kind == 'op' and rest[0].text in ('+', '-') and rest[1].text == '=':
+            rest = rest[2:]
+        if rest and rest[0].text == '=':
+            rest = rest[1:]
+        elif rest and rest[0].text == '(' and rest[-1].text != ')':
+            return
+        value = self.resolve(rest)
+        if value is None:
+            return
+
+        if is_variable or not self.stack:
+            self.variables[name] = value
+            if not is_variable and name.startswith('ext.'):
+                self.variables[name[4:]] = value
+        if current is not None and not is_variable:
+            # ext 블록 이름은 참조 키이므로 정규화하지 않음
+            key = name if self.stack[-1] in ('ext', 'extra') else _normalize_name(name)
+            if key in INTEGER_PROPERTIES and isinstance(value, str) and value.strip().isdigit():
+                # gradle.properties에서 온 문자열 ("12") → 12
+                value = int(value)
+            current.properties[key] = value
+
+    def path(self):
+        return '.'.join(self.stack)
+
+    def parse(self):
+        statement = []
+        depth = 0       # 괄호 깊이 (괄호 안의 줄바꿈은 문장 경계가 아님)
+        opened = []     # 블록마다 push한 경로 조각 수
+        for token in self.tokens:
+            text = token.text
+            if token.kind == 'newline' or (token.kind == 'op' and text == ';'):
+                if depth == 0 and not (statement and statement[-1].kind == 'op'
+                                       and statement[-1].text in CONTINUATION_OPS):
+                    self.statement(statement)
+                    statement = []
+                continue
+            if token.kind == 'op' and text == '{':
+                parts = self.block_name(statement)
+                for part in parts:
+                    self.stack.append(part)
+                    self.blocks.setdefault(self.path(), _MutableBlock(self.path(), token.line))
+                opened.append(len(parts))
+                statement = []
+                depth = 0
+                continue
+            if token.kind == 'op' and text == '}':
+                self.statement(statement)
+                statement = []
+                for _ in range(opened.pop() if opened else 0):
+                    self.stack.pop()
+                continue
+            if token.kind == 'op' and text in '([':
+                depth += 1
+            elif token.kind == 'op' and text in ')]':
+                depth = max(0, depth - 1)
+            statement.append(token)
+        self.statement(statement)
+
+
+class _MutableBlock:
+    def __init__(self, path, line):
+        self.path = path
+        self.line = line
+        self.properties = {}
+
+    def freeze(self):
+        return GradleBlock(self.path, self.line, MappingProxyType(dict(self.properties)))
+
+
+def parse_build_file(path, extra=None):
+    """빌드 파일 하나를 파싱해 블록 인덱스 생성"""
+    path = Path(path)
+    if not path.is_file():
+        return GradleBuildFile(path, False)
+
+    parser = _Parser(tokenize(path.read_text(encoding='utf-8')), dict(extra or {}))
+    parser.parse()
+    blocks = {block_path: block.freeze() for block_path, block in parser.blocks.items()}
+    return GradleBuildFile(
+        path=path,
+        exists=True,
+        dsl='kts' if path.suffix == '.kts' else 'groovy',
+        blocks=MappingProxyType(blocks),
+        variables=MappingProxyType(parser.variables),
+        plugins=tuple(parser.plugins),
+    )
+
+
+def find_build_file(directory, name='build.gradle'):
+    """Groovy/Kotlin DSL 중 존재하는 빌드 파일 경로 (둘 다 없으면 Groovy 경로)"""
+    directory = Path(directory)
+    for candidate in (directory / name, directory / f"{name}.kts"):
+        if candidate.is_file():
+            return candidate
+    return directory / name
+
+
+def load_gradle_properties(path):
+    """gradle.properties (key=value) 읽기"""
+    properties = {}
+    path = Path(path)
+    if path.is_file():
+        for line in path.read_text(encoding='utf-8').splitlines():
+            line = line.strip()
+            if line and not line.startswith(('#', '!')) and '=' in line:
+                key, value = line.split('=', 1)
+                properties[key.strip()] = value.strip()
+    return properties
+
+
+def included_modules(settings_path):
+    """settings.gradle(.kts)의 include 목록 (':app', ':feature:chat' 등)"""
+    settings_path = Path(settings_path)
+    if not settings_path.is_file():
+        return []
+
+    modules = []
+    tokens = tokenize(settings_path.read_text(encoding='utf-8'))
+    in_include = False
+    for token in tokens:
+        if token.kind == 'ident' and token.text == 'include':
+            in_include = True
+        elif token.kind == 'newline' or (token.kind == 'op' and token.text in (';', '}')):
+            in_include = False
+        elif in_include and token.kind == 'string':
+            modules.append(token.text if token.text.startswith(':') else f":{token.text}")
+    return modules
+
+
+def scan_project(root):
+    """Gradle 프로젝트 전체 색인 (settings에 include된 모듈, 없으면 하위 디렉터리 검색)"""
+    root = Path(root)
+    gradle_properties = load_gradle_properties(root / "gradle.properties")
+    root_file = parse_build_file(find_build_file(root), gradle_properties)
+
+    # 루트 ext 블록 값은 모든 모듈에서 rootProject.ext.x로 참조 가능
+    extra = dict(gradle_properties)
+    for block in root_file.blocks.values():
+        if block.name in ('ext', 'extra'):
+            extra.update(block.properties)
+    extra.update({name[4:]: value for name, value in root_file.variables.items() if name.startswith('ext.')})
+
+    names = included_modules(find_build_file(root, 'settings.gradle'))
+    if not names:
+        names = sorted(f":{path.parent.name}" for path in root.glob("*/build.gradle*"))
+
+    modules = {}
+    for name in names:
+        directory = root.joinpath(*name.strip(':').split(':'))
+        modules[name] = parse_build_file(find_build_file(directory), extra)
+    return GradleProject(root, root_file, MappingProxyType(modules), MappingProxyType(extra))
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+이미지 헤더 판독기
+픽셀을 디코딩하지 않고 파일 앞부분의 헤더만 읽어 형식, 크기, 비트 깊이, 색상 형식,
+알파 채널 여부를 확인 (PIL 불필요)
+
+- PNG: IHDR (팔레트 이미지의 알파는 IDAT 앞 tRNS 청크 유무로 판단)
+- JPEG: SOF 마커 (마커 길이만 따라가며 건너뜀)
+- WebP: VP8X / VP8 / VP8L
+"""
+
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+JPEG_SIGNATURE = b'\xff\xd8'
+HEADER_SIZE = 64
+
+# PNG IHDR color type → 색상 형식
+PNG_COLOR_TYPES = {0: 'gray', 2: 'rgb', 3: 'palette', 4: 'gray_alpha', 6: 'rgba'}
+# JPEG 구성 요소 수 → 색상 형식
+JPEG_COLOR_TYPES = {1: 'gray', 3: 'rgb', 4: 'cmyk'}
+# SOF 마커 (DHT=C4, JPG=C8, DAC=CC 제외)
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+IMAGE_SUFFIXES = {'.png', '.jpg', '.jpeg', '.webp'}
+
+
+class ImageHeaderError(ValueError):
+    """이미지 헤더 구조 오류"""
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    path: Path
+    format: str = ''          # 'png', 'jpeg', 'webp' (판독 실패 시 '')
+    width: int = 0
+    height: int = 0
+    bit_depth: int = 0        # 채널당 비트 수
+    color_type: str = ''      # 'rgb', 'rgba', 'palette', 'gray', ...
+    has_alpha: bool = False
+    file_size: int = 0
+    error: str = None
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+
+def sniff(header):
+    """파일 앞부분 바이트로 이미지 형식 판별 (알 수 없으면 None)"""
+    if header.startswith(PNG_SIGNATURE):
+        return 'png'
+    if header.startswith(JPEG_SIGNATURE):
+        return 'jpeg'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def _read_png(f, header):
+    if header[12:16] != b'IHDR':
+        raise ImageHeaderError("PNG IHDR 청크가 없습니다")
+    width, height, bit_depth, color_code = struct.unpack_from('>IIBB', header, 16)
+    if color_code not in PNG_COLOR_TYPES:
+        raise ImageHeaderError(f"알 수 없는 PNG color type: {color_code}")
+    color_type = PNG_COLOR_TYPES[color_code]
+    has_alpha = color_type in ('rgba', 'gray_alpha')
+
+    if not has_alpha:
+        # IHDR 이후 청크 헤더만 따라가며 IDAT 전의 tRNS 확인 (청크 데이터는 읽지 않음)
+        position = 8 + 8 + 13 + 4
+        while True:
+            f.seek(position)
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                break
+            length, kind = struct.unpack('>I4s', chunk)
+            if kind == b'tRNS':
+                has_alpha = True
+                break
+            if kind in (b'IDAT', b'IEND'):
+                break
+            position += 12 + length
+    return {'format': 'png', 'width': width, 'height': height, 'bit_depth': bit_depth,
+            'color_type': color_type, 'has_alpha': has_alpha}
+
+
+def _read_jpeg(f):
+    position = 2
+    while True:
+        f.seek(position)
+        marker = f.read(4)
+        if len(marker) < 4:
+            raise ImageHeaderError("JPEG SOF 마커를 찾지 못했습니다")
+        if marker[0] != 0xFF:
+            raise ImageHeaderError(f"잘못된 JPEG 마커 (offset {position})")
+        code = marker[1]
+        if code == 0xFF:
+            # 채움 바이트
+            position += 1
+            continue
+        if code == 0x01 or 0xD0 <= code <= 0xD7:
+            position += 2
+            continue
+        if code in (0xD9, 0xDA):
+            raise ImageHeaderError("JPEG SOF 마커 전에 이미지 데이터가 시작됩니다")
+        length, = struct.unpack_from('>H', marker, 2)
+        if code in JPEG_SOF_MARKERS:
+            frame = f.read(6)
+            if len(frame) < 6:
+                raise ImageHeaderError("JPEG SOF 세그먼트가 잘렸습니다")
+            precision, height, width, components = struct.unpack('>BHHB', frame)
+            return {'format': 'jpeg', 'width': width, 'height': height, 'bit_depth': precision,
+                    'color_type': JPEG_COLOR_TYPES.get(components, f"{components}ch"), 'has_alpha': False}
+        position += 2 + length
+
+
+def _read_webp(header):
+    chunk = header[12:16]
+    if chunk == b'VP8X':
+        flags = header[20]
+        width = int.from_bytes(header[24:27], 'little') + 1
+        height = int.from_bytes(header[27:30], 'little') + 1
+        has_alpha = bool(flags & 0x10)
+    elif chunk == b'VP8L':
+        if header[20] != 0x2F:
+            raise ImageHeaderError("WebP VP8L 시그니처가 잘못되었습니다")
+        bits, = struct.unpack_from('<I', header, 21)
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        has_alpha = bool(bits >> 28 & 1)
+    elif chunk == b'VP8 ':
+        if header[23:26] != b'\x9d\x01\x2a':
+            raise ImageHeaderError("WebP VP8 시작 코드가 잘못되었습니다")
+        width, height = struct.unpack_from('<HH', header, 26)
+        width &= 0x3FFF
+        height &= 0x3FFF
+        has_alpha = False
+    else:
+        raise ImageHeaderError(f"알 수 없는 WebP 청크: {chunk!r}")
+    return {'format': 'webp', 'width': width, 'height': height, 'bit_depth': 8,
+            'color_type': 'rgba' if has_alpha else 'rgb', 'has_alpha': has_alpha}
+
+
+def read_image_info(f, path, file_size):
+    """열린 파일(처음 위치)에서 이미지 헤더 판독 (파일 하나를 여러 용도로 읽을 때 사용)"""
+    try:
+        header = f.read(HEADER_SIZE)
+        kind = sniff(header)
+        if kind == 'png':
+            fields = _read_png(f, header)
+        elif kind == 'jpeg':
+            fields = _read_jpeg(f)
+        elif kind == 'webp':
+            fields = _read_webp(header)
+        else:
+            return ImageInfo(path, file_size=file_size, error="지원하지 않는 이미지 형식")
+    except (ImageHeaderError, struct.error, IndexError) as e:
+        return ImageInfo(path, file_size=file_size, error=str(e) or "헤더가 잘렸습니다")
+    return ImageInfo(path, file_size=file_size, **fields)
+
+
+def read_image_header(path):
+    """이미지 헤더 판독 (실패하면 error가 채워진 ImageInfo)"""
+    path = Path(path)
+    try:
+        with open(path, 'rb') as f:
+            return read_image_info(f, path, os.fstat(f.fileno()).st_size)
+    except OSError as e:
+        return ImageInfo(path, error=str(e))
+
+
+def iter_image_files(root, folder_prefixes=None):
+    """root 아래 이미지 파일 경로를 os.scandir로 순회
+
+    folder_prefixes를 주면 root 바로 아래에서 이름이 그 접두사로 시작하는 폴더만 순회한다
+    (예: ('mipmap', 'drawable')). 주지 않으면 모든 하위 폴더를 순회한다.
+    """
+    stack = [(Path(root), folder_prefixes)]
+    while stack:
+        directory, prefixes = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in sorted(entries, key=lambda item: item.name):
+            if entry.is_dir(follow_symlinks=False):
+                if prefixes is None or entry.name.startswith(tuple(prefixes)):
+                    subdirectories.append((Path(entry.path), None))
+            elif os.path.splitext(entry.name)[1].lower() in IMAGE_SUFFIXES:
+                yield Path(entry.path)
+        # 이름 순서대로 방문하도록 역순으로 쌓음
+        stack.extend(reversed(subdirectories))
+
+
+def read_image_headers(paths, jobs=None):
+    """여러 이미지의 헤더를 스레드 풀에서 동시에 판독 (입력 순서대로 반환)"""
+    paths = list(paths)
+    if not paths:
+        return []
+    workers = max(1, min(jobs or (os.cpu_count() or 1) * 4, len(paths), 32))
+    if workers == 1:
+        return [read_image_header(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(read_image_header, paths))
@@ -6,15 +6,67 @@ SokSol Play Store 제출 준비 마스터 스크립트
 
 import os
 import sys
+import json
+import argparse
 import subprocess
-import time
+import threading
 from pathlib import Path
-from datetime import datetime
+
+from project_model import refresh_project
+from script_runner import run_command, run_in_process, run_subprocess
+from step_scheduler import Step, StepScheduler
+from tracing import session
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent / "headless_config.json"
+
+# 단계 이름 (--skip, skip_steps에 사용)
+STEP_NAMES = ('environment_check', 'project_validation', 'icon_generation', 'screenshot_guide',
+              'build_app', 'qa_validation', 'final_preparation')
+BUILD_CHOICES = ('bundle', 'apk', 'both', 'skip')
+SCREENSHOT_CHOICES = ('auto', 'skip')
+
+DEFAULT_CONFIG = {
+    'on_failure': 'abort',          # 단계 실패 시 'abort'(중단) 또는 'continue'(계속)
+    'build_type': 'bundle',         # 'bundle', 'apk', 'both', 'skip'
+    'screenshots': 'skip',          # 'auto'(시나리오 파일로 자동 촬영) 또는 'skip'(이미 준비됨)
+    'skip_steps': [],               # 건너뛸 단계 이름
+    'timeouts': {
+        'build': 1800,              # 빌드 스크립트 시간 제한 (초)
+        'script': 600,              # 격리 실행 스크립트 시간 제한 (초)
+    },
+}
+
+
+def load_config(path=DEFAULT_CONFIG_PATH):
+    """헤드리스 설정 파일 로드 (없으면 기본값, 잘못된 값은 ValueError)"""
+    config = dict(DEFAULT_CONFIG, timeouts=dict(DEFAULT_CONFIG['timeouts']))
+    path = Path(path)
+    if path.exists():
+        loaded = json.loads(path.read_text(encoding='utf-8'))
+        config['timeouts'].update(loaded.pop('timeouts', {}))
+        config.update(loaded)
+    
+    choices = {'on_failure': ('abort', 'continue'), 'build_type': BUILD_CHOICES, 'screenshots': SCREENSHOT_CHOICES}
+    for key, allowed in choices.items():
+        if config[key] not in allowed:
+            raise ValueError(f"{key} 값이 잘못되었습니다: {config[key]} (사용 가능: {', '.join(allowed)})")
+    unknown = [name for name in config['skip_steps'] if name not in STEP_NAMES]
+    if unknown:
+        raise ValueError(f"알 수 없는 단계: {', '.join(unknown)} (사용 가능: {', '.join(STEP_NAMES)})")
+    return config
 
 class PlayStoreMaster:
-    def __init__(self):
+    def __init__(self, isolated=False, headless=False, config=None):
         self.base_path = Path(__file__).parent.parent
         self.scripts_path = self.base_path / "scripts"
+        # headless이면 입력을 기다리지 않고 config의 정책대로 답함 (CI용)
+        self.headless = headless
+        self.config = config or load_config()
+        # True이면 스크립트를 별도 인터프리터에서 실행 (기본: 같은 프로세스에서 실행)
+        self.isolated = isolated
+        self.script_results = []  # 실행한 스크립트의 script_runner.ScriptResult
+        # 동시에 실행되는 단계들의 질문이 섞이지 않도록 입력은 한 번에 하나씩
+        self._prompt_lock = threading.RLock()
         
     def print_header(self, title):
         """헤더 출력"""
@@ -28,50 +80,70 @@ class PlayStoreMaster:
         print("-" * 40)
     
     def run_script(self, script_name, args=None):
-        """스크립트 실행"""
+        """스크립트 실행 (성공 여부 반환, 구조화된 결과는 script_results에 기록)
+
+        기본은 스크립트를 모듈로 불러와 같은 프로세스에서 실행하므로 프로젝트 스냅샷과
+        캐시를 공유한다. isolated이면 별도 Python 인터프리터에서 실행한다.
+        """
         script_path = self.scripts_path / script_name
         if not script_path.exists():
             print(f"❌ 스크립트를 찾을 수 없습니다: {script_path}")
             return False
         
-        cmd = [sys.executable, str(script_path)]
-        if args:
-            cmd.extend(args)
-        
         try:
-            result = subprocess.run(cmd, cwd=self.base_path)
-            return result.returncode == 0
+            if self.isolated:
+                result = run_subprocess(script_path, args, cwd=self.base_path,
+                                        timeout=self.config['timeouts']['script'])
+            else:
+                result = run_in_process(script_path, args)
         except Exception as e:
             print(f"❌ 스크립트 실행 실패: {e}")
             return False
+        
+        self.script_results.append(result)
+        return result.success
     
-    def interactive_choice(self, question, options):
-        """대화형 선택"""
-        print(f"\n❓ {question}")
-        for i, option in enumerate(options, 1):
-            print(f"   {i}. {option}")
-        
-        while True:
-            try:
-                choice = input("선택하세요 (번호 입력): ").strip()
-                if choice.isdigit():
-                    idx = int(choice) - 1
-                    if 0 <= idx < len(options):
-                        return idx
-                print("올바른 번호를 입력하세요.")
-            except KeyboardInterrupt:
-                print("\n🛑 작업이 중단되었습니다.")
-                sys.exit(1)
+    def interactive_choice(self, question, options, headless_choice=None):
+        """대화형 선택 (headless이면 headless_choice를 바로 반환)"""
+        with self._prompt_lock:
+            if self.headless:
+                print(f"\n❓ {question} → {options[headless_choice]} (headless)")
+                return headless_choice
+            
+            print(f"\n❓ {question}")
+            for i, option in enumerate(options, 1):
+                print(f"   {i}. {option}")
+            
+            while True:
+                try:
+                    choice = input("선택하세요 (번호 입력): ").strip()
+                    if choice.isdigit():
+                        idx = int(choice) - 1
+                        if 0 <= idx < len(options):
+                            return idx
+                    print("올바른 번호를 입력하세요.")
+                except KeyboardInterrupt:
+                    print("\n🛑 작업이 중단되었습니다.")
+                    sys.exit(1)
     
-    def confirm_action(self, message):
-        """작업 확인"""
-        while True:
-            response = input(f"\n❓ {message} (y/n): ").strip().lower()
-            if response in ['y', 'yes', 'ㅇ']:
-                return True
-            elif response in ['n', 'no', 'ㄴ']:
-                return False
-            print("y 또는 n을 입력하세요.")
+    def confirm_action(self, message, headless_answer=None):
+        """작업 확인
+
+        headless이면 headless_answer를 바로 반환한다. 생략하면 실패 정책(on_failure)을 따른다.
+        """
+        with self._prompt_lock:
+            if self.headless:
+                answer = self.config['on_failure'] == 'continue' if headless_answer is None else headless_answer
+                print(f"\n❓ {message} → {'y' if answer else 'n'} (headless)")
+                return answer
+            
+            while True:
+                response = input(f"\n❓ {message} (y/n): ").strip().lower()
+                if response in ['y', 'yes', 'ㅇ']:
+                    return True
+                elif response in ['n', 'no', 'ㄴ']:
+                    return False
+                print("y 또는 n을 입력하세요.")
     
     def step_environment_check(self):
         """1단계: 환경 확인"""
@@ -84,7 +156,7 @@ class PlayStoreMaster:
             print("\n❌ 환경 확인 실패!")
             print("필요한 도구들을 설치하고 다시 실행하세요.")
             
-            if self.confirm_action("계속 진행하시겠습니까? (일부 기능이 제한될 수 있습니다)"):
+            if self.confirm_action("계속 진행하시겠습니까? (일부 기능이 제한될 수 있습니다)", headless_answer=False):
                 return True
             return False
         
@@ -100,7 +172,7 @@ class PlayStoreMaster:
         
         if not success:
             print("\n❌ 프로젝트 검증 실패!")
-            if not self.confirm_action("계속 진행하시겠습니까?"):
+            if not self.confirm_action("계속 진행하시겠습니까?", headless_answer=False):
                 return False
         
         print("✅ 프로젝트 검증 완료!")
@@ -114,6 +186,8 @@ class PlayStoreMaster:
         
         # 아이콘 변환 시도
         success = self.run_script("convert-svg-to-png.py")
+        # 아이콘/스토어 그래픽이 바뀌었으므로 이후 단계는 스냅샷을 다시 읽음
+        refresh_project()
         
         if not success:
             print("\n⚠️ 자동 아이콘 변환 실패!")
@@ -132,7 +206,7 @@ class PlayStoreMaster:
             print("   - 192x192 (xxxhdpi)")
             print("4. mobile/soksol_mobile/SokSol/android/app/src/main/res/mipmap-*/ic_launcher.png 로 저장")
             
-            if not self.confirm_action("수동으로 아이콘을 변환했습니까?"):
+            if not self.confirm_action("수동으로 아이콘을 변환했습니까?", headless_answer=False):
                 print("❌ 아이콘 변환이 필요합니다.")
                 return False
         
@@ -149,12 +223,15 @@ class PlayStoreMaster:
                 "자동 촬영 도구 사용 (Android 디바이스 연결 필요)",
                 "수동 촬영 (가이드 제공)",
                 "이미 준비됨 (스킵)"
-            ]
+            ],
+            headless_choice={'auto': 0, 'skip': 2}[self.config['screenshots']],
         )
         
         if choice == 0:  # 자동 촬영
             print("자동 스크린샷 촬영을 시작합니다...")
-            success = self.run_script("screenshot-automation.py")
+            # headless이면 시나리오 파일로 입력 없이 촬영
+            success = self.run_script("screenshot-automation.py", ["--auto"] if self.headless else None)
+            refresh_project()
             
             if not success:
                 print("❌ 자동 촬영 실패. 수동 촬영을 진행하세요.")
@@ -172,7 +249,7 @@ class PlayStoreMaster:
             print("3. 스크린샷을 assets/store/screenshots/ 폴더에 저장")
             print("4. 해상도: 1080x1920 권장")
             
-            if not self.confirm_action("스크린샷 촬영을 완료했습니까?"):
+            if not self.confirm_action("스크린샷 촬영을 완료했습니까?", headless_answer=False):
                 print("❌ 스크린샷이 필요합니다.")
                 return False
         
@@ -190,7 +267,8 @@ class PlayStoreMaster:
                 "APK만 빌드 (테스트용)",
                 "AAB와 APK 모두 빌드",
                 "이미 빌드됨 (스킵)"
-            ]
+            ],
+            headless_choice=BUILD_CHOICES.index(self.config['build_type']),
         )
         
         if choice == 3:  # 스킵
@@ -212,11 +290,15 @@ class PlayStoreMaster:
             else:
                 cmd = ["bash", str(script_path), build_type]
             
-            result = subprocess.run(cmd, cwd=self.base_path)
-            success = result.returncode == 0
+            timeout = self.config['timeouts']['build']
+            success = run_command(cmd, timeout, cwd=self.base_path) == 0
+        except subprocess.TimeoutExpired:
+            print(f"❌ 빌드 시간 초과 ({timeout}초): 빌드 프로세스를 종료했습니다.")
+            success = False
         except Exception as e:
             print(f"❌ 빌드 스크립트 실행 실패: {e}")
             success = False
+        refresh_project()
         
         if not success:
             print("\n❌ 빌드 실패!")
@@ -225,7 +307,7 @@ class PlayStoreMaster:
             print("2. Build > Generate Signed Bundle/APK 선택")
             print("3. AAB 형태로 빌드")
             
-            if not self.confirm_action("수동으로 빌드를 완료했습니까?"):
+            if not self.confirm_action("수동으로 빌드를 완료했습니까?", headless_answer=False):
                 print("❌ 빌드가 필요합니다.")
                 return False
         
@@ -243,7 +325,7 @@ class PlayStoreMaster:
             print("\n⚠️ QA 검증에서 문제가 발견되었습니다.")
             print("QA_REPORT.md 파일을 확인하고 문제를 수정하세요.")
             
-            if not self.confirm_action("문제를 확인했고 계속 진행하시겠습니까?"):
+            if not self.confirm_action("문제를 확인했고 계속 진행하시겠습니까?", headless_answer=False):
                 return False
         
         print("✅ QA 검증 완료!")
@@ -275,6 +357,27 @@ class PlayStoreMaster:
         print("\n🚀 Play Store 제출 준비가 완료되었습니다!")
         return True
     
+    def skipped_step(self, number, name):
+        """설정으로 건너뛰는 단계 (의존하는 단계는 그대로 진행)"""
+        def skip():
+            print(f"\n⏭️ 단계 {number}/7: {name} 건너뜀 (설정)")
+            return True
+        return skip
+    
+    def print_schedule_summary(self, scheduler):
+        """단계별 시작/종료 시각과 임계 경로 출력"""
+        print("\n⏱️ 단계별 실행 시간 (시작 기준)")
+        for result in scheduler.ordered_results():
+            icon = "✅" if result.success else "❌"
+            print(f"   {icon} {result.name:<20} {result.started:7.1f}s → {result.finished:7.1f}s "
+                  f"({result.duration:.1f}s)")
+        
+        path = scheduler.critical_path()
+        if path:
+            total = sum(result.duration for result in scheduler.results.values())
+            print(f"🧭 임계 경로: {' → '.join(f'{result.name}({result.duration:.1f}s)' for result in path)}")
+            print(f"   전체 {scheduler.elapsed:.1f}s / 단계 합계 {total:.1f}s")
+    
     def run_full_preparation(self):
         """전체 준비 과정 실행"""
         self.print_header("SokSol Play Store 제출 준비")
@@ -282,39 +385,52 @@ class PlayStoreMaster:
         print("이 도구는 SokSol 앱의 Play Store 제출을 준비합니다.")
         print("7단계로 구성되어 있으며, 각 단계별로 안내를 제공합니다.")
         
-        if not self.confirm_action("준비를 시작하시겠습니까?"):
+        if not self.confirm_action("준비를 시작하시겠습니까?", headless_answer=True):
             print("🛑 작업이 취소되었습니다.")
             return False
         
+        # 서로 독립인 단계는 동시에 실행 (실제 입력/출력 관계만 의존성으로 둠)
+        # 빌드는 생성된 아이콘을 패키징하고, QA는 아이콘/스크린샷/빌드 산출물을 검사함
         steps = [
-            self.step_environment_check,
-            self.step_project_validation,
-            self.step_icon_generation,
-            self.step_screenshot_guide,
-            self.step_build_app,
-            self.step_qa_validation,
-            self.step_final_preparation,
+            Step("environment_check", self.step_environment_check),
+            Step("project_validation", self.step_project_validation),
+            Step("icon_generation", self.step_icon_generation),
+            Step("screenshot_guide", self.step_screenshot_guide),
+            Step("build_app", self.step_build_app, depends=("icon_generation",)),
+            Step("qa_validation", self.step_qa_validation,
+                 depends=("icon_generation", "screenshot_guide", "build_app")),
+            Step("final_preparation", self.step_final_preparation, depends=("qa_validation",)),
         ]
+        numbers = {step.name: i for i, step in enumerate(steps, 1)}
+        skipped = set(self.config['skip_steps'])
+        steps = [Step(step.name, self.skipped_step(numbers[step.name], step.name), step.depends)
+                 if step.name in skipped else step for step in steps]
+        if not self.headless:
+            # 대화형 모드에서는 단계마다 입력을 받을 수 있으므로(스크린샷 촬영은 input()을 직접 호출)
+            # 선언 순서대로 하나씩 실행해 프롬프트가 섞이지 않게 함
+            steps = [Step(step.name, step.func, step.depends + (steps[i - 1].name,) if i else step.depends)
+                     for i, step in enumerate(steps)]
+
+        def on_failure(step):
+            print(f"\n❌ 단계 {numbers[step.name]}에서 문제가 발생했습니다.")
+            return self.confirm_action("계속 진행하시겠습니까?")
         
-        start_time = datetime.now()
+        scheduler = StepScheduler(steps, on_failure=on_failure)
+        completed = scheduler.run()
+        self.print_schedule_summary(scheduler)
         
-        for i, step_func in enumerate(steps, 1):
-            success = step_func()
-            
-            if not success:
-                print(f"\n❌ 단계 {i}에서 문제가 발생했습니다.")
-                if not self.confirm_action("계속 진행하시겠습니까?"):
-                    print("🛑 작업이 중단되었습니다.")
-                    return False
-            
-            if i < len(steps):
-                time.sleep(1)  # 단계 간 잠시 대기
+        if scheduler.stopped:
+            print("🛑 작업이 중단되었습니다.")
+            return False
+        if self.headless and not completed:
+            # CI에서는 실패를 계속 진행했더라도 실패로 종료
+            print("❌ 일부 단계가 실패했습니다 (on_failure=continue).")
+            return False
         
-        end_time = datetime.now()
-        duration = end_time - start_time
+        duration = scheduler.elapsed
         
         self.print_header("완료!")
-        print(f"🕐 소요 시간: {duration}")
+        print(f"🕐 소요 시간: {duration:.1f}초")
         print("🎉 SokSol Play Store 제출 준비가 완료되었습니다!")
         print("\n📋 다음 단계:")
         print("1. RELEASE_CHECKLIST.md 파일을 확인하세요")
@@ -323,35 +439,72 @@ class PlayStoreMaster:
         
         return True
 
-def main():
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="SokSol Play Store 제출 준비 마스터 스크립트",
+                                     usage="python master-prep.py [quick|qa|build] [--isolated] [--headless] "
+                                           "[--config JSON] [--on-failure POLICY] [--build-type TYPE] "
+                                           "[--screenshots MODE] [--skip STEP] [--build-timeout SECONDS] "
+                                           "[--script-timeout SECONDS] [--trace JSON]")
+    parser.add_argument('command', nargs='?', choices=['quick', 'qa', 'build'],
+                        help="quick: 빠른 상태 검증, qa: QA 검증만, build: 빌드만 (생략 시 전체 준비 과정)")
+    parser.add_argument('--isolated', action='store_true',
+                        help="각 스크립트를 별도 Python 프로세스에서 실행 (기본: 같은 프로세스에서 실행)")
+    parser.add_argument('--headless', action='store_true',
+                        help="입력을 기다리지 않고 설정 파일/옵션대로 진행 (CI용)")
+    parser.add_argument('--config', default=str(DEFAULT_CONFIG_PATH), metavar='JSON',
+                        help="헤드리스 설정 파일 (기본: scripts/headless_config.json)")
+    parser.add_argument('--on-failure', choices=['abort', 'continue'],
+                        help="단계 실패 시 동작 (설정 파일의 on_failure 대신 사용)")
+    parser.add_argument('--build-type', choices=BUILD_CHOICES,
+                        help="빌드 형태 (설정 파일의 build_type 대신 사용)")
+    parser.add_argument('--screenshots', choices=SCREENSHOT_CHOICES,
+                        help="스크린샷 단계 동작 (설정 파일의 screenshots 대신 사용)")
+    parser.add_argument('--skip', action='append', choices=STEP_NAMES, default=[], metavar='STEP',
+                        help=f"건너뛸 단계 (여러 번 지정 가능: {', '.join(STEP_NAMES)})")
+    parser.add_argument('--build-timeout', type=int, metavar='SECONDS',
+                        help="빌드 명령 시간 제한 (초)")
+    parser.add_argument('--script-timeout', type=int, metavar='SECONDS',
+                        help="격리 실행 스크립트 시간 제한 (초, --isolated에서 적용)")
+    parser.add_argument('--trace', metavar='JSON',
+                        help="구간별 실행 시간 Chrome trace 저장 경로 (기본: .cache/traces/master-prep.json)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """메인 함수"""
-    master = PlayStoreMaster()
-    
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-        if command == 'quick':
+    args = parse_args(argv)
+    try:
+        config = load_config(args.config)
+    except (ValueError, OSError) as e:
+        print(f"❌ 설정 파일 오류: {e}")
+        return 2
+    for key in ('on_failure', 'build_type', 'screenshots'):
+        if getattr(args, key) is not None:
+            config[key] = getattr(args, key)
+    config['skip_steps'] = list(config['skip_steps']) + args.skip
+    if args.build_timeout is not None:
+        config['timeouts']['build'] = args.build_timeout
+    if args.script_timeout is not None:
+        config['timeouts']['script'] = args.script_timeout
+    with session('master-prep', output=args.trace, summary=True):
+        master = PlayStoreMaster(isolated=args.isolated, headless=args.headless, config=config)
+        
+        if args.command == 'quick':
             # 빠른 검증만
             print("🔍 빠른 상태 검증")
-            master.run_script("playstore-prep.py")
-        elif command == 'qa':
+            return 0 if master.run_script("playstore-prep.py") else 1
+        elif args.command == 'qa':
             # QA만
             print("🔍 QA 검증")
-            master.run_script("qa-validator.py")
-        elif command == 'build':
+            return 0 if master.run_script("qa-validator.py") else 1
+        elif args.command == 'build':
             # 빌드만
             print("🔨 앱 빌드")
-            master.step_build_app()
+            return 0 if master.step_build_app() else 1
         else:
-            print("사용법: python master-prep.py [quick|qa|build]")
-            print("  quick - 빠른 상태 검증")
-            print("  qa    - QA 검증만")
-            print("  build - 빌드만")
-            print("  (인자 없음) - 전체 준비 과정")
-            return 1
-    else:
-        # 전체 과정
-        success = master.run_full_preparation()
-        return 0 if success else 1
+            # 전체 과정
+            success = master.run_full_preparation()
+            return 0 if success else 1
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -7,50 +7,66 @@ Play Store 제출 준비 통합 스크립트
 import os
 import sys
 import json
-import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from project_model import load_project
+from script_runner import ScriptResult, run_in_process
+from toolchain import detect_toolchain
+from tracing import session
+
 class PlayStorePrep:
-    def __init__(self):
+    def __init__(self, refresh_tools=False):
         self.base_path = Path(__file__).parent.parent
         self.mobile_path = self.base_path / "mobile" / "soksol_mobile" / "SokSol"
         self.assets_path = self.base_path / "assets" / "store"
+        self.project = load_project(self.base_path)
+        self.environment = {}  # 도구 이름 → 설치 여부 (check_environment 결과)
+        self.toolchain = None  # toolchain.Toolchain (check_environment 결과)
+        self.refresh_tools = refresh_tools  # True이면 저장된 도구 확인 결과를 무시
+        self.results = {}  # 점검 이름 → 통과 여부 (run_comprehensive_check 결과)
         
     def check_environment(self):
-        """개발 환경 확인"""
+        """개발 환경 확인 (도구 확인 결과는 .cache/toolchain.json에 저장해 재사용)"""
         print("🔍 개발 환경 확인 중...")
         
+        self.toolchain = detect_toolchain(refresh=self.refresh_tools)
         checks = {
-            'git': self._check_git(),
-            'node': self._check_node(),
+            'git': self.toolchain.available('git'),
+            'node': self.toolchain.available('node'),
             'python': self._check_python(),
             'android_studio': self._check_android_studio(),
-            'inkscape': self._check_inkscape(),
-            'imagemagick': self._check_imagemagick(),
+            # 렌더링은 사용 가능한 백엔드 중 하나만 있으면 됨 (cairosvg/Pillow가 프로세스 내부에서 처리)
+            'svg_renderer': bool(self.toolchain.svg_backends),
+            'image_processing': bool(self.toolchain.raster_backends),
+        }
+        # 외부 렌더링 도구는 백엔드 후보일 뿐 필수가 아님
+        optional = {
+            'inkscape': self.toolchain.available('inkscape'),
+            'imagemagick': self.toolchain.available('imagemagick'),
         }
+        self.environment = dict(checks, **optional)
         
         print("\n📋 환경 체크 결과:")
-        for tool, status in checks.items():
-            icon = "✅" if status else "❌"
-            print(f"   {icon} {tool}")
+        for tool, status in self.environment.items():
+            if tool in optional:
+                icon = "✅" if status else "➖"
+                label = f"{tool} (선택)"
+            else:
+                icon = "✅" if status else "❌"
+                label = tool
+            info = self.toolchain.tools.get(tool)
+            detail = f" - {info.summary or info.path}" if info is not None and info.available else ""
+            print(f"   {icon} {label}{detail}")
+        
+        svg_backends = ', '.join(self.toolchain.svg_backends) or "없음"
+        raster_backends = ', '.join(self.toolchain.raster_backends) or "없음"
+        print(f"\n🖌️  SVG 렌더링 백엔드: {svg_backends} / 이미지 처리: {raster_backends}")
+        if self.toolchain.cached:
+            print("   (이전 확인 결과 재사용 - 다시 확인하려면 --refresh-tools)")
         
         return all(checks.values())
     
-    def _check_git(self):
-        try:
-            subprocess.run(['git', '--version'], capture_output=True, check=True)
-            return True
-        except:
-            return False
-    
-    def _check_node(self):
-        try:
-            subprocess.run(['node', '--version'], capture_output=True, check=True)
-            return True
-        except:
-            return False
-    
     def _check_python(self):
         return sys.version_info >= (3, 6)
     
@@ -67,20 +83,6 @@ class PlayStorePrep:
                 return True
         return False
     
-    def _check_inkscape(self):
-        try:
-            subprocess.run(['inkscape', '--version'], capture_output=True, check=True)
-            return True
-        except:
-            return False
-    
-    def _check_imagemagick(self):
-        try:
-            subprocess.run(['convert', '--version'], capture_output=True, check=True)
-            return True
-        except:
-            return False
-    
     def validate_project_structure(self):
         """프로젝트 구조 검증"""
         print("\n🏗️  프로젝트 구조 검증 중...")
@@ -117,19 +119,17 @@ class PlayStorePrep:
         print("\n📱 모바일 앱 설정 확인 중...")
         
         # build.gradle 확인
-        build_gradle = self.mobile_path / "android" / "app" / "build.gradle"
-        if not build_gradle.exists():
+        gradle = self.project.gradle
+        if not gradle.exists:
             print("❌ build.gradle 파일을 찾을 수 없습니다.")
             return False
         
-        content = build_gradle.read_text(encoding='utf-8')
-        
         checks = {
-            'applicationId': 'com.soksol' in content,
-            'versionCode': 'versionCode' in content,
-            'versionName': 'versionName' in content,
-            'signingConfigs': 'signingConfigs' in content,
-            'release_config': 'release {' in content,
+            'applicationId': str(gradle.get('defaultConfig', 'applicationId', '')).startswith('com.soksol'),
+            'versionCode': gradle.get('defaultConfig', 'versionCode') is not None,
+            'versionName': gradle.get('defaultConfig', 'versionName') is not None,
+            'signingConfigs': bool(gradle.children('signingConfigs')),
+            'release_config': gradle.block('buildTypes.release') is not None,
         }
         
         print("Gradle 설정 확인:")
@@ -148,19 +148,16 @@ class PlayStorePrep:
             print("❌ SVG 아이콘 파일을 찾을 수 없습니다.")
             return False
         
-        # Python 변환 스크립트 실행
+        # 변환 스크립트를 같은 프로세스에서 실행
         script_path = self.base_path / "scripts" / "convert-svg-to-png.py"
         try:
-            result = subprocess.run([sys.executable, str(script_path)], 
-                                  capture_output=True, text=True)
+            result = run_in_process(script_path)
             
-            if result.returncode == 0:
+            if result.success:
                 print("✅ 아이콘 변환 완료")
-                print(result.stdout)
                 return True
             else:
                 print("❌ 아이콘 변환 실패")
-                print(result.stderr)
                 return False
         except Exception as e:
             print(f"❌ 아이콘 변환 중 오류: {e}")
@@ -170,12 +167,12 @@ class PlayStorePrep:
         """스토어 자료 검증"""
         print("\n📄 스토어 자료 검증 중...")
         
-        store_materials = self.base_path / "STORE_MATERIALS.md"
-        if not store_materials.exists():
+        store_materials = self.project.document("STORE_MATERIALS.md")
+        if store_materials is None:
             print("❌ STORE_MATERIALS.md 파일이 없습니다.")
             return False
         
-        content = store_materials.read_text(encoding='utf-8')
+        content = store_materials.text
         
         required_sections = [
             "앱명",
@@ -204,21 +201,22 @@ class PlayStorePrep:
         """보안 컴플라이언스 확인"""
         print("\n🔒 보안 컴플라이언스 확인 중...")
         
-        compliance_file = self.base_path / "PLAY_STORE_COMPLIANCE.md"
-        if not compliance_file.exists():
+        if self.project.document("PLAY_STORE_COMPLIANCE.md") is None:
             print("❌ PLAY_STORE_COMPLIANCE.md 파일이 없습니다.")
             return False
         
         # AndroidManifest.xml 확인
-        manifest_path = self.mobile_path / "android" / "app" / "src" / "main" / "AndroidManifest.xml"
-        if manifest_path.exists():
-            manifest_content = manifest_path.read_text(encoding='utf-8')
+        manifest = self.project.manifest
+        if manifest.exists:
+            if manifest.parse_error:
+                print(f"❌ AndroidManifest.xml 파싱 오류: {manifest.parse_error}")
+                return False
             
             security_checks = {
-                'allowBackup_false': 'android:allowBackup="false"' in manifest_content,
-                'internet_permission': 'android.permission.INTERNET' in manifest_content,
-                'no_write_storage': 'WRITE_EXTERNAL_STORAGE' not in manifest_content,
-                'no_location': 'ACCESS_FINE_LOCATION' not in manifest_content,
+                'allowBackup_false': manifest.application.get('allowBackup') == 'false',
+                'internet_permission': 'android.permission.INTERNET' in manifest.permissions,
+                'no_write_storage': not manifest.has_permission('WRITE_EXTERNAL_STORAGE'),
+                'no_location': not manifest.has_permission('ACCESS_FINE_LOCATION'),
             }
             
             print("보안 설정 확인:")
@@ -330,7 +328,7 @@ class PlayStorePrep:
             ("체크리스트 생성", self.generate_release_checklist),
         ]
         
-        results = {}
+        results = self.results = {}
         for name, check_func in all_checks:
             try:
                 results[name] = check_func()
@@ -365,27 +363,42 @@ class PlayStorePrep:
             print("❌로 표시된 항목들을 확인하고 수정하세요.")
             return False
 
-def main():
-    """메인 함수"""
-    prep = PlayStorePrep()
+def run(argv=None):
+    """프로그램에서 호출하는 진입점 (master-prep 등)
+
+    ScriptResult를 반환하며 data에 실행한 명령, 점검별 결과, 환경 확인 결과가 들어간다.
+    """
+    argv = list(argv or [])
+    refresh_tools = '--refresh-tools' in argv
+    argv = [arg for arg in argv if arg != '--refresh-tools']
+    prep = PlayStorePrep(refresh_tools)
     
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-        if command == 'env':
-            prep.check_environment()
-        elif command == 'icons':
-            prep.generate_icons()
-        elif command == 'security':
-            prep.check_security_compliance()
-        elif command == 'checklist':
-            prep.generate_release_checklist()
-        else:
-            print("사용법: python playstore-prep.py [env|icons|security|checklist]")
-            return 1
+    if argv:
+        command = argv[0]
+        commands = {
+            'env': prep.check_environment,
+            'icons': prep.generate_icons,
+            'security': prep.check_security_compliance,
+            'checklist': prep.generate_release_checklist,
+        }
+        if command not in commands:
+            print("사용법: python playstore-prep.py [env|icons|security|checklist] [--refresh-tools]")
+            return ScriptResult("playstore-prep.py", False, 1, {'command': command})
+        success = bool(commands[command]())
+        prep.results = {command: success}
     else:
         # 전체 점검 실행
+        command = None
         success = prep.run_comprehensive_check()
-        return 0 if success else 1
+    
+    data = {'command': command, 'results': prep.results, 'environment': prep.environment,
+            'toolchain': prep.toolchain.to_dict() if prep.toolchain is not None else None}
+    return ScriptResult("playstore-prep.py", success, 0 if success else 1, data)
+
+def main(argv=None):
+    """메인 함수"""
+    with session('playstore-prep'):
+        return run(sys.argv[1:] if argv is None else argv).exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
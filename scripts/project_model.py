@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+프로젝트 스냅샷
+Gradle 빌드 파일(모든 모듈), AndroidManifest.xml, 리소스 목록, 스토어 문서와 에셋 목록을 프로세스당 한 번만
+읽고 파싱해 변경 불가능한 구조로 제공 (검증 스크립트들은 디스크 대신 스냅샷을 조회)
+
+빌드처럼 파일을 바꾸는 작업 뒤에는 refresh_project()로 다시 읽는다.
+"""
+
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+from gradle_model import GradleProject, scan_project
+from store_assets import StoreAssetIndex, build_store_index
+
+BASE_PATH = Path(__file__).parent.parent
+MOBILE_PATH = BASE_PATH / "mobile" / "soksol_mobile" / "SokSol"
+ANDROID_PATH = MOBILE_PATH / "android"
+ASSETS_PATH = BASE_PATH / "assets" / "store"
+
+ANDROID_NS = '{http://schemas.android.com/apk/res/android}'
+
+# 앱 메타데이터 필드 → (Gradle 블록, 정규화된 속성 이름)
+GRADLE_FIELDS = {
+    'applicationId': ('defaultConfig', 'applicationId'),
+    'versionCode': ('defaultConfig', 'versionCode'),
+    'versionName': ('defaultConfig', 'versionName'),
+    'compileSdkVersion': ('android', 'compileSdk'),
+    'targetSdkVersion': ('defaultConfig', 'targetSdk'),
+}
+
+
+def _empty_mapping():
+    return MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class ManifestInfo:
+    """src/main/AndroidManifest.xml"""
+    path: Path
+    exists: bool
+    parse_error: str = None
+    permissions: tuple = ()
+    application: MappingProxyType = field(default_factory=_empty_mapping)  # android: 접두어를 뗀 <application> 속성
+
+    def has_permission(self, name):
+        """권한 이름 일부로 선언 여부 확인 (예: 'WRITE_EXTERNAL_STORAGE')"""
+        return any(name in permission for permission in self.permissions)
+
+
+@dataclass(frozen=True)
+class ResourceInventory:
+    """res/ 아래 폴더별 파일 이름 목록"""
+    path: Path
+    folders: MappingProxyType = field(default_factory=_empty_mapping)  # 폴더 이름 → 파일 이름 튜플
+
+    def has(self, folder, filename):
+        return filename in self.folders.get(folder, ())
+
+    def file(self, folder, filename):
+        return self.path / folder / filename
+
+
+@dataclass(frozen=True)
+class StoreDocument:
+    """저장소 루트의 Markdown 문서"""
+    path: Path
+    size: int
+    text: str
+
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    base_path: Path
+    mobile_path: Path
+    assets_path: Path
+    gradle_project: GradleProject
+    manifest: ManifestInfo
+    resources: ResourceInventory
+    documents: MappingProxyType  # 파일 이름 → StoreDocument
+    store_assets: StoreAssetIndex
+
+    @property
+    def gradle(self):
+        """앱 모듈(com.android.application) 빌드 파일"""
+        return self.gradle_project.app
+
+    def document(self, filename):
+        return self.documents.get(filename)
+
+
+def load_manifest(path):
+    path = Path(path)
+    if not path.is_file():
+        return ManifestInfo(path, False)
+
+    try:
+        root = ET.parse(path).getroot()
+    except ET.ParseError as e:
+        return ManifestInfo(path, True, parse_error=str(e))
+
+    return manifest_from_element(path, root)
+
+
+def manifest_from_element(path, root):
+    """<manifest> 요소 트리 → ManifestInfo (소스 XML과 컴파일된 매니페스트 공용)"""
+    permissions = tuple(perm.get(f'{ANDROID_NS}name')
+                        for tag in ('uses-permission', 'uses-permission-sdk-23')
+                        for perm in root.iter(tag))
+    application = root.find('.//application')
+    attributes = {}
+    if application is not None:
+        attributes = {name.replace(ANDROID_NS, ''): value for name, value in application.attrib.items()}
+    return ManifestInfo(path, True, None, permissions, MappingProxyType(attributes))
+
+
+def load_resources(path):
+    path = Path(path)
+    folders = {}
+    if path.is_dir():
+        for folder in sorted(path.iterdir()):
+            if folder.is_dir():
+                folders[folder.name] = tuple(sorted(entry.name for entry in folder.iterdir() if entry.is_file()))
+    return ResourceInventory(path, MappingProxyType(folders))
+
+
+def load_documents(base_path):
+    documents = {}
+    for path in sorted(Path(base_path).glob("*.md")):
+        data = path.read_bytes()
+        documents[path.name] = StoreDocument(path, len(data), data.decode('utf-8', 'replace'))
+    return MappingProxyType(documents)
+
+
+@lru_cache(maxsize=None)
+def load_project(base_path=BASE_PATH):
+    """프로젝트 스냅샷 (같은 base_path는 프로세스당 한 번만 읽음)"""
+    base_path = Path(base_path)
+    mobile_path = base_path / MOBILE_PATH.relative_to(BASE_PATH)
+    android_path = base_path / ANDROID_PATH.relative_to(BASE_PATH)
+    gradle_project = scan_project(android_path)
+    app_path = gradle_project.app.path.parent
+    return ProjectSnapshot(
+        base_path=base_path,
+        mobile_path=mobile_path,
+        assets_path=base_path / ASSETS_PATH.relative_to(BASE_PATH),
+        gradle_project=gradle_project,
+        manifest=load_manifest(app_path / "src" / "main" / "AndroidManifest.xml"),
+        resources=load_resources(app_path / "src" / "main" / "res"),
+        documents=load_documents(base_path),
+        store_assets=build_store_index(base_path / ASSETS_PATH.relative_to(BASE_PATH)),
+    )
+
+
+def refresh_project():
+    """캐시된 스냅샷을 버림 (다음 load_project()에서 다시 읽음)"""
+    load_project.cache_clear()
@@ -7,24 +7,99 @@ Play Store 제출 전 최종 QA 스크립트
 import os
 import sys
 import json
-import re
+import sqlite3
+import time
+import argparse
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-import xml.etree.ElementTree as ET
+
+from asset_specs import (ANDROID_ICON_SIZES, DENSITY_SCALES, FEATURE_GRAPHIC_MAX_BYTES, FEATURE_GRAPHIC_SIZE,
+                         FORM_FACTOR_TARGETS, MAX_RESOURCE_IMAGE_BYTES, MAX_STORE_IMAGE_BYTES, SCREENSHOT_COUNT,
+                         SCREENSHOT_MAX_ASPECT, SCREENSHOT_SIDE, SCREENSHOT_TARGETS, STORE_ICON_MAX_BYTES,
+                         STORE_ICON_SIZE)
+from archive_inspector import ArchiveError, inspect_archive
+from compiled_manifest import read_compiled_manifest
+from gradle_model import Ref, signing_config_name
+from image_headers import iter_image_files, read_image_headers
+from project_model import GRADLE_FIELDS, load_project
+from size_history import (SizeHistory, artifact_measurements, evaluate, history_digest,
+                          load_budget_config, store_measurements)
+from qa_state import QAState, code_digest
+from qa_results import QAReport, ValidatorResult, format_delta, format_size
+from script_runner import ScriptResult
+from tracing import current_span, session, span
+
+ANDROID = "mobile/soksol_mobile/SokSol/android"
+APP = f"{ANDROID}/app"
+# Gradle 설정을 읽는 검증기의 입력 (루트/settings/모든 모듈 빌드 파일)
+GRADLE_INPUTS = [f"{ANDROID}/build.gradle*", f"{ANDROID}/settings.gradle*", f"{ANDROID}/gradle.properties",
+                 f"{ANDROID}/*/build.gradle*", f"{ANDROID}/*/*/build.gradle*"]
+# 보고서에 표시할 아카이브 최대 항목 수
+TOP_ENTRIES = 10
+
+# 내용이 바뀌면 이전 검증 결과를 모두 무효화하는 코드 파일
+CODE_FILES = [Path(__file__).parent / name
+              for name in ("qa-validator.py", "project_model.py", "gradle_model.py", "archive_inspector.py",
+                           "compiled_manifest.py", "size_history.py", "asset_specs.py", "qa_state.py",
+                           "qa_results.py", "image_headers.py", "store_assets.py")]
+
+def resource_qualifiers(folder):
+    """res/ 폴더 이름 → (리소스 종류, 밀도) (예: 'mipmap-xhdpi-v4' → ('mipmap', 'xhdpi'), 밀도 없으면 None)"""
+    kind, *qualifiers = folder.split('-')
+    density = next((qualifier for qualifier in qualifiers if qualifier in DENSITY_SCALES), None)
+    return kind, density
 
 class QAValidator:
+    # 검증기별 입력 파일 (저장소 기준 glob). 증분 실행 시 이 파일들이 바뀐 검증기만 다시 실행
+    INPUTS = {
+        'validate_app_metadata': GRADLE_INPUTS,
+        'validate_permissions': GRADLE_INPUTS + [f"{APP}/src/main/AndroidManifest.xml",
+                                                 f"{APP}/build/outputs/bundle/release/app-release.aab",
+                                                 f"{APP}/build/outputs/apk/release/app-release.apk"],
+        'validate_icons': [f"{APP}/src/main/res/mipmap-*/*", f"{APP}/src/main/res/drawable*/*"],
+        'validate_store_materials': ["STORE_MATERIALS.md", "PRIVACY.md", "PLAY_STORE_COMPLIANCE.md",
+                                     "assets/store/**/*"],
+        'validate_build_outputs': [f"{APP}/build/outputs/bundle/release/app-release.aab",
+                                   f"{APP}/build/outputs/apk/release/app-release.apk"],
+        'validate_size_budget': GRADLE_INPUTS + [f"{APP}/build/outputs/bundle/release/app-release.aab",
+                                                 f"{APP}/build/outputs/apk/release/app-release.apk",
+                                                 "assets/store/**/*", "scripts/size_budgets.json"],
+        'validate_security': GRADLE_INPUTS + [f"{APP}/src/main/res/xml/network_security_config.xml"],
+        'validate_compliance': ["PRIVACY.md", "PLAY_STORE_COMPLIANCE.md"],
+    }
+    
     def __init__(self):
         self.base_path = Path(__file__).parent.parent
         self.mobile_path = self.base_path / "mobile" / "soksol_mobile" / "SokSol"
         self.assets_path = self.base_path / "assets" / "store"
+        self.project = load_project(self.base_path)
         self.issues = []
         self.warnings = []
         self.passed = []
+        self.artifacts = []  # 빌드 산출물 구성 분석 결과 (archive_inspector.inspect_archive)
+        self.timings = {}
+        self.reused = set()
+        self.validator_results = []  # 검증기별 구조화 결과 (qa_results.ValidatorResult, 선언 순서)
+        self.report = None  # 마지막으로 생성한 qa_results.QAReport
+        self._state = None
+        # 동시 실행 시 검증기별 결과를 스레드 로컬 버퍼에 모은 뒤 선언 순서대로 병합
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def _record(self, kind, item):
+        buffer = getattr(self._local, 'results', None)
+        if buffer is not None:
+            buffer[kind].append(item)
+        else:
+            with self._lock:
+                getattr(self, kind).append(item)
         
     def add_issue(self, category, description, severity="error"):
         """이슈 추가"""
-        self.issues.append({
+        self._record('issues', {
             'category': category,
             'description': description,
             'severity': severity,
@@ -33,7 +108,7 @@ class QAValidator:
     
     def add_warning(self, category, description):
         """경고 추가"""
-        self.warnings.append({
+        self._record('warnings', {
             'category': category,
             'description': description,
             'timestamp': datetime.now().isoformat()
@@ -41,137 +116,218 @@ class QAValidator:
     
     def add_passed(self, category, description):
         """통과 항목 추가"""
-        self.passed.append({
+        self._record('passed', {
             'category': category,
             'description': description,
             'timestamp': datetime.now().isoformat()
         })
     
+    def add_artifact(self, summary):
+        """빌드 산출물 구성 분석 결과 추가"""
+        self._record('artifacts', summary)
+    
+    def _input_digest(self, name):
+        """파일이 아닌 검증기 입력의 해시 (크기 예산 검증은 크기 이력 DB의 직전 릴리스 기록)
+
+        이력을 읽을 수 없으면 None (이전 결과를 재사용하지 않고 검증기를 실행)
+        """
+        if name != 'validate_size_budget':
+            return ''
+        version_code = self.project.gradle.get('defaultConfig', 'versionCode')
+        try:
+            return history_digest(version_code, load_budget_config()['compare_releases'])
+        except (OSError, ValueError, sqlite3.Error):
+            return None
+
+    def _run_validation(self, validation, parent=None):
+        """검증기 하나를 실행하고 (결과 버퍼, 소요 시간, 재사용 여부) 반환
+
+        상태 파일이 있고 입력 지문이 이전 실행과 같으면 검증기를 실행하지 않고
+        이전 결과를 그대로 사용한다. parent는 검증기를 스레드 풀에 나눠 준 구간이다.
+        """
+        name = validation.__name__
+        started = time.perf_counter()
+        with span(name, 'validator', within=parent) as current:
+            extra = self._input_digest(name) if self._state is not None else None
+            if extra is not None:
+                fingerprint, files = self._state.fingerprint(name, self.INPUTS.get(name, []), extra)
+                cached = self._state.lookup(name, fingerprint)
+                if cached is not None:
+                    self._state.store(name, fingerprint, files, cached)
+                    current.args['reused'] = True
+                    return cached, time.perf_counter() - started, True
+            
+            self._local.results = {'issues': [], 'warnings': [], 'passed': [], 'artifacts': []}
+            try:
+                validation()
+            except Exception as e:
+                self.add_issue("system", f"검증 중 오류: {name} - {e}")
+            finally:
+                elapsed = time.perf_counter() - started
+                results = self._local.results
+                self._local.results = None
+        
+        # 시스템 오류는 일시적일 수 있으므로 재사용하지 않음
+        if extra is not None and not any(issue['category'] == 'system' for issue in results['issues']):
+            self._state.store(name, fingerprint, files, results)
+        return results, elapsed, False
+    
     def validate_app_metadata(self):
         """앱 메타데이터 검증"""
         print("📱 앱 메타데이터 검증 중...")
         
         # build.gradle 검증
-        build_gradle = self.mobile_path / "android" / "app" / "build.gradle"
-        if not build_gradle.exists():
+        gradle = self.project.gradle
+        if not gradle.exists:
             self.add_issue("metadata", "build.gradle 파일을 찾을 수 없음")
             return
         
-        content = build_gradle.read_text(encoding='utf-8')
-        
         # 필수 필드 확인
-        required_fields = {
-            'applicationId': r'applicationId\s*["\']([^"\']+)["\']',
-            'versionCode': r'versionCode\s*(\d+)',
-            'versionName': r'versionName\s*["\']([^"\']+)["\']',
-            'compileSdkVersion': r'compileSdkVersion\s*(\d+)',
-            'targetSdkVersion': r'targetSdkVersion\s*(\d+)',
-        }
-        
-        for field, pattern in required_fields.items():
-            match = re.search(pattern, content)
-            if match:
-                value = match.group(1)
+        for field, (block, name) in GRADLE_FIELDS.items():
+            value = gradle.get(block, name)
+            if value is None:
+                self.add_issue("metadata", f"{field}가 설정되지 않음")
+            elif isinstance(value, Ref):
+                self.add_warning("metadata", f"{field} 값을 확인할 수 없음: {value}")
+            else:
                 self.add_passed("metadata", f"{field}: {value}")
                 
                 # 특별 검증
-                if field == 'applicationId' and not value.startswith('com.soksol'):
+                if field == 'applicationId' and not str(value).startswith('com.soksol'):
                     self.add_warning("metadata", f"패키지명이 표준과 다름: {value}")
-                elif field == 'targetSdkVersion' and int(value) < 31:
+                elif field == 'targetSdkVersion' and isinstance(value, int) and value < 31:
                     self.add_warning("metadata", f"타겟 SDK가 낮음: {value} (권장: 31+)")
+        
+        # 제품 플레이버별 applicationId 재정의 확인
+        for flavor in gradle.children('productFlavors'):
+            flavor_id = gradle.get(f'productFlavors.{flavor}', 'applicationId')
+            if isinstance(flavor_id, str) and not flavor_id.startswith('com.soksol'):
+                self.add_warning("metadata", f"{flavor} 플레이버 패키지명이 표준과 다름: {flavor_id}")
             else:
-                self.add_issue("metadata", f"{field}가 설정되지 않음")
+                self.add_passed("metadata", f"{flavor} 플레이버 설정 확인")
     
     def validate_permissions(self):
-        """권한 검증"""
+        """권한 검증 (소스 매니페스트와 빌드 산출물의 병합된 매니페스트)"""
         print("🔒 권한 설정 검증 중...")
         
-        manifest_path = self.mobile_path / "android" / "app" / "src" / "main" / "AndroidManifest.xml"
-        if not manifest_path.exists():
+        manifest = self.project.manifest
+        if not manifest.exists:
             self.add_issue("permissions", "AndroidManifest.xml을 찾을 수 없음")
-            return
+        elif manifest.parse_error:
+            self.add_issue("permissions", f"AndroidManifest.xml 파싱 오류: {manifest.parse_error}")
+        else:
+            self.check_manifest(manifest)
+        
+        # 실제로 배포되는 매니페스트에는 라이브러리가 추가한 권한이 병합되어 있음
+        for label, path in self.artifact_paths():
+            if not path.exists():
+                continue
+            compiled = read_compiled_manifest(path)
+            if compiled.parse_error:
+                self.add_warning("permissions", f"{label} 매니페스트를 읽을 수 없음: {compiled.parse_error}")
+                continue
+            self.check_manifest(compiled, label, source=manifest)
+    
+    def check_manifest(self, manifest, label=None, source=None):
+        """허용 권한 목록과 allowBackup 검사 (소스/컴파일된 매니페스트 공용)
+
+        source가 있으면 소스 매니페스트에 없는 권한을 병합 과정에서 추가된 것으로 표시한다.
+        """
+        prefix = f"[{label}] " if label else ""
+        
+        # 허용된 권한 (최소 권한 원칙)
+        allowed_permissions = {
+            'android.permission.INTERNET',
+            'android.permission.ACCESS_NETWORK_STATE',
+        }
+        # 앱 자체가 정의하는 권한 (예: AndroidX의 DYNAMIC_RECEIVER_NOT_EXPORTED_PERMISSION)
+        application_id = self.project.gradle.get('defaultConfig', 'applicationId')
+        own_prefix = f"{application_id}." if isinstance(application_id, str) else None
+        
+        # 권한 검증
+        for perm in manifest.permissions:
+            if perm in allowed_permissions:
+                self.add_passed("permissions", f"{prefix}필요한 권한: {perm}")
+            elif own_prefix and perm.startswith(own_prefix):
+                self.add_passed("permissions", f"{prefix}앱 내부 권한: {perm}")
+            elif source is not None and source.exists and perm not in source.permissions:
+                self.add_issue("permissions", f"{prefix}불필요한 권한: {perm} (라이브러리 매니페스트 병합으로 추가됨)")
+            else:
+                self.add_issue("permissions", f"{prefix}불필요한 권한: {perm}")
         
-        try:
-            tree = ET.parse(manifest_path)
-            root = tree.getroot()
-            
-            # 권한 목록 확인
-            permissions = root.findall('.//uses-permission')
-            permission_names = [perm.get('{http://schemas.android.com/apk/res/android}name') for perm in permissions]
-            
-            # 허용된 권한 (최소 권한 원칙)
-            allowed_permissions = {
-                'android.permission.INTERNET',
-                'android.permission.ACCESS_NETWORK_STATE',
-            }
-            
-            # 권한 검증
-            for perm in permission_names:
-                if perm in allowed_permissions:
-                    self.add_passed("permissions", f"필요한 권한: {perm}")
-                else:
-                    self.add_issue("permissions", f"불필요한 권한: {perm}")
-            
-            # 필수 권한 확인
-            if 'android.permission.INTERNET' not in permission_names:
-                self.add_issue("permissions", "INTERNET 권한이 없음 (WebView 앱에 필수)")
-            
-            # 보안 설정 확인
-            application = root.find('.//application')
-            if application is not None:
-                allow_backup = application.get('{http://schemas.android.com/apk/res/android}allowBackup')
-                if allow_backup == 'false':
-                    self.add_passed("permissions", "allowBackup=false 설정됨")
-                else:
-                    self.add_issue("permissions", "allowBackup이 false로 설정되지 않음")
+        # 필수 권한 확인
+        if 'android.permission.INTERNET' not in manifest.permissions:
+            self.add_issue("permissions", f"{prefix}INTERNET 권한이 없음 (WebView 앱에 필수)")
         
-        except ET.ParseError as e:
-            self.add_issue("permissions", f"AndroidManifest.xml 파싱 오류: {e}")
+        # 보안 설정 확인
+        if manifest.application:
+            if manifest.application.get('allowBackup') == 'false':
+                self.add_passed("permissions", f"{prefix}allowBackup=false 설정됨")
+            else:
+                self.add_issue("permissions", f"{prefix}allowBackup이 false로 설정되지 않음")
     
     def validate_icons(self):
-        """아이콘 검증"""
+        """아이콘 및 이미지 리소스 검증 (헤더만 읽어 res/의 mipmap/drawable 전체를 검사)"""
         print("🎨 아이콘 검증 중...")
         
-        # 필요한 아이콘 크기
-        required_icons = {
-            'mipmap-mdpi': 48,
-            'mipmap-hdpi': 72,
-            'mipmap-xhdpi': 96,
-            'mipmap-xxhdpi': 144,
-            'mipmap-xxxhdpi': 192,
-        }
-        
-        res_path = self.mobile_path / "android" / "app" / "src" / "main" / "res"
-        
-        for folder, expected_size in required_icons.items():
-            folder_path = res_path / folder
-            icon_path = folder_path / "ic_launcher.png"
-            round_icon_path = folder_path / "ic_launcher_round.png"
-            
-            if icon_path.exists():
-                self.add_passed("icons", f"{folder}/ic_launcher.png 존재")
-                
-                # 이미지 크기 검증 (PIL 사용 가능시)
-                try:
-                    from PIL import Image
-                    with Image.open(icon_path) as img:
-                        width, height = img.size
-                        if width == expected_size and height == expected_size:
-                            self.add_passed("icons", f"{folder} 크기 정확: {width}x{height}")
-                        else:
-                            self.add_warning("icons", f"{folder} 크기 부정확: {width}x{height} (예상: {expected_size}x{expected_size})")
-                except ImportError:
-                    # PIL 없으면 크기 검증 스킵
-                    pass
-                except Exception as e:
-                    self.add_warning("icons", f"{folder} 이미지 검증 실패: {e}")
-            else:
-                self.add_issue("icons", f"{folder}/ic_launcher.png 누락")
-            
-            if round_icon_path.exists():
-                self.add_passed("icons", f"{folder}/ic_launcher_round.png 존재")
-            else:
-                self.add_warning("icons", f"{folder}/ic_launcher_round.png 누락")
+        res_path = self.project.resources.path
+        res_files = list(iter_image_files(res_path, ('mipmap', 'drawable')))
+        images = read_image_headers(res_files)
+        
+        # (리소스 종류, 이름) → {밀도: ImageInfo}
+        densities = {}
+        for info in images:
+            folder = info.path.parent.name
+            label = f"{folder}/{info.path.name}"
+            if info.error:
+                self.add_warning("images", f"{label} 헤더 판독 실패: {info.error}")
+                continue
+            if info.file_size > MAX_RESOURCE_IMAGE_BYTES:
+                self.add_warning("images", f"{label} 파일이 큼: {format_size(info.file_size)} "
+                                           f"(권장 {format_size(MAX_RESOURCE_IMAGE_BYTES)} 이하, WebP 변환 고려)")
+            if info.bit_depth > 8:
+                self.add_warning("images", f"{label} {info.bit_depth}비트 이미지 (8비트로 충분)")
+            kind, density = resource_qualifiers(folder)
+            if density:
+                densities.setdefault((kind, info.path.stem), {})[density] = info
+        
+        for folder, expected_size in ANDROID_ICON_SIZES.items():
+            density = resource_qualifiers(folder)[1]
+            for name, missing in (("ic_launcher", self.add_issue), ("ic_launcher_round", self.add_warning)):
+                info = densities.get(('mipmap', name), {}).get(density)
+                if info is None:
+                    missing("icons", f"{folder}/{name}.png 누락")
+                    continue
+                self.add_passed("icons", f"{folder}/{info.path.name} 존재")
+                if info.size == (expected_size, expected_size):
+                    self.add_passed("icons", f"{folder}/{name} 크기 정확: {info.width}x{info.height}")
+                else:
+                    self.add_warning("icons", f"{folder}/{name} 크기 부정확: {info.width}x{info.height} "
+                                              f"(예상: {expected_size}x{expected_size})")
+        
+        # 기본 아이콘만 있고 원형 아이콘이 없는 나머지 밀도
+        launcher = densities.get(('mipmap', 'ic_launcher'), {})
+        round_launcher = densities.get(('mipmap', 'ic_launcher_round'), {})
+        known = {resource_qualifiers(folder)[1] for folder in ANDROID_ICON_SIZES}
+        for density in sorted(set(launcher) - set(round_launcher) - known, key=DENSITY_SCALES.get):
+            self.add_warning("icons", f"mipmap-{density}/ic_launcher_round 누락")
+        
+        # 같은 리소스의 밀도별 크기가 배율과 맞는지 (가장 높은 밀도 기준)
+        for (kind, name), variants in densities.items():
+            if (kind, name) in (('mipmap', 'ic_launcher'), ('mipmap', 'ic_launcher_round')) or len(variants) < 2:
+                continue
+            reference_density = max(variants, key=DENSITY_SCALES.get)
+            reference = variants[reference_density]
+            scale = DENSITY_SCALES[reference_density]
+            for density, info in variants.items():
+                factor = DENSITY_SCALES[density] / scale
+                expected = (round(reference.width * factor), round(reference.height * factor))
+                if abs(info.width - expected[0]) > 1 or abs(info.height - expected[1]) > 1:
+                    self.add_warning("images", f"{info.path.parent.name}/{info.path.name} 밀도별 크기 불일치: "
+                                               f"{info.width}x{info.height} (예상: {expected[0]}x{expected[1]}, "
+                                               f"{reference_density} 기준)")
+        
+        self.add_passed("images", f"res 이미지 헤더 {len(images)}개 확인")
     
     def validate_store_materials(self):
         """스토어 자료 검증"""
@@ -185,12 +341,12 @@ class QAValidator:
         }
         
         for filename, description in required_files.items():
-            file_path = self.base_path / filename
-            if file_path.exists():
+            document = self.project.document(filename)
+            if document is not None:
                 self.add_passed("store_materials", f"{description} 존재")
                 
                 # 파일 크기 확인
-                size = file_path.stat().st_size
+                size = document.size
                 if size > 100:  # 100바이트 이상
                     self.add_passed("store_materials", f"{description} 충분한 내용 ({size} bytes)")
                 else:
@@ -198,30 +354,115 @@ class QAValidator:
             else:
                 self.add_issue("store_materials", f"{description} 누락: {filename}")
         
-        # 스크린샷 확인
-        screenshots_dir = self.assets_path / "screenshots"
-        if screenshots_dir.exists():
-            screenshot_files = list(screenshots_dir.glob("*.png"))
-            if len(screenshot_files) >= 2:
-                self.add_passed("store_materials", f"스크린샷 {len(screenshot_files)}개 준비됨")
-            else:
-                self.add_warning("store_materials", f"스크린샷 부족: {len(screenshot_files)}개 (최소 2개 필요)")
+        store = self.project.store_assets
+        
+        # 내용과 확장자가 다른 파일
+        for asset in store:
+            if asset.suffix_mismatch:
+                self.add_warning("store_materials", f"확장자 불일치: {asset.relative} (실제 형식: {asset.kind})")
+            elif asset.image is not None and asset.image.error:
+                self.add_warning("store_materials", f"{asset.relative} 헤더 판독 실패: {asset.image.error}")
+        
+        # 스크린샷 확인 (phone은 screenshots/ 바로 아래, 태블릿은 screenshots/<대상>/ 아래,
+        # 모든 디바이스 촬영은 screenshots/<폼팩터>/<디바이스>/ 아래를 폼팩터의 대상으로 집계)
+        if store.exists('screenshots'):
+            form_factors = {'phone': store.images('screenshots', depth=1)}
+            for asset in store.images('screenshots', depth=2):
+                target = asset.relative.split('/')[1]
+                if target in SCREENSHOT_TARGETS:
+                    form_factors.setdefault(target, []).append(asset)
+            for asset in store.images('screenshots', depth=3):
+                target = FORM_FACTOR_TARGETS.get(asset.relative.split('/')[1])
+                if target is not None:
+                    form_factors.setdefault(target, []).append(asset)
+            
+            minimum, maximum = SCREENSHOT_COUNT
+            for target, screenshots in form_factors.items():
+                label = "스크린샷" if target == 'phone' else f"{target} 스크린샷"
+                if len(screenshots) < minimum:
+                    self.add_warning("store_materials", f"{label} 부족: {len(screenshots)}개 (최소 {minimum}개 필요)")
+                elif len(screenshots) > maximum:
+                    self.add_warning("store_materials", f"{label} 초과: {len(screenshots)}개 (최대 {maximum}개)")
+                else:
+                    self.add_passed("store_materials", f"{label} {len(screenshots)}개 준비됨")
+                for asset in screenshots:
+                    self.check_screenshot(asset)
         else:
             self.add_warning("store_materials", "스크린샷 폴더 없음")
         
         # 피처 그래픽 확인
-        feature_graphic = self.assets_path / "graphics" / "feature_graphic.png"
-        if feature_graphic.exists():
+        feature_graphic = store.find('graphics', 'feature_graphic')
+        if feature_graphic is not None:
             self.add_passed("store_materials", "피처 그래픽 존재")
+            self.check_store_image(feature_graphic, "피처 그래픽", FEATURE_GRAPHIC_SIZE, FEATURE_GRAPHIC_MAX_BYTES,
+                                   alpha=False)
         else:
             self.add_warning("store_materials", "피처 그래픽 누락")
+        
+        # 고해상도 아이콘 확인 (512x512 32비트 PNG)
+        icons = [asset for asset in store.images('icons') if asset.kind == 'png']
+        icon = next((asset for asset in icons if asset.image.size == (STORE_ICON_SIZE, STORE_ICON_SIZE)),
+                    icons[0] if icons else None)
+        if icon is not None:
+            self.add_passed("store_materials", f"스토어 아이콘 존재: {icon.relative}")
+            self.check_store_image(icon, "스토어 아이콘", (STORE_ICON_SIZE, STORE_ICON_SIZE), STORE_ICON_MAX_BYTES,
+                                   alpha=True)
+        else:
+            self.add_warning("store_materials", f"스토어 아이콘 누락 ({STORE_ICON_SIZE}x{STORE_ICON_SIZE} PNG)")
+    
+    def check_screenshot(self, asset):
+        """스크린샷 하나의 Play Store 규칙 확인 (한 변 길이, 비율, 알파, 파일 크기)"""
+        info = asset.image
+        if info.error:
+            return
+        shortest, longest = sorted(info.size)
+        low, high = SCREENSHOT_SIDE
+        if shortest < low or longest > high:
+            self.add_warning("store_materials", f"스크린샷 크기 범위 벗어남: {asset.relative} {info.width}x{info.height} "
+                                                f"(각 변 {low}~{high}px)")
+        if longest > shortest * SCREENSHOT_MAX_ASPECT:
+            self.add_warning("store_materials", f"스크린샷 비율 초과: {asset.relative} {info.width}x{info.height} "
+                                                f"(긴 변이 짧은 변의 {SCREENSHOT_MAX_ASPECT:g}배 이하)")
+        if info.has_alpha:
+            self.add_warning("store_materials", f"스크린샷에 알파 채널 있음: {asset.relative} (JPEG 또는 24비트 PNG 필요)")
+        if asset.file_size > MAX_STORE_IMAGE_BYTES:
+            self.add_warning("store_materials", f"스크린샷 파일이 큼: {asset.relative} {format_size(asset.file_size)} "
+                                                f"(최대 {format_size(MAX_STORE_IMAGE_BYTES)})")
+    
+    def check_store_image(self, asset, label, expected_size, max_bytes, alpha):
+        """피처 그래픽/아이콘 크기, 형식, 파일 크기 확인 (alpha: 알파 채널 허용 여부)"""
+        info = asset.image
+        if info.error:
+            return
+        width, height = expected_size
+        if info.size == expected_size:
+            self.add_passed("store_materials", f"{label} 크기 정확: {width}x{height}")
+        else:
+            self.add_warning("store_materials", f"{label} 크기 부정확: {asset.relative} {info.width}x{info.height} "
+                                                f"(예상: {width}x{height})")
+        if info.bit_depth > 8:
+            self.add_warning("store_materials", f"{label} {info.bit_depth}비트 이미지: {asset.relative} "
+                                                f"({'32비트' if alpha else '24비트'} PNG 필요)")
+        if info.has_alpha and not alpha:
+            self.add_warning("store_materials", f"{label}에 알파 채널 있음: {asset.relative} (JPEG 또는 24비트 PNG 필요)")
+        if asset.file_size > max_bytes:
+            self.add_warning("store_materials", f"{label} 파일이 큼: {asset.relative} {format_size(asset.file_size)} "
+                                                f"(최대 {format_size(max_bytes)})")
+    
+    def artifact_paths(self):
+        """릴리스 빌드 산출물 [(표시 이름, 경로)]"""
+        outputs = self.mobile_path / "android" / "app" / "build" / "outputs"
+        return [
+            ("AAB", outputs / "bundle" / "release" / "app-release.aab"),
+            ("APK", outputs / "apk" / "release" / "app-release.apk"),
+        ]
     
     def validate_build_outputs(self):
         """빌드 결과물 검증"""
         print("🔨 빌드 결과물 검증 중...")
         
         # AAB 파일 확인
-        aab_path = self.mobile_path / "android" / "app" / "build" / "outputs" / "bundle" / "release" / "app-release.aab"
+        aab_path, apk_path = (path for _, path in self.artifact_paths())
         if aab_path.exists():
             size = aab_path.stat().st_size
             if size > 1024 * 1024:  # 1MB 이상
@@ -232,37 +473,106 @@ class QAValidator:
             self.add_issue("build", "AAB 파일 없음 - 빌드 필요")
         
         # APK 파일 확인 (선택사항)
-        apk_path = self.mobile_path / "android" / "app" / "build" / "outputs" / "apk" / "release" / "app-release.apk"
         if apk_path.exists():
             size = apk_path.stat().st_size
             self.add_passed("build", f"APK 파일 존재 ({size // 1024 // 1024} MB)")
         else:
             self.add_warning("build", "APK 파일 없음 (테스트용으로 권장)")
+        
+        # 아카이브 구성 분석 (압축 해제 없이 중앙 디렉터리만 읽음)
+        for label, path in self.artifact_paths():
+            if not path.exists():
+                continue
+            try:
+                summary = inspect_archive(path, top=TOP_ENTRIES)
+            except (ArchiveError, OSError) as e:
+                self.add_issue("build", f"{label} 파일을 읽을 수 없음: {e}")
+                continue
+            summary['label'] = label
+            self.add_artifact(summary)
+            for item in summary['compressible']:
+                self.add_warning("build", f"{label}: 압축 가능한 파일이 비압축 저장됨 - {item['name']} "
+                                          f"({format_size(item['size'])}, 예상 절감 {format_size(item['estimated_saving'])})")
+    
+    def validate_size_budget(self):
+        """산출물 크기 예산 및 직전 릴리스 대비 증가량 검증"""
+        print("📏 크기 예산 검증 중...")
+        
+        config = load_budget_config()
+        measurements = store_measurements(self.project.store_assets)
+        for label, path in self.artifact_paths():
+            if path.exists():
+                try:
+                    measurements.update(artifact_measurements(label, inspect_archive(path, top=0)))
+                except (ArchiveError, OSError):
+                    # 읽을 수 없는 아카이브는 validate_build_outputs에서 보고
+                    continue
+        
+        # versionCode별 이력 기록 및 직전 릴리스 조회
+        gradle = self.project.gradle
+        version_code = gradle.get('defaultConfig', 'versionCode')
+        previous = []
+        if isinstance(version_code, int):
+            with SizeHistory() as history:
+                previous = history.previous(version_code, config['compare_releases'])
+                history.record(version_code, str(gradle.get('defaultConfig', 'versionName', '')), measurements)
+        else:
+            self.add_warning("size", "versionCode를 확인할 수 없어 크기 이력을 기록하지 않음")
+        
+        for result in evaluate(measurements, previous, config):
+            key = result['key']
+            current = format_size(result['current'])
+            if result['status'] == 'over_budget':
+                over = result['current'] - result['budget']
+                self.add_issue("size", f"{key} 예산 초과: {current} > {format_size(result['budget'])} (+{format_size(over)})")
+            elif result['status'] == 'regression':
+                percent = result['delta'] / result['baseline'] * 100 if result['baseline'] else float('inf')
+                self.add_issue("size", f"{key} 크기 증가: {format_size(result['baseline'])} → {current} "
+                                       f"({format_delta(result['delta'])}, {percent:+.1f}%, "
+                                       f"versionCode {result['baseline_version']} 대비, "
+                                       f"최근 {len(previous)}개 릴리스 평균 {format_size(result['average'])})")
+            elif result['budget'] is not None or key.endswith('.total'):
+                details = []
+                if result['budget'] is not None:
+                    details.append(f"예산 {format_size(result['budget'])}")
+                if result['delta'] is not None:
+                    details.append(f"versionCode {result['baseline_version']} 대비 {format_delta(result['delta'])}")
+                suffix = f" ({', '.join(details)})" if details else ""
+                self.add_passed("size", f"{key}: {current}{suffix}")
     
     def validate_security(self):
         """보안 설정 검증"""
         print("🛡️ 보안 설정 검증 중...")
         
-        # Gradle 보안 설정
-        build_gradle = self.mobile_path / "android" / "app" / "build.gradle"
-        if build_gradle.exists():
-            content = build_gradle.read_text(encoding='utf-8')
+        # Gradle 보안 설정 (앱 모듈마다 확인)
+        gradle_project = self.project.gradle_project
+        modules = gradle_project.application_modules
+        for module in modules or [None]:
+            gradle = gradle_project.modules[module] if module else self.project.gradle
+            if not gradle.exists:
+                continue
+            label = f"[{module}] " if len(modules) > 1 else ""
             
-            # 서명 설정 확인
-            if 'signingConfigs' in content:
-                self.add_passed("security", "서명 설정 존재")
+            # 서명 설정 확인 (release 빌드 타입이 사용하는 signingConfig)
+            signing = signing_config_name(gradle.get('buildTypes.release', 'signingConfig'))
+            if signing == 'debug':
+                self.add_issue("security", f"{label}release 빌드가 디버그 키로 서명됨")
+            elif signing or 'release' in gradle.children('signingConfigs'):
+                self.add_passed("security", f"{label}서명 설정 존재 (signingConfigs.{signing or 'release'})")
             else:
-                self.add_issue("security", "서명 설정 없음")
+                self.add_issue("security", f"{label}서명 설정 없음")
             
             # ProGuard/R8 설정 확인
-            if 'minifyEnabled true' in content:
-                self.add_passed("security", "코드 난독화 활성화됨")
+            minify = gradle.get('buildTypes.release', 'minifyEnabled')
+            if minify is True:
+                self.add_passed("security", f"{label}코드 난독화 활성화됨")
+            elif isinstance(minify, Ref):
+                self.add_warning("security", f"{label}코드 난독화 설정을 확인할 수 없음: {minify}")
             else:
-                self.add_warning("security", "코드 난독화 비활성화됨")
+                self.add_warning("security", f"{label}코드 난독화 비활성화됨")
         
         # 네트워크 보안 설정 확인
-        network_config = self.mobile_path / "android" / "app" / "src" / "main" / "res" / "xml" / "network_security_config.xml"
-        if network_config.exists():
+        if self.project.resources.has("xml", "network_security_config.xml"):
             self.add_passed("security", "네트워크 보안 설정 존재")
         else:
             self.add_warning("security", "네트워크 보안 설정 파일 없음")
@@ -272,9 +582,9 @@ class QAValidator:
         print("📋 정책 준수 검증 중...")
         
         # 개인정보처리방침 검증
-        privacy_file = self.base_path / "PRIVACY.md"
-        if privacy_file.exists():
-            content = privacy_file.read_text(encoding='utf-8')
+        privacy = self.project.document("PRIVACY.md")
+        if privacy is not None:
+            content = privacy.text
             
             required_sections = [
                 "개인정보 수집",
@@ -294,127 +604,34 @@ class QAValidator:
                 self.add_warning("compliance", f"개인정보처리방침 누락 섹션: {', '.join(missing_sections)}")
         
         # 컴플라이언스 문서 검증
-        compliance_file = self.base_path / "PLAY_STORE_COMPLIANCE.md"
-        if compliance_file.exists():
+        if self.project.document("PLAY_STORE_COMPLIANCE.md") is not None:
             self.add_passed("compliance", "Play Store 컴플라이언스 문서 존재")
         else:
             self.add_issue("compliance", "Play Store 컴플라이언스 문서 없음")
     
-    def generate_qa_report(self):
-        """QA 보고서 생성"""
+    def generate_qa_report(self, json_path=None, junit_path=None):
+        """QA 보고서 생성 (Markdown, 지정 시 JSON / JUnit XML도 저장)"""
         print("\n📊 QA 보고서 생성 중...")
         
-        total_issues = len(self.issues)
-        total_warnings = len(self.warnings)
-        total_passed = len(self.passed)
-        
-        # 심각도별 분류
-        critical_issues = [issue for issue in self.issues if issue['severity'] == 'critical']
-        error_issues = [issue for issue in self.issues if issue['severity'] == 'error']
-        
-        # 보고서 생성
-        report = f"""# SokSol Play Store 제출 전 QA 보고서
-
-생성 일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 📊 전체 요약
-
-- ✅ 통과: {total_passed}개
-- ⚠️ 경고: {total_warnings}개  
-- ❌ 오류: {total_issues}개
-- 🚨 심각: {len(critical_issues)}개
-
-## 🏆 통과 항목
-
-"""
-        
-        # 카테고리별 통과 항목
-        categories = {}
-        for item in self.passed:
-            cat = item['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(item)
-        
-        for category, items in categories.items():
-            report += f"\n### {category.title()}\n"
-            for item in items:
-                report += f"- ✅ {item['description']}\n"
-        
-        # 경고 항목
-        if self.warnings:
-            report += "\n## ⚠️ 경고 항목\n"
-            warning_categories = {}
-            for item in self.warnings:
-                cat = item['category']
-                if cat not in warning_categories:
-                    warning_categories[cat] = []
-                warning_categories[cat].append(item)
-            
-            for category, items in warning_categories.items():
-                report += f"\n### {category.title()}\n"
-                for item in items:
-                    report += f"- ⚠️ {item['description']}\n"
-        
-        # 오류 항목
-        if self.issues:
-            report += "\n## ❌ 해결 필요 항목\n"
-            issue_categories = {}
-            for item in self.issues:
-                cat = item['category']
-                if cat not in issue_categories:
-                    issue_categories[cat] = []
-                issue_categories[cat].append(item)
-            
-            for category, items in issue_categories.items():
-                report += f"\n### {category.title()}\n"
-                for item in items:
-                    severity_icon = "🚨" if item['severity'] == 'critical' else "❌"
-                    report += f"- {severity_icon} {item['description']}\n"
-        
-        # 권장사항
-        report += f"""
-
-## 🚀 제출 권장사항
-
-### Play Store 제출 가능 여부
-"""
-        
-        if len(critical_issues) > 0:
-            report += "🚨 **제출 불가**: 심각한 오류가 있습니다. 반드시 수정 후 제출하세요.\n"
-        elif len(error_issues) > 0:
-            report += "⚠️ **주의 필요**: 오류가 있지만 제출은 가능합니다. 수정을 권장합니다.\n"
-        else:
-            report += "✅ **제출 가능**: 모든 필수 요구사항을 충족합니다.\n"
-        
-        report += f"""
-
-### 다음 단계
-
-1. **오류 수정**: 위의 ❌ 항목들을 수정하세요
-2. **경고 검토**: ⚠️ 항목들을 검토하고 필요시 개선하세요
-3. **최종 테스트**: 실기기에서 앱을 테스트하세요
-4. **Play Console**: 앱을 업로드하고 메타데이터를 입력하세요
-
-### 참고 문서
-
-- `RELEASE_CHECKLIST.md`: 제출 체크리스트
-- `PLAY_CONSOLE_GUIDE.md`: Play Console 설정 가이드
-- `TROUBLESHOOTING.md`: 문제 해결 가이드
-
----
-*이 보고서는 자동으로 생성되었습니다. 추가 검토가 필요할 수 있습니다.*
-"""
-        
-        # 보고서 저장
-        report_path = self.base_path / "QA_REPORT.md"
-        report_path.write_text(report, encoding='utf-8')
-        
+        report = self.report = QAReport(self.validator_results)
+        report_path = report.write_markdown(self.base_path / "QA_REPORT.md")
         print(f"✅ QA 보고서 생성 완료: {report_path}")
+        
+        if json_path:
+            print(f"🧾 JSON 결과 저장: {report.write_json(json_path)}")
+        if junit_path:
+            print(f"🧾 JUnit XML 저장: {report.write_junit(junit_path)}")
         return report_path
     
-    def run_full_qa(self):
-        """전체 QA 실행"""
+    def run_full_qa(self, jobs=1, force=False, incremental=True, json_path=None, junit_path=None):
+        """전체 QA 실행
+
+        jobs > 1이면 검증기들을 스레드 풀에서 동시에 실행한다. 결과는 항상
+        검증기 선언 순서대로 병합되므로 보고서 내용 순서는 jobs와 무관하다.
+        incremental이면 입력이 바뀌지 않은 검증기의 이전 결과를 재사용하고,
+        force이면 모든 검증기를 다시 실행한 뒤 상태 파일을 새로 쓴다.
+        json_path / junit_path를 주면 CI용 JSON / JUnit XML 결과도 저장한다.
+        """
         print("🔍 SokSol Play Store 제출 전 QA 시작")
         print("=" * 50)
         
@@ -425,18 +642,40 @@ class QAValidator:
             self.validate_icons,
             self.validate_store_materials,
             self.validate_build_outputs,
+            self.validate_size_budget,
             self.validate_security,
             self.validate_compliance,
         ]
         
-        for validation in validations:
-            try:
-                validation()
-            except Exception as e:
-                self.add_issue("system", f"검증 중 오류: {validation.__name__} - {e}")
+        if incremental:
+            self._state = QAState(self.base_path, code=code_digest(CODE_FILES), reuse=not force)
+        
+        workers = max(1, min(jobs, len(validations)))
+        if workers == 1:
+            outcomes = [self._run_validation(validation) for validation in validations]
+        else:
+            parent = current_span()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(lambda validation: self._run_validation(validation, parent), validations))
+        
+        for validation, (results, elapsed, reused) in zip(validations, outcomes):
+            self.issues.extend(results['issues'])
+            self.warnings.extend(results['warnings'])
+            self.passed.extend(results['passed'])
+            self.artifacts.extend(results.get('artifacts', []))
+            self.timings[validation.__name__] = elapsed
+            if reused:
+                self.reused.add(validation.__name__)
+            self.validator_results.append(
+                ValidatorResult.from_buffers(validation.__name__, results, elapsed, reused))
+        
+        if self._state is not None:
+            self._state.save()
+            if self.reused:
+                print(f"♻️ 입력이 바뀌지 않은 검증 {len(self.reused)}개는 이전 결과 재사용 (--force로 전체 재실행)")
         
         # 보고서 생성
-        report_path = self.generate_qa_report()
+        report_path = self.generate_qa_report(json_path, junit_path)
         
         # 결과 요약 출력
         print("\n" + "=" * 50)
@@ -461,29 +700,45 @@ class QAValidator:
             print("\n🎉 제출 준비 완료!")
             return True
 
-def main():
-    """메인 함수"""
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="SokSol Play Store 제출 전 QA",
+                                     usage="python qa-validator.py [metadata|permissions|icons|store|build|size|security|compliance] [--jobs N] [--force] [--json PATH] [--junit PATH]")
+    parser.add_argument('command', nargs='?',
+                        choices=['metadata', 'permissions', 'icons', 'store', 'build', 'size', 'security', 'compliance'],
+                        help="단일 검증만 실행 (생략 시 전체 QA)")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, metavar='N',
+                        help="전체 QA에서 동시에 실행할 검증 수 (기본: CPU 코어 수)")
+    parser.add_argument('--force', action='store_true',
+                        help="이전 결과를 재사용하지 않고 모든 검증을 다시 실행")
+    parser.add_argument('--json', metavar='PATH', dest='json_path',
+                        help="전체 QA 결과를 JSON으로 저장 (CI 대시보드용)")
+    parser.add_argument('--junit', metavar='PATH', dest='junit_path',
+                        help="전체 QA 결과를 JUnit XML로 저장 (CI 테스트 리포트용)")
+    return parser.parse_args(argv)
+
+def run(argv=None):
+    """프로그램에서 호출하는 진입점 (master-prep 등)
+
+    ScriptResult를 반환하며 data는 QA 결과 JSON 구조(QAReport.to_dict())이다.
+    심각 오류가 없으면 성공으로 본다.
+    """
+    args = parse_args(argv)
     qa = QAValidator()
     
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-        if command == 'metadata':
-            qa.validate_app_metadata()
-        elif command == 'permissions':
-            qa.validate_permissions()
-        elif command == 'icons':
-            qa.validate_icons()
-        elif command == 'store':
-            qa.validate_store_materials()
-        elif command == 'build':
-            qa.validate_build_outputs()
-        elif command == 'security':
-            qa.validate_security()
-        elif command == 'compliance':
-            qa.validate_compliance()
-        else:
-            print("사용법: python qa-validator.py [metadata|permissions|icons|store|build|security|compliance]")
-            return 1
+    if args.command:
+        commands = {
+            'metadata': qa.validate_app_metadata,
+            'permissions': qa.validate_permissions,
+            'icons': qa.validate_icons,
+            'store': qa.validate_store_materials,
+            'build': qa.validate_build_outputs,
+            'size': qa.validate_size_budget,
+            'security': qa.validate_security,
+            'compliance': qa.validate_compliance,
+        }
+        validation = commands[args.command]
+        validation()
         
         # 단일 검증 결과 출력
         if qa.issues:
@@ -500,10 +755,22 @@ def main():
             print("✅ 통과:")
             for passed in qa.passed:
                 print(f"   - {passed['description']}")
+        
+        report = QAReport([ValidatorResult.from_buffers(validation.__name__, {
+            'issues': qa.issues, 'warnings': qa.warnings, 'passed': qa.passed, 'artifacts': qa.artifacts,
+        })])
+        success = report.verdict != 'blocked'
     else:
         # 전체 QA 실행
-        success = qa.run_full_qa()
-        return 0 if success else 1
+        success = qa.run_full_qa(args.jobs, force=args.force, json_path=args.json_path, junit_path=args.junit_path)
+        report = qa.report
+    
+    return ScriptResult("qa-validator.py", success, 0 if success else 1, report.to_dict())
+
+def main(argv=None):
+    """메인 함수"""
+    with session('qa-validator'):
+        return run(argv).exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+QA 결과 모델
+검증기별 결과를 구조화해 Markdown 보고서, JSON, JUnit XML로 저장
+
+Markdown은 결과를 한 번만 훑어 상태/카테고리별로 묶은 뒤 섹션 단위로 파일에
+바로 쓰므로, 보고서 전체를 하나의 문자열로 만들지 않는다.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+# 결과 상태 (qa-validator의 passed / warnings / issues(severity) 에 대응)
+PASSED = 'passed'
+WARNING = 'warning'
+ERROR = 'error'
+CRITICAL = 'critical'
+
+
+def format_size(size):
+    """바이트 수를 읽기 쉬운 단위로 표시"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def format_delta(delta):
+    """증감량 표시 (+1.2 MB / -340.0 KB)"""
+    return f"{'+' if delta >= 0 else '-'}{format_size(abs(delta))}"
+
+
+@dataclass(frozen=True)
+class Finding:
+    validator: str
+    status: str
+    category: str
+    description: str
+    timestamp: str = ''
+
+
+@dataclass
+class ValidatorResult:
+    name: str
+    elapsed: float = 0.0
+    reused: bool = False
+    findings: list = field(default_factory=list)
+    artifacts: list = field(default_factory=list)
+
+    @classmethod
+    def from_buffers(cls, name, results, elapsed=0.0, reused=False):
+        """QAValidator의 결과 버퍼({'issues', 'warnings', 'passed', 'artifacts'})에서 생성"""
+        findings = [Finding(name, PASSED, item['category'], item['description'], item['timestamp'])
+                    for item in results['passed']]
+        findings += [Finding(name, WARNING, item['category'], item['description'], item['timestamp'])
+                     for item in results['warnings']]
+        findings += [Finding(name, item['severity'], item['category'], item['description'], item['timestamp'])
+                     for item in results['issues']]
+        return cls(name, elapsed, reused, findings, list(results.get('artifacts', [])))
+
+    def count(self, *statuses):
+        return sum(1 for finding in self.findings if finding.status in statuses)
+
+
+class QAReport:
+    """전체 QA 실행 결과 (검증기 선언 순서 유지)"""
+
+    def __init__(self, validators, generated_at=None):
+        self.validators = list(validators)
+        self.generated_at = generated_at or datetime.now()
+
+    def findings(self):
+        for validator in self.validators:
+            yield from validator.findings
+
+    def artifacts(self):
+        for validator in self.validators:
+            yield from validator.artifacts
+
+    def counts(self):
+        counts = {PASSED: 0, WARNING: 0, ERROR: 0, CRITICAL: 0}
+        for finding in self.findings():
+            counts[finding.status] = counts.get(finding.status, 0) + 1
+        return counts
+
+    @property
+    def verdict(self):
+        """'blocked'(심각 오류), 'attention'(오류), 'ready'"""
+        counts = self.counts()
+        if counts[CRITICAL]:
+            return 'blocked'
+        if counts[ERROR]:
+            return 'attention'
+        return 'ready'
+
+    def to_dict(self):
+        return {
+            'generated_at': self.generated_at.isoformat(timespec='seconds'),
+            'verdict': self.verdict,
+            'summary': self.counts(),
+            'validators': [asdict(validator) for validator in self.validators],
+        }
+
+    def write_json(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def write_junit(self, path):
+        """JUnit XML 저장 (검증기 = testsuite, 결과 항목 = testcase)
+
+        오류는 <failure>, 심각 오류는 <error>, 경고는 통과 처리하되 <system-out>에 기록한다.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        counts = self.counts()
+        total = sum(counts.values())
+        elapsed = sum(validator.elapsed for validator in self.validators)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write(f'<testsuites name="SokSol QA" tests="{total}" failures="{counts[ERROR]}" '
+                    f'errors="{counts[CRITICAL]}" time="{elapsed:.3f}">\n')
+            for validator in self.validators:
+                f.write(f'  <testsuite name={quoteattr(validator.name)} tests="{len(validator.findings)}" '
+                        f'failures="{validator.count(ERROR)}" errors="{validator.count(CRITICAL)}" '
+                        f'skipped="0" time="{validator.elapsed:.3f}">\n')
+                if validator.reused:
+                    f.write('    <properties><property name="reused" value="true"/></properties>\n')
+                for finding in validator.findings:
+                    classname = quoteattr(f"qa.{finding.category}")
+                    name = quoteattr(finding.description)
+                    f.write(f'    <testcase classname={classname} name={name}')
+                    if finding.status == PASSED:
+                        f.write('/>\n')
+                        continue
+                    f.write('>\n')
+                    message = quoteattr(finding.description)
+                    if finding.status == ERROR:
+                        f.write(f'      <failure message={message} type="error"/>\n')
+                    elif finding.status == CRITICAL:
+                        f.write(f'      <error message={message} type="critical"/>\n')
+                    else:
+                        f.write(f'      <system-out>{escape("WARNING: " + finding.description)}</system-out>\n')
+                    f.write('    </testcase>\n')
+                f.write('  </testsuite>\n')
+            f.write('</testsuites>\n')
+        return path
+
+    def write_markdown(self, path):
+        """Markdown 보고서 저장 (결과를 한 번만 훑어 묶은 뒤 섹션별로 바로 씀)"""
+        path = Path(path)
+        # 상태 → 카테고리 → 설명 목록 (카테고리는 처음 나온 순서 유지)
+        groups = {PASSED: {}, WARNING: {}, ERROR: {}}
+        for finding in self.findings():
+            status = ERROR if finding.status == CRITICAL else finding.status
+            icon = "🚨" if finding.status == CRITICAL else None
+            groups[status].setdefault(finding.category, []).append((icon, finding.description))
+        counts = self.counts()
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"""# SokSol Play Store 제출 전 QA 보고서
+
+생성 일시: {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}
+
+## 📊 전체 요약
+
+- ✅ 통과: {counts[PASSED]}개
+- ⚠️ 경고: {counts[WARNING]}개  
+- ❌ 오류: {counts[ERROR] + counts[CRITICAL]}개
+- 🚨 심각: {counts[CRITICAL]}개
+
+## 🏆 통과 항목
+
+""")
+            self._write_groups(f, groups[PASSED], "✅")
+            if groups[WARNING]:
+                f.write("\n## ⚠️ 경고 항목\n")
+                self._write_groups(f, groups[WARNING], "⚠️")
+            if groups[ERROR]:
+                f.write("\n## ❌ 해결 필요 항목\n")
+                self._write_groups(f, groups[ERROR], "❌")
+            self._write_artifacts(f)
+            self._write_timings(f)
+            self._write_recommendations(f)
+        return path
+
+    @staticmethod
+    def _write_groups(f, categories, default_icon):
+        for category, items in categories.items():
+            f.write(f"\n### {category.title()}\n")
+            for icon, description in items:
+                f.write(f"- {icon or default_icon} {description}\n")
+
+    def _write_artifacts(self, f):
+        for artifact in self.artifacts():
+            total = sum(totals['compressed'] for totals in artifact['categories'].values()) or 1
+            f.write(f"\n## 📦 {artifact['label']} 구성 ({format_size(artifact['file_size'])}, "
+                    f"항목 {artifact['entry_count']}개)\n\n")
+            f.write("| 카테고리 | 항목 수 | 압축 크기 | 원본 크기 | 비중 |\n|----------|--------|----------|----------|------|\n")
+            for category, totals in artifact['categories'].items():
+                f.write(f"| {category} | {totals['count']} | {format_size(totals['compressed'])} | "
+                        f"{format_size(totals['size'])} | {totals['compressed'] / total:.1%} |\n")
+            f.write(f"\n상위 {len(artifact['largest'])}개 항목 (압축 크기 기준):\n\n")
+            for entry in artifact['largest']:
+                f.write(f"- `{entry['name']}` ({entry['category']}): {format_size(entry['compressed'])}\n")
+
+    def _write_timings(self, f):
+        if not self.validators:
+            return
+        reused = sum(1 for validator in self.validators if validator.reused)
+        f.write("\n## ⏱️ 검증 소요 시간\n\n")
+        if reused:
+            f.write(f"♻️ 입력이 바뀌지 않아 이전 결과를 재사용한 검증: {reused}/{len(self.validators)}개\n\n")
+        f.write("| 검증 | 소요 시간 | 결과 |\n|------|----------|------|\n")
+        for validator in self.validators:
+            source = "♻️ 재사용" if validator.reused else "실행"
+            f.write(f"| {validator.name} | {validator.elapsed * 1000:.1f} ms | {source} |\n")
+        total = sum(validator.elapsed for validator in self.validators)
+        f.write(f"| **합계** | {total * 1000:.1f} ms | |\n")
+
+    def _write_recommendations(self, f):
+        f.write("""
+
+## 🚀 제출 권장사항
+
+### Play Store 제출 가능 여부
+""")
+        verdict = self.verdict
+        if verdict == 'blocked':
+            f.write("🚨 **제출 불가**: 심각한 오류가 있습니다. 반드시 수정 후 제출하세요.\n")
+        elif verdict == 'attention':
+            f.write("⚠️ **주의 필요**: 오류가 있지만 제출은 가능합니다. 수정을 권장합니다.\n")
+        else:
+            f.write("✅ **제출 가능**: 모든 필수 요구사항을 충족합니다.\n")
+
+        f.write("""
+
+### 다음 단계
+
+1. **오류 수정**: 위의 ❌ 항목들을 수정하세요
+2. **경고 검토**: ⚠️ 항목들을 검토하고 필요시 개선하세요
+3. **최종 테스트**: 실기기에서 앱을 테스트하세요
+4. **Play Console**: 앱을 업로드하고 메타데이터를 입력하세요
+
+### 참고 문서
+
+- `RELEASE_CHECKLIST.md`: 제출 체크리스트
+- `PLAY_CONSOLE_GUIDE.md`: Play Console 설정 가이드
+- `TROUBLESHOOTING.md`: 문제 해결 가이드
+
+---
+*이 보고서는 자동으로 생성되었습니다. 추가 검토가 필요할 수 있습니다.*
+""")
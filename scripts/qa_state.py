@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+증분 QA 상태 파일
+검증기별 입력 파일의 해시와 이전 결과를 .cache/qa-state.json에 저장해,
+입력이 바뀌지 않은 검증기는 다시 실행하지 않고 이전 결과를 재사용
+
+크기와 mtime이 이전과 같으면 저장된 해시를 그대로 사용하므로
+변경되지 않은 파일은 다시 읽지 않는다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from asset_cache import file_digest
+
+BASE_PATH = Path(__file__).parent.parent
+DEFAULT_STATE_PATH = BASE_PATH / ".cache" / "qa-state.json"
+STATE_VERSION = 1
+
+
+def code_digest(paths):
+    """검증 코드 자체의 해시 (스크립트가 바뀌면 모든 결과를 무효화)"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(bytes.fromhex(file_digest(path)))
+    return digest.hexdigest()
+
+
+class QAState:
+    """검증기 이름 → {fingerprint, files, results} 저장소"""
+
+    def __init__(self, base_path=BASE_PATH, state_path=DEFAULT_STATE_PATH, code='', reuse=True):
+        self.base_path = Path(base_path)
+        self.state_path = Path(state_path)
+        self.code = code
+        self._lock = threading.Lock()
+        # reuse=False이면 이전 결과를 무시하고 이번 실행 결과로 상태를 새로 씀
+        self._previous = self._load() if reuse else {}
+        self._current = {}
+
+    def _load(self):
+        try:
+            state = json.loads(self.state_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if state.get('version') != STATE_VERSION or state.get('code') != self.code:
+            return {}
+        return state.get('validators', {})
+
+    def expand(self, patterns):
+        """입력 glob 목록을 저장소 기준 상대 경로 목록으로 확장"""
+        paths = set()
+        for pattern in patterns:
+            for path in self.base_path.glob(pattern):
+                if path.is_file():
+                    paths.add(path.relative_to(self.base_path).as_posix())
+        return sorted(paths)
+
+    def fingerprint(self, name, patterns, extra=''):
+        """입력 파일 전체의 지문 계산 → (fingerprint, 파일별 메타데이터)
+
+        extra는 파일이 아닌 입력(크기 이력 DB의 직전 릴리스 기록 등)의 해시다.
+        """
+        known = self._previous.get(name, {}).get('files', {})
+        files = {}
+        digest = hashlib.sha256(self.code.encode('utf-8'))
+        for relative in self.expand(patterns):
+            stat = (self.base_path / relative).stat()
+            entry = known.get(relative)
+            if not entry or entry['size'] != stat.st_size or entry['mtime_ns'] != stat.st_mtime_ns:
+                entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                         'sha256': file_digest(self.base_path / relative)}
+            files[relative] = entry
+            digest.update(f"{relative}\0{entry['sha256']}\0".encode('utf-8'))
+        digest.update(extra.encode('utf-8'))
+        return digest.hexdigest(), files
+
+    def lookup(self, name, fingerprint):
+        """지문이 같으면 이전 결과, 아니면 None"""
+        entry = self._previous.get(name)
+        if entry and entry.get('fingerprint') == fingerprint:
+            return entry['results']
+        return None
+
+    def store(self, name, fingerprint, files, results):
+        with self._lock:
+            self._current[name] = {'fingerprint': fingerprint, 'files': files, 'results': results}
+
+    def save(self):
+        """이번 실행 결과로 상태 파일 갱신 (임시 파일 후 교체)"""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        state = {'version': STATE_VERSION, 'code': self.code, 'validators': self._current}
+        temp_path = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding='utf-8')
+        os.replace(temp_path, self.state_path)
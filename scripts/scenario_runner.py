@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+스크린샷 시나리오 실행기
+시나리오 파일(JSON)에 선언된 단계(탭/키 입력/딥링크/화면 안정화 대기/캡처)를
+사람의 입력 없이 실행 (CI의 에뮬레이터나 가짜 adb로도 실행 가능)
+
+고정 sleep 대신 화면 프레임 해시가 일정 시간 변하지 않을 때까지 폴링한다.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from adb_capture import AdbError, capture_frame, decode_frame, run_adb
+
+DEFAULT_SETTLE = {
+    'stable_ms': 500,     # 이 시간 동안 프레임이 같으면 안정 상태로 판단
+    'timeout_ms': 10000,  # 최대 대기 시간
+    'interval_ms': 100,   # 프레임 확인 간격
+}
+
+
+class ScenarioError(RuntimeError):
+    """시나리오 파일 또는 단계 실행 오류"""
+
+
+def load_scenarios(scenario_path):
+    """시나리오 파일 로드 및 기본 검증"""
+    config = json.loads(Path(scenario_path).read_text(encoding='utf-8'))
+    scenarios = config.get('scenarios', [])
+    if not scenarios:
+        raise ScenarioError(f"시나리오가 없습니다: {scenario_path}")
+
+    for scenario in scenarios:
+        if 'key' not in scenario:
+            raise ScenarioError("모든 시나리오에는 key가 필요합니다")
+        for step in scenario.get('steps', []):
+            if step.get('action') not in ScenarioRunner.ACTIONS:
+                raise ScenarioError(f"{scenario['key']}: 알 수 없는 단계 '{step.get('action')}' "
+                                    f"(사용 가능: {', '.join(ScenarioRunner.ACTIONS)})")
+    return config
+
+
+def wait_for_stable_frame(device_id, stable_ms, timeout_ms, interval_ms):
+    """프레임 해시가 stable_ms 동안 변하지 않을 때까지 대기
+
+    (안정 여부, 마지막 raw 프레임 바이트, 경과 초)를 반환한다.
+    마지막 프레임은 바로 이어지는 캡처 단계에서 재사용할 수 있다.
+    """
+    started = time.perf_counter()
+    deadline = started + timeout_ms / 1000
+    last_hash = None
+    stable_since = None
+    data = None
+
+    while True:
+        data = capture_frame(device_id, raw=True)
+        now = time.perf_counter()
+        frame_hash = hashlib.blake2b(data, digest_size=16).digest()
+
+        if frame_hash != last_hash:
+            last_hash = frame_hash
+            stable_since = now
+        elif (now - stable_since) * 1000 >= stable_ms:
+            return True, data, now - started
+
+        if now >= deadline:
+            return False, data, now - started
+        time.sleep(interval_ms / 1000)
+
+
+class ScenarioRunner:
+    """한 디바이스에서 시나리오 목록을 순서대로 실행
+
+    capture 단계마다 on_capture(device_id, key, image, data)를 호출한다.
+    data는 캐시 키용 프레임 바이트이다 (raw=True이거나 wait_idle 직후면 raw, 아니면 PNG).
+    capture 단계의 'raw' 값이 없으면 raw를 사용한다. 단계나 on_capture에서 난 오류는 그 시나리오의
+    실패로 기록하고 다음 시나리오를 계속 실행한다 (다른 디바이스의 실행에도 영향 없음).
+    """
+
+    ACTIONS = ('launch', 'deeplink', 'tap', 'swipe', 'text', 'keyevent', 'wait_idle', 'sleep', 'capture')
+
+    def __init__(self, device_id, config, on_capture, log=print, raw=True):
+        self.device_id = device_id
+        self.raw = raw
+        self.package = config.get('package')
+        self.activity = config.get('activity')
+        self.settle = dict(DEFAULT_SETTLE, **config.get('settle', {}))
+        self.on_capture = on_capture
+        self.log = log
+        self._stable_frame = None
+
+    def run(self, scenarios):
+        """시나리오를 실행하고 시나리오별 결과 목록 반환
+
+        결과: {'key', 'ok', 'elapsed', 'settle_time', 'captures', 'error'}
+        """
+        results = []
+        for scenario in scenarios:
+            started = time.perf_counter()
+            result = {'key': scenario['key'], 'ok': True, 'settle_time': 0.0, 'captures': [], 'error': None}
+            try:
+                for step in scenario.get('steps', []):
+                    self._run_step(step, scenario, result)
+            except Exception as e:
+                # 저장/리사이즈(OSError, PIL 오류)나 단계 필드 누락(KeyError)도 시나리오 실패로 기록
+                error = str(e) if isinstance(e, (AdbError, ScenarioError)) else f"{type(e).__name__}: {e}"
+                result['ok'] = False
+                result['error'] = error
+                self.log(f"❌ [{self.device_id}] {scenario['key']}: {error}")
+            result['elapsed'] = time.perf_counter() - started
+            results.append(result)
+        return results
+
+    def _run_step(self, step, scenario, result):
+        action = step['action']
+        if action != 'capture':
+            # 화면을 바꿀 수 있는 단계 뒤에는 안정화된 프레임을 재사용하지 않음
+            self._stable_frame = None
+
+        if action == 'launch':
+            package = step.get('package', self.package)
+            activity = step.get('activity', self.activity)
+            if not package:
+                raise ScenarioError("launch 단계에는 package가 필요합니다")
+            if activity:
+                run_adb(self.device_id, 'shell', 'am', 'start', '-W', '-n', f"{package}/{activity}")
+            else:
+                run_adb(self.device_id, 'shell', 'monkey', '-p', package,
+                        '-c', 'android.intent.category.LAUNCHER', '1')
+        elif action == 'deeplink':
+            args = ['shell', 'am', 'start', '-W', '-a', 'android.intent.action.VIEW', '-d', step['uri']]
+            package = step.get('package', self.package)
+            if package:
+                args.append(package)
+            run_adb(self.device_id, *args)
+        elif action == 'tap':
+            run_adb(self.device_id, 'shell', 'input', 'tap', str(step['x']), str(step['y']))
+        elif action == 'swipe':
+            run_adb(self.device_id, 'shell', 'input', 'swipe', str(step['x1']), str(step['y1']),
+                    str(step['x2']), str(step['y2']), str(step.get('duration_ms', 300)))
+        elif action == 'text':
+            # adb input text는 공백을 %s로 받으며 ASCII만 지원
+            run_adb(self.device_id, 'shell', 'input', 'text', step['value'].replace(' ', '%s'))
+        elif action == 'keyevent':
+            run_adb(self.device_id, 'shell', 'input', 'keyevent', str(step['code']))
+        elif action == 'sleep':
+            time.sleep(step['ms'] / 1000)
+        elif action == 'wait_idle':
+            settle = dict(self.settle, **{name: step[name] for name in DEFAULT_SETTLE if name in step})
+            stable, data, elapsed = wait_for_stable_frame(self.device_id, settle['stable_ms'],
+                                                          settle['timeout_ms'], settle['interval_ms'])
+            result['settle_time'] += elapsed
+            if not stable:
+                if step.get('required', False):
+                    raise ScenarioError(f"화면이 {settle['timeout_ms']}ms 안에 안정되지 않았습니다")
+                self.log(f"⚠️  [{self.device_id}] {scenario['key']}: 화면 안정화 시간 초과, 계속 진행")
+            self._stable_frame = data
+        elif action == 'capture':
+            key = step.get('name', scenario['key'])
+            if self._stable_frame is not None:
+                # 직전 wait_idle에서 받은 안정 프레임을 그대로 사용 (추가 캡처 없음)
+                data, raw = self._stable_frame, True
+            else:
+                raw = step.get('raw', self.raw)
+                data = capture_frame(self.device_id, raw=raw)
+            image = decode_frame(data, raw)
+            result['captures'].append(self.on_capture(self.device_id, key, image, data))
@@ -7,23 +7,32 @@ Play Store용 스크린샷을 자동으로 생성하고 편집
 import os
 import sys
 import time
-import subprocess
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from adb_capture import AdbError, capture_frame, classify_form_factor, decode_frame, run_adb, screen_info
+from asset_cache import ArtifactCache
+from asset_specs import FORM_FACTOR_TARGETS, SCREENSHOT_TARGETS
+from scenario_runner import ScenarioError, ScenarioRunner, load_scenarios
+from script_runner import ScriptResult
+from screenshot_normalizer import ScreenshotNormalizer
+from tracing import session
+
 def check_adb():
     """ADB가 설치되고 사용 가능한지 확인"""
     try:
-        result = subprocess.run(['adb', 'version'], capture_output=True, text=True)
-        return result.returncode == 0
-    except FileNotFoundError:
+        run_adb(None, 'version')
+        return True
+    except AdbError:
         return False
 
 def get_connected_devices():
     """연결된 Android 디바이스 목록 가져오기"""
     try:
-        result = subprocess.run(['adb', 'devices'], capture_output=True, text=True)
-        lines = result.stdout.strip().split('\n')[1:]  # 첫 번째 줄은 헤더
+        output = run_adb(None, 'devices').decode('utf-8', 'replace')
+        lines = output.strip().split('\n')[1:]  # 첫 번째 줄은 헤더
         devices = []
         for line in lines:
             if line.strip() and 'device' in line:
@@ -34,79 +43,231 @@ def get_connected_devices():
         print(f"❌ 디바이스 목록을 가져오는데 실패했습니다: {e}")
         return []
 
-def take_screenshot(device_id, output_path, description=""):
-    """스크린샷 촬영"""
+def screenshot_filename(description=""):
+    """타임스탬프가 들어간 스크린샷 파일 이름"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"screenshot_{timestamp}_{description}.png" if description else f"screenshot_{timestamp}.png"
-    full_output_path = Path(output_path) / filename
+    return f"screenshot_{timestamp}_{description}.png" if description else f"screenshot_{timestamp}.png"
+
+def save_capture(output_path, description, image, data, raw):
+    """캡처한 프레임을 원본 파일로 저장 (PNG 캡처는 받은 바이트를 그대로 기록)"""
+    full_output_path = Path(output_path) / screenshot_filename(description)
     
     # 출력 디렉토리 생성
     full_output_path.parent.mkdir(parents=True, exist_ok=True)
+    if raw:
+        image.save(full_output_path, 'PNG')
+    else:
+        full_output_path.write_bytes(data)
     
+    print(f"✅ 스크린샷 저장: {full_output_path}")
+    return str(full_output_path)
+
+def capture_screenshot(device_id, output_path, description="", raw=False):
+    """스크린샷을 메모리로 스트리밍 촬영하고 (저장 경로, 이미지, 원본 바이트) 반환
+
+    `adb exec-out screencap`으로 프레임버퍼를 표준 출력으로 받으므로 디바이스에
+    임시 파일을 쓰거나 pull/rm 왕복을 하지 않는다. raw=True이면 디바이스의
+    PNG 압축을 건너뛰고 PC에서 한 번만 PNG로 인코딩한다.
+    """
     try:
-        # 디바이스에서 스크린샷 촬영
-        temp_path = f"/sdcard/screenshot_{timestamp}.png"
-        
-        # 스크린샷 촬영
-        result1 = subprocess.run(['adb', '-s', device_id, 'shell', 'screencap', '-p', temp_path], 
-                               capture_output=True, text=True)
-        
-        if result1.returncode != 0:
-            print(f"❌ 스크린샷 촬영 실패: {result1.stderr}")
-            return None
-        
-        # PC로 파일 복사
-        result2 = subprocess.run(['adb', '-s', device_id, 'pull', temp_path, str(full_output_path)], 
-                               capture_output=True, text=True)
-        
-        if result2.returncode != 0:
-            print(f"❌ 파일 복사 실패: {result2.stderr}")
-            return None
-        
-        # 디바이스에서 임시 파일 삭제
-        subprocess.run(['adb', '-s', device_id, 'shell', 'rm', temp_path], 
-                      capture_output=True, text=True)
-        
-        print(f"✅ 스크린샷 저장: {full_output_path}")
-        return str(full_output_path)
+        data = capture_frame(device_id, raw)
+        image = decode_frame(data, raw)
+        return save_capture(output_path, description, image, data, raw), image, data
         
     except Exception as e:
         print(f"❌ 스크린샷 촬영 중 오류: {e}")
-        return None
+        return None, None, None
+
+def take_screenshot(device_id, output_path, description="", raw=False):
+    """스크린샷 촬영 (저장 경로 반환)"""
+    path, _, _ = capture_screenshot(device_id, output_path, description, raw)
+    return path
+
+def detect_form_factors(devices):
+    """모든 디바이스의 폼팩터를 동시에 조회 → {device_id: form_factor}"""
+    def detect(device_id):
+        try:
+            return classify_form_factor(*screen_info(device_id))
+        except (AdbError, ValueError, IndexError) as e:
+            print(f"⚠️  {device_id} 화면 정보 조회 실패, phone으로 간주: {e}")
+            return 'phone'
+    
+    with ThreadPoolExecutor(max_workers=max(1, len(devices))) as pool:
+        return dict(zip(devices, pool.map(detect, devices)))
 
-def resize_for_play_store(image_path, output_dir):
-    """Play Store 요구사항에 맞게 이미지 리사이즈"""
+def device_output_dir(output_dir, device_id, form_factor):
+    """디바이스별 출력 경로: <output_dir>/<form_factor>/<device_id>"""
+    safe_id = device_id.replace(':', '_').replace('/', '_')
+    return Path(output_dir) / form_factor / safe_id
+
+def capture_on_all_devices(devices, form_factors, output_dir, playstore_dir, key,
+                           raw=False, cache=None, timings=None):
+    """같은 시나리오를 모든 디바이스에서 동시에 촬영하고 정규화
+
+    디바이스 순서대로 (device_id, 원본 경로, Play Store용 경로) 목록을 반환한다.
+    timings가 주어지면 {device_id: [(캡처 초, 정규화 초), ...]}에 소요 시간을 기록한다.
+    """
+    def capture(device_id):
+        form_factor = form_factors[device_id]
+        normalizer = ScreenshotNormalizer((FORM_FACTOR_TARGETS[form_factor],), target_dirs=False)
+        started = time.perf_counter()
+        path, image, data = capture_screenshot(device_id, device_output_dir(output_dir, device_id, form_factor),
+                                               key, raw)
+        captured = time.perf_counter()
+        playstore_path = None
+        if path:
+            playstore_path = resize_for_play_store(path, device_output_dir(playstore_dir, device_id, form_factor),
+                                                   cache, normalizer, image, data)
+        finished = time.perf_counter()
+        return device_id, path, playstore_path, captured - started, finished - captured
+    
+    with ThreadPoolExecutor(max_workers=max(1, len(devices))) as pool:
+        results = list(pool.map(capture, devices))
+    
+    if timings is not None:
+        for device_id, _, _, capture_time, normalize_time in results:
+            timings.setdefault(device_id, []).append((capture_time, normalize_time))
+    return [(device_id, path, playstore_path) for device_id, path, playstore_path, _, _ in results]
+
+def print_timing_report(timings, form_factors):
+    """디바이스별 촬영 소요 시간 보고"""
+    print("\n⏱️  디바이스별 소요 시간:")
+    print(f"   {'디바이스':<24} {'폼팩터':<10} {'촬영':>4} {'평균 캡처':>10} {'평균 정규화':>10} {'합계':>8}")
+    for device_id, samples in timings.items():
+        count = len(samples)
+        capture_avg = sum(sample[0] for sample in samples) / count
+        normalize_avg = sum(sample[1] for sample in samples) / count
+        total = sum(sample[0] + sample[1] for sample in samples)
+        print(f"   {device_id:<24} {form_factors.get(device_id, '-'):<10} {count:>4} "
+              f"{capture_avg * 1000:>8.0f}ms {normalize_avg * 1000:>8.0f}ms {total:>7.2f}s")
+
+def resize_for_play_store(image_path, output_dir, cache=None, normalizer=None, image=None, data=None):
+    """Play Store 요구사항에 맞게 이미지 리사이즈
+
+    cache를 넘기면 원본이 바뀌지 않은 스크린샷은 다시 변환하지 않는다.
+    방금 캡처한 image/data를 넘기면 디스크에서 다시 읽지 않는다.
+    phone(1080x1920) 결과 경로를 반환한다.
+    """
     try:
-        # ImageMagick 사용
-        input_path = Path(image_path)
-        output_path = Path(output_dir) / f"playstore_{input_path.name}"
+        normalizer = normalizer or ScreenshotNormalizer()
         
-        # Play Store 권장 크기: 1080x1920 (16:9 비율)
-        cmd = [
-            'convert',
-            str(input_path),
-            '-resize', '1080x1920',
-            '-gravity', 'center',
-            '-background', 'white',
-            '-extent', '1080x1920',
-            str(output_path)
-        ]
+        # Play Store 권장 크기: 1080x1920 (16:9 비율), 흰 배경으로 가운데 정렬
+        results = normalizer.normalize_file(image_path, output_dir, cache, image, data)
+        for target, (output_path, outcome) in results.items():
+            if outcome == 'built':
+                print(f"✅ Play Store용 리사이즈 완료: {output_path}")
+            else:
+                print(f"♻️  변경 없음, 캐시 사용: {output_path}")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ Play Store용 리사이즈 완료: {output_path}")
-            return str(output_path)
-        else:
-            print(f"❌ 리사이즈 실패: {result.stderr}")
-            return None
+        output_path, _ = results.get('phone', next(iter(results.values())))
+        return str(output_path)
             
-    except FileNotFoundError:
-        print("❌ ImageMagick이 설치되지 않았습니다.")
-        print("설치: winget install ImageMagick.ImageMagick")
+    except (OSError, ValueError) as e:
+        print(f"❌ 리사이즈 실패: {e}")
         return None
 
-def interactive_screenshot_session():
-    """대화형 스크린샷 촬영 세션"""
+def normalize_screenshots(input_dir, output_dir, targets=('phone',), use_cache=True, jobs=1, outputs=None):
+    """디렉토리의 스크린샷을 일괄 정규화 (한 번 디코딩으로 여러 대상 크기 생성)
+
+    outputs가 주어지면 생성한 파일 경로를 추가한다.
+    """
+    normalizer = ScreenshotNormalizer(targets)
+    cache = ArtifactCache(enabled=use_cache)
+    
+    print(f"🖼️  스크린샷 일괄 정규화: {input_dir} → {output_dir}")
+    print(f"   대상: {', '.join(f'{t} {SCREENSHOT_TARGETS[t][0]}x{SCREENSHOT_TARGETS[t][1]}' for t in targets)}")
+    
+    failed = 0
+    results = normalizer.normalize_directory(input_dir, output_dir, cache, jobs)
+    for source_path, result in results:
+        if isinstance(result, str):
+            failed += 1
+            print(f"❌ 정규화 실패: {source_path.name} ({result})")
+            continue
+        for target, (output_path, outcome) in result.items():
+            icon = "✅" if outcome == 'built' else "♻️ "
+            print(f"{icon} {source_path.name} → {output_path}")
+            if outputs is not None:
+                outputs.append(str(output_path))
+    
+    print(f"\n📊 정규화 완료: {len(results) - failed}/{len(results)}개")
+    return failed == 0
+
+def run_scenario_file(scenario_path, all_devices=False, device_id=None, use_cache=True, raw=False,
+                      results=None):
+    """시나리오 파일을 사람의 입력 없이 실행 (CI/CD용 자동 모드)
+
+    all_devices가 True이면 연결된 모든 디바이스에서 시나리오를 동시에 실행한다.
+    raw가 True이면 capture 단계를 raw 프레임버퍼로 캡처한다 (단계의 'raw' 값이 우선).
+    results가 주어지면 {device_id: 시나리오별 결과 목록}을 기록한다 (ScenarioRunner.run 결과).
+    """
+    print(f"🤖 시나리오 자동 촬영: {scenario_path}")
+    try:
+        config = load_scenarios(scenario_path)
+    except (OSError, ValueError, ScenarioError) as e:
+        print(f"❌ 시나리오 파일 오류: {e}")
+        return False
+    
+    if not check_adb():
+        print("❌ ADB가 설치되지 않았거나 PATH에 없습니다.")
+        return False
+    
+    devices = get_connected_devices()
+    if device_id:
+        devices = [device for device in devices if device == device_id]
+    elif not all_devices:
+        devices = devices[:1]
+    if not devices:
+        print("❌ 사용할 Android 디바이스가 없습니다.")
+        return False
+    
+    base_path = Path(__file__).parent.parent
+    output_dir = base_path / "assets" / "store" / "screenshots"
+    playstore_dir = output_dir / "playstore"
+    form_factors = detect_form_factors(devices) if all_devices else {}
+    cache = ArtifactCache(enabled=use_cache)
+    
+    def on_capture(device, key, image, data):
+        if all_devices:
+            form_factor = form_factors[device]
+            normalizer = ScreenshotNormalizer((FORM_FACTOR_TARGETS[form_factor],), target_dirs=False)
+            path = save_capture(device_output_dir(output_dir, device, form_factor), key, image, data, True)
+            target_dir = device_output_dir(playstore_dir, device, form_factor)
+        else:
+            normalizer = None
+            path = save_capture(output_dir, key, image, data, True)
+            target_dir = playstore_dir
+        return path, resize_for_play_store(path, target_dir, cache, normalizer, image, data)
+    
+    def run(device):
+        return ScenarioRunner(device, config, on_capture, raw=raw).run(config['scenarios'])
+    
+    with ThreadPoolExecutor(max_workers=len(devices)) as pool:
+        device_results = dict(zip(devices, pool.map(run, devices)))
+    if results is not None:
+        results.update(device_results)
+    
+    # 디바이스/시나리오별 결과 요약
+    print("\n⏱️  시나리오 소요 시간 (안정화 대기 포함):")
+    failed = 0
+    for device, scenario_results in device_results.items():
+        for result in scenario_results:
+            icon = "✅" if result['ok'] else "❌"
+            failed += 0 if result['ok'] else 1
+            print(f"   {icon} {device} / {result['key']}: {result['elapsed']:.2f}s "
+                  f"(안정화 {result['settle_time']:.2f}s, 캡처 {len(result['captures'])}개)")
+    
+    total = sum(len(scenario_results) for scenario_results in device_results.values())
+    print(f"\n📊 시나리오 완료: {total - failed}/{total}")
+    return failed == 0
+
+def interactive_screenshot_session(use_cache=True, raw=False, all_devices=False, captured=None):
+    """대화형 스크린샷 촬영 세션
+
+    all_devices가 True이면 디바이스를 고르지 않고 연결된 모든 디바이스에서
+    시나리오마다 동시에 촬영한다 (결과는 폼팩터/디바이스별 폴더에 저장).
+    captured가 주어지면 (제목, 원본 경로, Play Store용 경로)를 촬영한 순서대로 추가한다.
+    """
     print("📱 SokSol 앱 스크린샷 자동 촬영")
     print("=" * 40)
     
@@ -130,7 +291,15 @@ def interactive_screenshot_session():
         print(f"   {i+1}. {device}")
     
     # 디바이스 선택
-    if len(devices) == 1:
+    selected_device = None
+    form_factors = {}
+    timings = {}
+    if all_devices:
+        form_factors = detect_form_factors(devices)
+        print("모든 디바이스에서 동시에 촬영합니다:")
+        for device_id, form_factor in form_factors.items():
+            print(f"   - {device_id}: {form_factor}")
+    elif len(devices) == 1:
         selected_device = devices[0]
         print(f"디바이스 자동 선택: {selected_device}")
     else:
@@ -152,6 +321,7 @@ def interactive_screenshot_session():
     
     print(f"\n📁 스크린샷 저장 경로: {output_dir}")
     print(f"📁 Play Store용 저장 경로: {playstore_dir}")
+    cache = ArtifactCache(enabled=use_cache)
     
     # 스크린샷 촬영 시나리오
     scenarios = [
@@ -174,7 +344,7 @@ def interactive_screenshot_session():
     
     input("\n📱 SokSol 앱을 열고 준비가 되면 Enter를 누르세요...")
     
-    captured_screenshots = []
+    captured_screenshots = captured if captured is not None else []
     
     for i, (key, title, desc) in enumerate(scenarios):
         print(f"\n🎯 시나리오 {i+1}/{len(scenarios)}: {title}")
@@ -190,16 +360,25 @@ def interactive_screenshot_session():
                 print("⏭️  스킵합니다.")
                 break
             elif user_input == '':
+                if all_devices:
+                    results = capture_on_all_devices(devices, form_factors, output_dir, playstore_dir, key,
+                                                     raw, cache, timings)
+                    for device_id, screenshot_path, playstore_path in results:
+                        if screenshot_path and playstore_path:
+                            captured_screenshots.append((f"{title} [{device_id}]", screenshot_path, playstore_path))
+                    print(f"✅ {title} 촬영 완료 ({len(devices)}개 디바이스)")
+                    break
+                
                 # 스크린샷 촬영
-                screenshot_path = take_screenshot(selected_device, output_dir, key)
+                screenshot_path, image, data = capture_screenshot(selected_device, output_dir, key, raw)
                 if screenshot_path:
-                    # Play Store용 리사이즈
-                    playstore_path = resize_for_play_store(screenshot_path, playstore_dir)
+                    # Play Store용 리사이즈 (캡처한 이미지를 메모리에서 바로 사용)
+                    playstore_path = resize_for_play_store(screenshot_path, playstore_dir, cache,
+                                                           image=image, data=data)
                     if playstore_path:
                         captured_screenshots.append((title, screenshot_path, playstore_path))
                     
                     print(f"✅ {title} 촬영 완료")
-                    time.sleep(1)  # 잠시 대기
                 break
             else:
                 print("Enter, 's', 또는 'q'를 입력하세요.")
@@ -208,6 +387,8 @@ def interactive_screenshot_session():
             break
     
     # 결과 요약
+    if timings:
+        print_timing_report(timings, form_factors)
     print(f"\n📊 촬영 완료: {len(captured_screenshots)}개")
     for title, original, playstore in captured_screenshots:
         print(f"   ✅ {title}")
@@ -226,16 +407,65 @@ def interactive_screenshot_session():
         print("❌ 촬영된 스크린샷이 없습니다.")
         return False
 
-def main():
-    """메인 함수"""
-    if len(sys.argv) > 1 and sys.argv[1] == '--auto':
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    base_path = Path(__file__).parent.parent
+    screenshots_dir = base_path / "assets" / "store" / "screenshots"
+    
+    parser = argparse.ArgumentParser(description="SokSol 스크린샷 촬영 및 편집 도구")
+    parser.add_argument('--auto', action='store_true',
+                        help="시나리오 파일로 사람의 입력 없이 촬영 (CI/CD용)")
+    parser.add_argument('--scenario', default=str(Path(__file__).parent / "screenshot_scenarios.json"),
+                        metavar='JSON', help="자동 모드 시나리오 파일 (기본: scripts/screenshot_scenarios.json)")
+    parser.add_argument('--device', metavar='ID', help="자동 모드에서 사용할 디바이스 (기본: 첫 번째 디바이스)")
+    parser.add_argument('--normalize', nargs='?', const=str(screenshots_dir), metavar='DIR',
+                        help="촬영 없이 디렉토리의 스크린샷을 일괄 정규화 (기본: assets/store/screenshots)")
+    parser.add_argument('--output', metavar='DIR', help="정규화 결과 디렉토리 (기본: <DIR>/playstore)")
+    parser.add_argument('--targets', default='phone',
+                        help=f"정규화 대상 크기, 쉼표 구분 ({', '.join(SCREENSHOT_TARGETS)})")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, metavar='N',
+                        help="일괄 정규화 병렬 스레드 수 (기본: CPU 코어 수)")
+    parser.add_argument('--no-cache', action='store_true', help="리사이즈 캐시 비활성화")
+    parser.add_argument('--raw', action='store_true',
+                        help="디바이스 PNG 압축 없이 raw 프레임버퍼로 캡처 (더 빠름)")
+    parser.add_argument('--all-devices', action='store_true',
+                        help="연결된 모든 디바이스에서 시나리오마다 동시에 촬영")
+    return parser.parse_args(argv)
+
+def run(argv=None):
+    """프로그램에서 호출하는 진입점 (master-prep 등)
+
+    ScriptResult를 반환하며 data에 실행한 모드와 모드별 결과가 들어간다
+    (normalize: 생성한 파일, auto: 디바이스별 시나리오 결과, interactive: 촬영한 스크린샷).
+    """
+    args = parse_args(argv)
+    
+    if args.normalize:
+        targets = [target.strip() for target in args.targets.split(',') if target.strip()]
+        output_dir = args.output or str(Path(args.normalize) / "playstore")
+        data = {'mode': 'normalize', 'input': args.normalize, 'output': output_dir, 'targets': targets,
+                'outputs': []}
+        try:
+            success = normalize_screenshots(args.normalize, output_dir, targets, not args.no_cache, args.jobs,
+                                            data['outputs'])
+        except ValueError as e:
+            print(f"❌ {e}")
+            success = False
+    elif args.auto:
         # 자동 모드 (CI/CD용)
-        print("🤖 자동 모드는 아직 구현되지 않았습니다.")
-        print("수동 모드를 사용하세요: python scripts/screenshot-automation.py")
-        return 1
+        data = {'mode': 'auto', 'scenario': args.scenario, 'devices': {}}
+        success = run_scenario_file(args.scenario, args.all_devices, args.device, not args.no_cache, args.raw,
+                                    data['devices'])
     else:
-        # 대화형 모드
-        return 0 if interactive_screenshot_session() else 1
+        # 대화형 모드 (--no-cache: 리사이즈 캐시 비활성화)
+        data = {'mode': 'interactive', 'captures': []}
+        success = interactive_screenshot_session(not args.no_cache, args.raw, args.all_devices, data['captures'])
+    return ScriptResult("screenshot-automation.py", success, 0 if success else 1, data)
+
+def main(argv=None):
+    """메인 함수"""
+    with session('screenshot-automation'):
+        return run(argv).exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+스크린샷 정규화 엔진
+ImageMagick `-resize WxH -gravity center -background white -extent WxH`와 같은 동작을
+Pillow로 프로세스 내부에서 수행 (한 번 디코딩으로 여러 대상 크기 생성)
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from asset_specs import SCREENSHOT_TARGETS
+
+# 캐시 키에 들어가는 렌더러 버전 (동작이 바뀌면 올릴 것)
+RENDERER_VERSION = 'pillow-normalizer-1'
+SCREENSHOT_PATTERNS = ('*.png', '*.jpg', '*.jpeg')
+
+
+def fit_size(source_size, target_size):
+    """비율을 유지하며 대상 크기 안에 들어가는 최대 크기 (확대 포함)"""
+    width, height = source_size
+    target_width, target_height = target_size
+    scale = min(target_width / width, target_height / height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+class ScreenshotNormalizer:
+    """스크린샷을 대상 크기로 리사이즈 후 가운데 정렬해 배경으로 채움
+
+    대상 크기별 캔버스는 스레드마다 한 번만 만들고 재사용한다.
+    normalize()가 반환하는 이미지는 다음 호출에서 덮어쓰이므로 바로 저장해야 한다.
+    """
+
+    def __init__(self, targets=('phone',), background='white', target_dirs=True):
+        unknown = [target for target in targets if target not in SCREENSHOT_TARGETS]
+        if unknown:
+            raise ValueError(f"알 수 없는 대상 크기: {', '.join(unknown)} "
+                             f"(사용 가능: {', '.join(SCREENSHOT_TARGETS)})")
+        self.targets = tuple(targets)
+        self.background = background
+        self.target_dirs = target_dirs
+        self._local = threading.local()
+
+    def _canvas(self, size):
+        canvases = getattr(self._local, 'canvases', None)
+        if canvases is None:
+            canvases = self._local.canvases = {}
+        canvas = canvases.get(size)
+        if canvas is None:
+            canvas = canvases[size] = Image.new('RGB', size, self.background)
+        else:
+            canvas.paste(self.background, (0, 0) + size)
+        return canvas
+
+    def normalize_image(self, image, target):
+        """이미지 하나를 대상 크기로 정규화 (재사용 캔버스 반환)"""
+        size = SCREENSHOT_TARGETS[target]
+        resized = image.resize(fit_size(image.size, size), Image.LANCZOS)
+        canvas = self._canvas(size)
+        offset = ((size[0] - resized.width) // 2, (size[1] - resized.height) // 2)
+        if resized.mode in ('RGBA', 'LA'):
+            canvas.paste(resized.convert('RGB'), offset, resized.getchannel('A'))
+        else:
+            canvas.paste(resized.convert('RGB'), offset)
+        return canvas
+
+    def normalize(self, image):
+        """모든 대상 크기로 정규화한 이미지를 {target: image}로 반환 (바로 저장할 것)"""
+        return {target: self.normalize_image(image, target) for target in self.targets}
+
+    def output_paths(self, image_path, output_dir):
+        """대상 크기별 출력 경로
+
+        phone은 기존과 같이 output_dir 바로 아래, 나머지는 대상별 하위 폴더에 저장한다.
+        target_dirs가 False이면 모두 output_dir 바로 아래에 저장한다.
+        """
+        name = f"playstore_{Path(image_path).name}"
+        output_dir = Path(output_dir)
+        return {
+            target: output_dir / target / name if self.target_dirs and target != 'phone' else output_dir / name
+            for target in self.targets
+        }
+
+    def normalize_file(self, image_path, output_dir, cache=None, image=None, data=None):
+        """파일 하나를 모든 대상 크기로 변환하고 {target: (경로, 결과)} 반환
+
+        원본은 최대 한 번만 디코딩하며, cache가 있으면 바뀌지 않은 출력은 건너뛴다.
+        이미 메모리에 있는 캡처는 image(디코딩된 이미지)와 data(캐시 키용 원본 바이트)로
+        넘기면 디스크에서 다시 읽지 않는다. 이때 image_path는 출력 이름에만 쓰인다.
+        """
+        image_path = Path(image_path)
+        decoded = {} if image is None else {'image': image}
+
+        def load():
+            if 'image' not in decoded:
+                with Image.open(image_path) as image:
+                    image.load()
+                    decoded['image'] = image.copy() if image.mode in ('RGB', 'RGBA') else image.convert('RGB')
+            return decoded['image']
+
+        results = {}
+        for target, output_path in self.output_paths(image_path, output_dir).items():
+            def build(path, target=target):
+                self._save(self.normalize_image(load(), target), path)
+
+            if cache is None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                build(output_path)
+                results[target] = (output_path, 'built')
+                continue
+
+            key = cache.key(image_path if data is None else data, size=SCREENSHOT_TARGETS[target],
+                            background=self.background, renderer=RENDERER_VERSION)
+            results[target] = (output_path, cache.produce(key, output_path, build))
+        return results
+
+    def normalize_directory(self, input_dir, output_dir, cache=None, jobs=1):
+        """디렉토리의 모든 스크린샷을 일괄 변환 (jobs > 1이면 스레드 병렬)
+
+        입력 파일 이름 순서대로 (원본 경로, 결과 또는 예외 메시지) 목록을 반환한다.
+        """
+        paths = sorted({path for pattern in SCREENSHOT_PATTERNS for path in Path(input_dir).glob(pattern)})
+
+        def run(path):
+            try:
+                return path, self.normalize_file(path, output_dir, cache)
+            except Exception as e:
+                return path, str(e)
+
+        if jobs <= 1:
+            return [run(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(run, paths))
+
+    def _save(self, image, path):
+        suffix = Path(path).suffix.lower()
+        if suffix in ('.jpg', '.jpeg'):
+            image.save(path, 'JPEG', quality=95)
+        else:
+            image.save(path, 'PNG')
+
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+스크립트 실행기
+scripts/의 하이픈 이름 스크립트(qa-validator.py 등)를 모듈로 불러와 같은 프로세스에서 실행
+
+스크립트가 run(argv)를 제공하면 구조화된 ScriptResult를 그대로 받고, main(argv)만 있으면
+종료 코드로 결과를 만든다. 같은 프로세스에서 실행하므로 인터프리터 시작과 모듈 임포트를
+반복하지 않고 프로젝트 스냅샷(project_model.load_project)과 캐시를 공유한다.
+격리가 필요하면 run_subprocess()로 별도 인터프리터에서 실행한다.
+
+외부 명령은 run_command()로 실행하며, 시간 제한을 넘기면 손자 프로세스(Gradle 등)까지
+프로세스 그룹 전체를 종료한다.
+"""
+
+import importlib.util
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tracing import span
+
+
+@dataclass(frozen=True)
+class ScriptResult:
+    script: str
+    success: bool
+    exit_code: int = 0
+    data: dict = field(default_factory=dict)   # 스크립트별 구조화 결과
+    elapsed: float = 0.0
+
+
+_modules = {}
+_lock = threading.Lock()
+
+
+def load_script(path):
+    """스크립트 파일을 모듈로 불러옴 (경로마다 한 번만, 스레드 안전)"""
+    path = Path(path).resolve()
+    with _lock:
+        module = _modules.get(path)
+        if module is None:
+            name = "soksol_script_" + path.stem.replace('-', '_')
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[name]
+                raise
+            _modules[path] = module
+    return module
+
+
+def run_in_process(path, argv=None):
+    """스크립트를 같은 프로세스에서 실행"""
+    path = Path(path)
+    started = time.perf_counter()
+    argv = list(argv or [])
+    try:
+        with span(path.name, 'script', argv=' '.join(argv)):
+            module = load_script(path)
+            if hasattr(module, 'run'):
+                result = module.run(argv)
+                return ScriptResult(path.name, result.success, result.exit_code, result.data,
+                                    time.perf_counter() - started)
+            exit_code = module.main(argv) or 0
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return ScriptResult(path.name, exit_code == 0, exit_code, elapsed=time.perf_counter() - started)
+
+
+def run_command(cmd, timeout, cwd=None):
+    """외부 명령 실행 후 종료 코드 반환 (시간 초과 시 프로세스 그룹 종료 후 subprocess.TimeoutExpired)"""
+    with span(Path(cmd[0]).name, 'subprocess', command=' '.join(str(arg) for arg in cmd)) as current:
+        return _wait_command(cmd, timeout, cwd, current.child_env())
+
+
+def _wait_command(cmd, timeout, cwd, env):
+    posix = os.name == 'posix'
+    process = subprocess.Popen(cmd, cwd=cwd, env=env, start_new_session=posix)
+    try:
+        return process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        if posix:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        else:
+            process.kill()
+        process.wait()
+        raise
+    except BaseException:
+        # Ctrl+C 등으로 중단되면 자식 프로세스를 남기지 않음
+        process.kill()
+        process.wait()
+        raise
+
+
+def run_subprocess(path, argv=None, cwd=None, timeout=None):
+    """스크립트를 별도 Python 인터프리터에서 실행 (격리 실행, timeout초를 넘기면 실패)"""
+    path = Path(path)
+    started = time.perf_counter()
+    try:
+        with span(path.name, 'script', argv=' '.join(argv or []), isolated=True):
+            exit_code = run_command([sys.executable, str(path), *(argv or [])], timeout, cwd)
+    except subprocess.TimeoutExpired:
+        print(f"❌ {path.name} 시간 초과 ({timeout}초)")
+        return ScriptResult(path.name, False, -1, {'timeout': timeout}, time.perf_counter() - started)
+    return ScriptResult(path.name, exit_code == 0, exit_code, elapsed=time.perf_counter() - started)
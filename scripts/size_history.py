@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+빌드 산출물 크기 이력
+AAB/APK 전체·카테고리별 크기와 스토어 에셋 크기를 versionCode별로 SQLite에 기록하고,
+설정한 예산과 직전 릴리스들의 크기에 비교해 증가폭이 큰 항목을 찾음
+
+측정 키는 '<대상>.<항목>' 형식이다 (예: aab.total, aab.js_bundle, store.screenshots).
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent.parent
+DEFAULT_HISTORY_PATH = BASE_PATH / ".cache" / "size-history.sqlite"
+DEFAULT_BUDGETS_PATH = Path(__file__).parent / "size_budgets.json"
+
+MB = 1024 * 1024
+
+DEFAULT_CONFIG = {
+    'compare_releases': 3,                 # 비교할 직전 릴리스 수
+    'max_increase_mb': 1.0,                # 직전 릴리스 대비 허용 증가량
+    'max_increase_percent': 10.0,          # 직전 릴리스 대비 허용 증가율
+    'min_tracked_mb': 0.1,                 # 이보다 작은 항목은 증가율 검사 생략
+    'budgets_mb': {},                      # 측정 키 → 최대 크기
+}
+
+
+def load_budget_config(path=DEFAULT_BUDGETS_PATH):
+    """예산 설정 파일 로드 (없으면 기본값)"""
+    config = dict(DEFAULT_CONFIG)
+    path = Path(path)
+    if path.exists():
+        config.update(json.loads(path.read_text(encoding='utf-8')))
+    return config
+
+
+def artifact_measurements(label, summary):
+    """archive_inspector.inspect_archive() 결과 → 측정값"""
+    prefix = label.lower()
+    measurements = {f"{prefix}.total": summary['file_size']}
+    for category, totals in summary['categories'].items():
+        measurements[f"{prefix}.{category}"] = totals['compressed']
+    return measurements
+
+
+def store_measurements(store_assets):
+    """스토어 에셋 크기 (하위 폴더별 합계와 전체 합계)
+
+    store_assets: store_assets.StoreAssetIndex (문서/설정 파일은 제외)
+    """
+    measurements = {}
+    total = 0
+    for asset in store_assets:
+        if asset.path.suffix.lower() in ('.md', '.json'):
+            continue
+        key = f"store.{asset.group}"
+        measurements[key] = measurements.get(key, 0) + asset.file_size
+        total += asset.file_size
+    measurements['store.total'] = total
+    return measurements
+
+
+class SizeHistory:
+    """versionCode별 크기 측정 기록 (같은 versionCode를 다시 기록하면 덮어씀)"""
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS measurements (
+                version_code INTEGER NOT NULL,
+                version_name TEXT,
+                recorded_at TEXT NOT NULL,
+                key TEXT NOT NULL,
+                bytes INTEGER NOT NULL,
+                PRIMARY KEY (version_code, key)
+            )
+        """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def record(self, version_code, version_name, measurements):
+        recorded_at = datetime.now().isoformat(timespec='seconds')
+        with self.connection:
+            self.connection.execute("DELETE FROM measurements WHERE version_code = ?", (version_code,))
+            self.connection.executemany(
+                "INSERT INTO measurements VALUES (?, ?, ?, ?, ?)",
+                [(version_code, version_name, recorded_at, key, size) for key, size in measurements.items()])
+
+    def previous(self, version_code, limit):
+        """version_code보다 작은 최근 limit개 릴리스 → [(versionCode, {키: 바이트})] (최신순)"""
+        rows = self.connection.execute(
+            "SELECT DISTINCT version_code FROM measurements WHERE version_code < ? "
+            "ORDER BY version_code DESC LIMIT ?", (version_code, limit)).fetchall()
+        releases = []
+        for (code,) in rows:
+            values = dict(self.connection.execute(
+                "SELECT key, bytes FROM measurements WHERE version_code = ?", (code,)).fetchall())
+            releases.append((code, values))
+        return releases
+
+
+def history_digest(version_code, limit, path=DEFAULT_HISTORY_PATH):
+    """비교에 쓰는 직전 limit개 릴리스 기록의 해시 (증분 QA 입력 지문, 이력이 없으면 '')
+
+    이번 versionCode의 기록은 검증할 때마다 다시 쓰므로 제외한다.
+    """
+    if not isinstance(version_code, int) or not Path(path).exists():
+        return ''
+    with SizeHistory(path) as history:
+        previous = history.previous(version_code, limit)
+    return hashlib.sha256(json.dumps(previous, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def evaluate(measurements, previous, config):
+    """측정값을 예산/직전 릴리스와 비교
+
+    키마다 {'key', 'current', 'status', 'budget', 'baseline', 'baseline_version', 'delta', 'average'}를
+    반환한다. status는 'over_budget', 'regression', 'ok' 중 하나이다.
+    """
+    budgets = {key: int(value * MB) for key, value in config.get('budgets_mb', {}).items()}
+    max_increase = config['max_increase_mb'] * MB
+    max_percent = config['max_increase_percent']
+    min_tracked = config['min_tracked_mb'] * MB
+
+    results = []
+    for key, current in measurements.items():
+        result = {'key': key, 'current': current, 'status': 'ok', 'budget': budgets.get(key),
+                  'baseline': None, 'baseline_version': None, 'delta': None, 'average': None}
+
+        history = [(code, values[key]) for code, values in previous if key in values]
+        if history:
+            result['baseline_version'], result['baseline'] = history[0]
+            result['delta'] = current - result['baseline']
+            result['average'] = sum(size for _, size in history) / len(history)
+
+        if result['budget'] is not None and current > result['budget']:
+            result['status'] = 'over_budget'
+        elif result['delta'] is not None and max(current, result['baseline']) >= min_tracked:
+            percent = result['delta'] / result['baseline'] * 100 if result['baseline'] else float('inf')
+            if result['delta'] > max_increase or (result['delta'] > 0 and percent > max_percent):
+                result['status'] = 'regression'
+        results.append(result)
+    return results
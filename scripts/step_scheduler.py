@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+단계 스케줄러
+각 단계가 선행 단계를 선언하면 의존성이 모두 끝난 단계부터 스레드 풀에서 동시에 실행
+(전체 소요 시간이 단계 합계가 아니라 가장 긴 의존 경로에 가까워짐)
+
+실행 후 단계별 시작/종료 시각과 임계 경로(전체 시간을 결정한 의존 사슬)를 제공한다.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable
+
+from tracing import current_span, span
+
+
+@dataclass(frozen=True)
+class Step:
+    name: str
+    func: Callable
+    depends: tuple = ()     # 먼저 끝나야 하는 단계 이름
+
+
+@dataclass(frozen=True)
+class StepResult:
+    name: str
+    success: bool
+    started: float          # 실행 시작 기준 초
+    finished: float
+
+    @property
+    def duration(self):
+        return self.finished - self.started
+
+
+class StepScheduler:
+    """의존성 그래프(DAG)로 단계 실행
+
+    on_failure(step)는 단계가 실패했을 때 메인 스레드에서 호출되며, False를 반환하면
+    새 단계를 더 시작하지 않는다 (이미 실행 중인 단계는 끝까지 기다림).
+    """
+
+    def __init__(self, steps, jobs=None, on_failure=None):
+        self.steps = list(steps)
+        self.by_name = {step.name: step for step in self.steps}
+        # 단계는 대부분 외부 프로세스/입력 대기이므로 기본은 단계 수만큼 동시 실행
+        self.jobs = jobs or len(self.steps) or 1
+        self.on_failure = on_failure
+        self.results = {}
+        self.elapsed = 0.0
+        self.stopped = False
+        self._check_graph()
+
+    def _check_graph(self):
+        for step in self.steps:
+            unknown = [name for name in step.depends if name not in self.by_name]
+            if unknown:
+                raise ValueError(f"{step.name}: 알 수 없는 선행 단계 {', '.join(unknown)}")
+        # 순환 검사 (위상 정렬이 모든 단계를 방문하지 못하면 순환)
+        remaining = {step.name: set(step.depends) for step in self.steps}
+        while remaining:
+            ready = [name for name, depends in remaining.items() if not depends]
+            if not ready:
+                raise ValueError(f"단계 의존성에 순환이 있습니다: {', '.join(remaining)}")
+            for name in ready:
+                del remaining[name]
+            for depends in remaining.values():
+                depends.difference_update(ready)
+
+    def _run_step(self, step, origin, parent):
+        started = time.perf_counter() - origin
+        try:
+            with span(step.name, 'step', within=parent):
+                success = bool(step.func())
+        except Exception as e:
+            print(f"❌ {step.name} 단계 실행 중 오류: {e}")
+            success = False
+        return StepResult(step.name, success, started, time.perf_counter() - origin)
+
+    def run(self):
+        """모든 단계 실행. 모든 단계가 실행되어 성공했으면 True"""
+        pending = {step.name: set(step.depends) for step in self.steps}
+        running = {}
+        origin = time.perf_counter()
+        workers = max(1, min(self.jobs, len(self.steps)))
+        parent = current_span()
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while pending or running:
+                if not self.stopped:
+                    # 선언 순서대로 준비된 단계 시작
+                    for step in self.steps:
+                        if step.name in pending and not pending[step.name]:
+                            del pending[step.name]
+                            running[pool.submit(self._run_step, step, origin, parent)] = step
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda item: self.steps.index(running[item])):
+                    step = running.pop(future)
+                    result = future.result()
+                    self.results[step.name] = result
+                    for depends in pending.values():
+                        depends.discard(step.name)
+                    if not result.success and not self.stopped and self.on_failure is not None:
+                        self.stopped = not self.on_failure(step)
+
+        self.elapsed = time.perf_counter() - origin
+        return not pending and all(result.success for result in self.results.values())
+
+    def ordered_results(self):
+        """실행된 단계 결과 (선언 순서)"""
+        return [self.results[step.name] for step in self.steps if step.name in self.results]
+
+    def critical_path(self):
+        """가장 늦게 끝난 단계에서 가장 늦게 끝난 선행 단계를 따라 거슬러 올라간 경로"""
+        if not self.results:
+            return []
+        current = max(self.results.values(), key=lambda result: result.finished)
+        path = [current]
+        while True:
+            previous = [self.results[name] for name in self.by_name[current.name].depends if name in self.results]
+            if not previous:
+                break
+            current = max(previous, key=lambda result: result.finished)
+            path.append(current)
+        return path[::-1]
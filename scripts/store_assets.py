@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+스토어 에셋 목록
+assets/store 트리를 os.scandir로 한 번만 순회하고, 파일마다 앞부분을 한 번만 읽어
+확장자가 아닌 실제 내용으로 종류를 판별하고 이미지는 헤더에서 크기를 기록
+
+스토어 관련 검증(스크린샷, 피처 그래픽, 아이콘, 크기 이력)은 디스크를 다시 훑지 않고
+이 목록을 조회한다.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from image_headers import read_image_info, sniff
+
+SNIFF_SIZE = 512
+RASTER_KINDS = ('png', 'jpeg', 'webp')
+
+# 내용 종류 → 정상 확장자
+KIND_SUFFIXES = {
+    'png': ('.png',),
+    'jpeg': ('.jpg', '.jpeg'),
+    'webp': ('.webp',),
+    'svg': ('.svg',),
+    'json': ('.json',),
+}
+
+
+@dataclass(frozen=True)
+class StoreAsset:
+    path: Path
+    relative: str              # assets/store 기준 경로 (예: 'screenshots/phone/01.png')
+    kind: str                  # 'png', 'jpeg', 'webp', 'svg', 'json', 'text', 'binary'
+    file_size: int
+    image: object = None       # 래스터 이미지면 image_headers.ImageInfo
+
+    @property
+    def group(self):
+        """최상위 폴더 이름 (루트의 파일은 'root')"""
+        parts = self.relative.split('/')
+        return parts[0] if len(parts) > 1 else 'root'
+
+    @property
+    def depth(self):
+        return self.relative.count('/')
+
+    @property
+    def is_raster(self):
+        return self.kind in RASTER_KINDS and self.image is not None and not self.image.error
+
+    @property
+    def suffix_mismatch(self):
+        """내용과 확장자가 다르면 True (예: JPEG 내용의 .png 파일)"""
+        expected = KIND_SUFFIXES.get(self.kind)
+        return expected is not None and self.path.suffix.lower() not in expected
+
+
+@dataclass(frozen=True)
+class StoreAssetIndex:
+    root: Path
+    assets: tuple = ()
+
+    def __iter__(self):
+        return iter(self.assets)
+
+    def __len__(self):
+        return len(self.assets)
+
+    def exists(self, group):
+        return any(asset.group == group for asset in self.assets)
+
+    def images(self, group=None, depth=None):
+        """래스터 이미지 목록 (group: 최상위 폴더, depth: 1이면 그 폴더 바로 아래 파일만)"""
+        return [asset for asset in self.assets
+                if asset.kind in RASTER_KINDS
+                and (group is None or asset.group == group)
+                and (depth is None or asset.depth == depth)]
+
+    def find(self, group, stem):
+        """group 폴더에서 파일 이름(확장자 제외)이 stem인 래스터 이미지 (없으면 None)"""
+        return next((asset for asset in self.images(group) if asset.path.stem == stem), None)
+
+
+def _sniff_text(head):
+    if not head:
+        return 'text'
+    try:
+        text = head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # 앞부분을 자르다 멀티바이트 문자 중간에서 끊긴 경우는 텍스트로 봄
+        if e.start < len(head) - 3:
+            return 'binary'
+        text = head[:e.start].decode('utf-8')
+    stripped = text.lstrip('\ufeff \t\r\n')
+    if '<svg' in text and stripped.startswith('<'):
+        return 'svg'
+    if stripped.startswith(('{', '[')):
+        return 'json'
+    if '\x00' in text:
+        return 'binary'
+    return 'text'
+
+
+def classify(path, relative, file_size):
+    """파일 하나를 한 번 열어 종류와 (래스터면) 이미지 헤더 판독"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(SNIFF_SIZE)
+            kind = sniff(head)
+            if kind is None:
+                return StoreAsset(path, relative, _sniff_text(head), file_size)
+            f.seek(0)
+            return StoreAsset(path, relative, kind, file_size, read_image_info(f, path, file_size))
+    except OSError:
+        return StoreAsset(path, relative, 'binary', file_size)
+
+
+def _walk(root):
+    """(경로, 상대 경로, 크기) 목록 (숨김 파일 제외, 이름 순서)"""
+    files = []
+    stack = [(Path(root), '')]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append((Path(entry.path), f"{prefix}{entry.name}/"))
+            elif entry.is_file():
+                files.append((Path(entry.path), f"{prefix}{entry.name}", entry.stat().st_size))
+        stack.extend(reversed(subdirectories))
+    return files
+
+
+def build_store_index(root, jobs=None):
+    """assets/store 트리 목록 생성 (파일 판별은 스레드 풀에서 동시에)"""
+    root = Path(root)
+    files = _walk(root)
+    workers = max(1, min(jobs or (os.cpu_count() or 1) * 4, len(files), 32))
+    if workers == 1:
+        assets = [classify(*item) for item in files]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            assets = list(pool.map(lambda item: classify(*item), files))
+    return StoreAssetIndex(root, tuple(assets))
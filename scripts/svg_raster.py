@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+SVG 래스터화 엔진
+SVG 문서를 한 번만 파싱한 뒤 요청된 모든 크기로 렌더링
+
+- cairosvg: 프로세스 내부 렌더링 (기본값, 가장 빠름)
+- inkscape: 외부 프로세스 렌더링 (cairosvg를 사용할 수 없을 때 대체)
+"""
+
+import io
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import tracing
+
+try:
+    from cairosvg.parser import Tree
+    from cairosvg.surface import PNGSurface
+    import cairosvg
+except (ImportError, OSError):
+    # cairosvg 미설치 또는 libcairo 누락
+    cairosvg = None
+
+BACKENDS = ('cairosvg', 'inkscape')
+INKSCAPE_TIMEOUT = 120  # 아이콘 하나 변환 시간 제한 (초)
+
+
+def available_backends(toolchain=None):
+    """사용 가능한 렌더링 백엔드 목록 (빠른 순서)
+
+    toolchain(toolchain.Toolchain)을 넘기면 저장된 도구 확인 결과를 사용하고 PATH를 다시 찾지 않는다.
+    cairosvg는 이 프로세스에서 실제로 임포트되었는지를 기준으로 한다.
+    """
+    if toolchain is not None:
+        return [backend for backend in toolchain.svg_backends if backend != 'cairosvg' or cairosvg is not None]
+    backends = []
+    if cairosvg is not None:
+        backends.append('cairosvg')
+    if shutil.which('inkscape'):
+        backends.append('inkscape')
+    return backends
+
+
+class CairoSvgRasterizer:
+    """cairosvg 기반 프로세스 내부 렌더러 (SVG는 생성 시 한 번만 파싱)"""
+
+    name = 'cairosvg'
+
+    def __init__(self, svg_path):
+        self.svg_path = Path(svg_path)
+        self.version = cairosvg.__version__
+        self.options = {}
+        self.tree = Tree(bytestring=self.svg_path.read_bytes(), url=str(self.svg_path))
+
+    def render_png(self, size):
+        """지정한 크기의 PNG 바이트 반환"""
+        output = io.BytesIO()
+        PNGSurface(self.tree, output, 96, output_width=size, output_height=size).finish()
+        return output.getvalue()
+
+    def write_png(self, output_path, size):
+        """지정한 크기의 PNG 파일 저장"""
+        Path(output_path).write_bytes(self.render_png(size))
+
+
+class InkscapeRasterizer:
+    """Inkscape 외부 프로세스 렌더러 (대체 백엔드)"""
+
+    name = 'inkscape'
+
+    def __init__(self, svg_path, version=None):
+        self.svg_path = Path(svg_path)
+        self.options = {}
+        if version:
+            # 도구 확인 결과(toolchain)에 저장된 버전을 사용하면 --version을 실행하지 않음
+            self.version = version
+            return
+        try:
+            result = subprocess.run(['inkscape', '--version'], capture_output=True, text=True,
+                                    timeout=INKSCAPE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Inkscape 버전 확인 시간 초과 ({INKSCAPE_TIMEOUT}초)")
+        self.version = result.stdout.strip() or 'unknown'
+
+    def write_png(self, output_path, size):
+        """지정한 크기의 PNG 파일 저장"""
+        cmd = [
+            'inkscape',
+            '--export-type=png',
+            f'--export-width={size}',
+            f'--export-height={size}',
+            f'--export-filename={output_path}',
+            str(self.svg_path)
+        ]
+
+        try:
+            with tracing.span('inkscape', 'subprocess', size=size):
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=INKSCAPE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Inkscape 변환 시간 초과 ({INKSCAPE_TIMEOUT}초): {output_path}")
+        if result.returncode != 0:
+            raise RuntimeError(f"Inkscape 변환 실패: {result.stderr}")
+
+    def render_png(self, size):
+        """지정한 크기의 PNG 바이트 반환"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir) / "render.png"
+            self.write_png(temp_path, size)
+            return temp_path.read_bytes()
+
+
+def resolve_backend(backend='auto', toolchain=None):
+    """사용할 백엔드 이름 결정 (렌더러는 만들지 않음)
+
+    backend가 'auto'이면 cairosvg를 우선 사용하고, 없으면 Inkscape로 대체한다.
+    """
+    if backend == 'auto':
+        candidates = available_backends(toolchain)
+        if not candidates:
+            raise RuntimeError("사용 가능한 SVG 렌더링 백엔드가 없습니다 (cairosvg 또는 inkscape 필요)")
+        return candidates[0]
+    if backend == 'cairosvg' and cairosvg is None:
+        raise RuntimeError("cairosvg를 사용할 수 없습니다 (pip install cairosvg)")
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 백엔드: {backend} (사용 가능: {', '.join(BACKENDS)})")
+    return backend
+
+
+def create_rasterizer(svg_path, backend='auto', toolchain=None):
+    """백엔드를 선택해 렌더러 생성
+
+    toolchain을 넘기면 백엔드 선택과 Inkscape 버전에 저장된 도구 확인 결과를 사용한다.
+    """
+    backend = resolve_backend(backend, toolchain)
+    if backend == 'cairosvg':
+        return CairoSvgRasterizer(svg_path)
+    if backend == 'inkscape':
+        try:
+            version = toolchain.version('inkscape') if toolchain is not None else None
+            return InkscapeRasterizer(svg_path, version)
+        except FileNotFoundError:
+            raise RuntimeError("Inkscape가 설치되지 않았습니다.")
+
+
+# 피라미드 모드 기본값: 512px 마스터를 한 번 렌더링한 뒤 축소
+PYRAMID_MASTER_SIZE = 512
+DEFAULT_SHARPEN = 30
+
+
+def _load_pil():
+    try:
+        from PIL import Image, ImageChops, ImageFilter, ImageStat
+    except ImportError:
+        raise RuntimeError("피라미드 모드에는 Pillow가 필요합니다 (pip install Pillow)")
+    return Image, ImageChops, ImageFilter, ImageStat
+
+
+class PyramidRasterizer:
+    """마스터 이미지를 한 번 렌더링하고 작은 크기는 Lanczos 축소로 생성
+
+    기존 렌더러와 같은 인터페이스(render_png/write_png)를 제공한다.
+    마스터는 처음 필요할 때 렌더링하므로 캐시 히트만 있는 실행에서는 렌더링하지 않는다.
+    """
+
+    def __init__(self, rasterizer, master_size=PYRAMID_MASTER_SIZE, sharpen=DEFAULT_SHARPEN):
+        Image, _, ImageFilter, _ = _load_pil()
+        self.rasterizer = rasterizer
+        self.name = f"{rasterizer.name}+pyramid"
+        self.version = rasterizer.version
+        self.options = dict(rasterizer.options, master_size=master_size, sharpen=sharpen)
+        self.master_size = master_size
+        self.sharpen = sharpen
+        self._image = Image
+        self._filter = ImageFilter
+        self._master = None
+        self._master_png = None
+
+    def _render_master(self):
+        if self._master is None:
+            self._master_png = self.rasterizer.render_png(self.master_size)
+            self._master = self._image.open(io.BytesIO(self._master_png)).convert('RGBA')
+
+    @property
+    def master(self):
+        """마스터 이미지 (최초 접근 시 한 번 렌더링)"""
+        self._render_master()
+        return self._master
+
+    def render_image(self, size):
+        """지정한 크기의 PIL 이미지 반환 (마스터보다 크면 벡터 렌더링)"""
+        if size == self.master_size:
+            return self.master.copy()
+        if size > self.master_size:
+            return self._image.open(io.BytesIO(self.rasterizer.render_png(size))).convert('RGBA')
+
+        image = self.master.resize((size, size), self._image.LANCZOS)
+        if self.sharpen > 0:
+            image = image.filter(self._filter.UnsharpMask(radius=0.5, percent=self.sharpen, threshold=0))
+        return image
+
+    def render_png(self, size):
+        """지정한 크기의 PNG 바이트 반환"""
+        if size == self.master_size:
+            self._render_master()
+            return self._master_png
+        output = io.BytesIO()
+        self.render_image(size).save(output, 'PNG', optimize=True)
+        return output.getvalue()
+
+    def write_png(self, output_path, size):
+        """지정한 크기의 PNG 파일 저장"""
+        Path(output_path).write_bytes(self.render_png(size))
+
+
+def measure_pyramid_error(pyramid, sizes):
+    """피라미드 축소 결과와 벡터 직접 렌더링 간의 픽셀 오차 측정
+
+    크기별로 RMSE와 최대 채널 오차(0-255)를 반환한다.
+    투명 픽셀의 색상값이 오차에 섞이지 않도록 흰 배경에 합성한 뒤 비교한다.
+    """
+    Image, ImageChops, _, ImageStat = _load_pil()
+
+    def flatten(image):
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        return Image.alpha_composite(background, image).convert('RGB')
+
+    results = []
+    for size in sizes:
+        derived = flatten(pyramid.render_image(size))
+        direct = flatten(Image.open(io.BytesIO(pyramid.rasterizer.render_png(size))).convert('RGBA'))
+        diff = ImageChops.difference(derived, direct)
+
+        stat = ImageStat.Stat(diff)
+        rmse = (sum(value ** 2 for value in stat.rms) / len(stat.rms)) ** 0.5
+        max_error = max(high for _, high in diff.getextrema())
+        results.append({'size': size, 'rmse': rmse, 'max_error': max_error})
+    return results
+
+
+def render_cached(rasterizer, svg_path, output_path, size, cache=None):
+    """렌더링 결과를 파일로 저장 (cache가 있으면 캐시를 거침)
+
+    'built', 'restored', 'skipped' 중 하나를 반환한다.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if cache is None:
+        rasterizer.write_png(output_path, size)
+        return 'built'
+
+    key = cache.key(Path(svg_path).read_bytes(), size=size, renderer=rasterizer.name,
+                    version=rasterizer.version, options=rasterizer.options)
+    return cache.produce(key, output_path, lambda path: rasterizer.write_png(path, size))
+
+
+# 워커 프로세스마다 한 번 생성되는 렌더러/캐시
+_worker = {}
+
+
+def _init_render_worker(svg_path, backend, pyramid, sharpen, use_cache, rasterizer=None, toolchain=None):
+    from asset_cache import ArtifactCache
+
+    if rasterizer is None:
+        rasterizer = create_rasterizer(svg_path, backend, toolchain)
+        if pyramid:
+            rasterizer = PyramidRasterizer(rasterizer, PYRAMID_MASTER_SIZE, sharpen)
+    _worker['svg_path'] = svg_path
+    _worker['rasterizer'] = rasterizer
+    _worker['cache'] = ArtifactCache(enabled=use_cache)
+
+
+def _run_render_job(job):
+    output_path, size = job
+    try:
+        with tracing.span('render', 'render', size=size, output=Path(output_path).name) as current:
+            outcome = render_cached(_worker['rasterizer'], _worker['svg_path'], output_path, size, _worker['cache'])
+            current.args['outcome'] = outcome
+        return outcome, None
+    except Exception as e:
+        return None, str(e)
+    finally:
+        # 워커 프로세스는 atexit 없이 종료되므로 작업마다 구간을 내보냄
+        tracing.flush()
+
+
+def run_render_jobs(svg_path, jobs, backend='auto', pyramid=False, sharpen=DEFAULT_SHARPEN,
+                    use_cache=True, workers=1, rasterizer=None, toolchain=None):
+    """(출력 경로, 크기) 작업 목록을 워커 풀에서 렌더링
+
+    각 워커는 SVG를 한 번만 파싱한다. 결과는 완료 순서와 무관하게
+    jobs와 같은 순서의 (outcome, error) 목록으로 반환한다.
+    workers가 1 이하이거나 pyramid이면 현재 프로세스에서 rasterizer를 재사용해 순차 실행한다
+    (피라미드는 마스터 한 번 렌더링 + 가벼운 축소이므로 워커마다 마스터를 렌더링하지 않음).
+    toolchain을 넘기면 워커가 렌더러를 만들 때 도구를 다시 확인하지 않는다.
+    """
+    jobs = [(str(output_path), size) for output_path, size in jobs]
+    workers = max(1, min(workers, len(jobs)))
+
+    if workers == 1 or pyramid:
+        _init_render_worker(str(svg_path), backend, pyramid, sharpen, use_cache, rasterizer, toolchain)
+        return [_run_render_job(job) for job in jobs]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # master-prep은 이 함수를 단계 스레드가 여러 개 도는 프로세스에서 호출하므로, fork하면 다른
+    # 스레드가 잡고 있던 잠금(stdout, tracing 등)을 워커가 물려받아 멈출 수 있음 → 항상 spawn
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_render_worker,
+                             initargs=(str(svg_path), backend, pyramid, sharpen, use_cache, None, toolchain)) as pool:
+        return list(pool.map(_run_render_job, jobs))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+테스트용 가짜 adb
+실제 디바이스 없이 adb_capture/scenario_runner를 실행하기 위한 실행 파일 (표준 라이브러리만 사용)
+
+FAKE_ADB_STATE 환경변수가 가리키는 JSON 파일로 동작을 정한다.
+
+    {
+      "width": 5, "height": 3,      # 화면 크기 (픽셀)
+      "header": 16,                 # screencap raw 헤더 크기 (16: Android 9 이상, 12: 이전)
+      "frames": [0, 1, 1],          # screencap 호출마다 차례로 내보낼 프레임 번호 (끝나면 마지막 유지)
+      "cycle": false,               # true이면 frames를 반복
+      "fail": {"input tap": "error: device offline"},  # 명령에 포함되면 종료 코드 1
+      "devices": ["emulator-5554"],
+      "wm_size": "Physical size: 1080x2400",
+      "wm_density": "Physical density: 420"
+    }
+
+호출한 명령은 <상태 파일>.calls에 JSON Lines로 기록한다 ({'device', 'args'}).
+"""
+
+import json
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+STATE_ENV = 'FAKE_ADB_STATE'
+RGBA_8888 = 1  # screencap raw 픽셀 포맷
+SRGB = 1       # Android 9 이상 헤더의 colorspace 값
+
+DEFAULT_STATE = {
+    'width': 5,
+    'height': 3,
+    'header': 16,
+    'frames': [0],
+    'cycle': False,
+    'fail': {},
+    'devices': ['emulator-5554'],
+    'wm_size': 'Physical size: 1080x2400',
+    'wm_density': 'Physical density: 420',
+}
+
+
+def write_state(path, **state):
+    """상태 파일 작성 (지정하지 않은 값은 기본값)"""
+    Path(path).write_text(json.dumps(dict(DEFAULT_STATE, **state)), encoding='utf-8')
+
+
+def read_calls(path):
+    """지금까지 호출된 명령 목록"""
+    calls_path = Path(f"{path}.calls")
+    if not calls_path.exists():
+        return []
+    return [json.loads(line) for line in calls_path.read_text(encoding='utf-8').splitlines()]
+
+
+def frame_pixels(frame, width, height):
+    """프레임 번호별 RGBA 픽셀 (위치마다 값이 달라 헤더 크기를 잘못 읽으면 결과가 어긋남)"""
+    pixels = bytearray()
+    for y in range(height):
+        for x in range(width):
+            pixels += bytes(((frame * 40 + x * 7) % 256, (y * 50 + x) % 256, (frame * 3 + y) % 256, 255))
+    return bytes(pixels)
+
+
+def raw_screencap(frame, width, height, header=16):
+    """screencap raw 출력 (헤더 + RGBA_8888 픽셀)"""
+    if header == 16:
+        prefix = struct.pack('<IIII', width, height, RGBA_8888, SRGB)
+    else:
+        prefix = struct.pack('<III', width, height, RGBA_8888)
+    return prefix + frame_pixels(frame, width, height)
+
+
+def png_screencap(frame, width, height):
+    """screencap -p 출력 (PNG)"""
+    pixels = frame_pixels(frame, width, height)
+    stride = width * 4
+    # 각 행 앞에 필터 종류 0(None)
+    scanlines = b''.join(b'\x00' + pixels[row * stride:(row + 1) * stride] for row in range(height))
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(scanlines))
+            + chunk(b'IEND', b''))
+
+
+def main(argv):
+    state_path = os.environ[STATE_ENV]
+    state = json.loads(Path(state_path).read_text(encoding='utf-8'))
+
+    device = None
+    if argv[:1] == ['-s']:
+        device, argv = argv[1], argv[2:]
+    command = ' '.join(argv)
+    screencaps = sum(1 for call in read_calls(state_path) if call['args'][:2] == ['exec-out', 'screencap'])
+    with open(f"{state_path}.calls", 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'device': device, 'args': argv}) + '\n')
+
+    for pattern, message in state['fail'].items():
+        if pattern in command:
+            sys.stderr.write(message + '\n')
+            return 1
+
+    if argv[:1] == ['version']:
+        sys.stdout.write("Android Debug Bridge version 1.0.41\n")
+    elif argv[:1] == ['devices']:
+        sys.stdout.write("List of devices attached\n")
+        sys.stdout.write(''.join(f"{serial}\tdevice\n" for serial in state['devices']))
+    elif argv[:2] == ['exec-out', 'screencap']:
+        frames = state['frames']
+        index = screencaps % len(frames) if state['cycle'] else min(screencaps, len(frames) - 1)
+        if '-p' in argv:
+            data = png_screencap(frames[index], state['width'], state['height'])
+        else:
+            data = raw_screencap(frames[index], state['width'], state['height'], state['header'])
+        sys.stdout.buffer.write(data)
+    elif argv[:3] == ['shell', 'wm', 'size']:
+        sys.stdout.write(state['wm_size'] + '\n')
+    elif argv[:3] == ['shell', 'wm', 'density']:
+        sys.stdout.write(state['wm_density'] + '\n')
+    # 그 외 shell 명령(input, am start, monkey)은 출력 없이 성공
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
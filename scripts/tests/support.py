@@ -0,0 +1,59 @@
+"""
+테스트 공용 도구
+scripts/를 임포트 경로에 추가하고, 가짜 adb(fake_adb.py)로 adb 명령을 실행하는 TestCase 제공
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+TESTS_PATH = Path(__file__).parent
+SCRIPTS_PATH = TESTS_PATH.parent
+FAKE_ADB = TESTS_PATH / "fake_adb.py"
+
+if str(SCRIPTS_PATH) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_PATH))
+
+import adb_capture  # noqa: E402
+import fake_adb  # noqa: E402
+
+
+class FakeAdbTestCase(unittest.TestCase):
+    """adb_capture.ADB를 가짜 adb로 바꾸고 테스트마다 새 상태 파일을 사용"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+        self.state_path = self.temp_path / "adb-state.json"
+        self.set_adb_state()
+
+        patches = [
+            mock.patch.dict(os.environ, {fake_adb.STATE_ENV: str(self.state_path)}),
+            mock.patch.object(adb_capture, 'ADB', str(FAKE_ADB)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def set_adb_state(self, **state):
+        fake_adb.write_state(self.state_path, **state)
+
+    def adb_calls(self):
+        """가짜 adb가 받은 명령 목록 (-s 디바이스 제외)"""
+        return [call['args'] for call in fake_adb.read_calls(self.state_path)]
+
+    def screencap_count(self):
+        return sum(1 for args in self.adb_calls() if args[:2] == ['exec-out', 'screencap'])
+
+    def expected_image(self, frame, width=None, height=None):
+        """가짜 adb가 프레임 번호 frame으로 내보내는 이미지"""
+        from PIL import Image
+
+        state = fake_adb.DEFAULT_STATE
+        width = width or state['width']
+        height = height or state['height']
+        return Image.frombytes('RGBA', (width, height), fake_adb.frame_pixels(frame, width, height))
@@ -0,0 +1,74 @@
+"""adb_capture: 가짜 adb로 screencap 출력 파싱과 오류 처리 확인"""
+
+import unittest
+
+from support import FakeAdbTestCase
+
+import fake_adb
+from adb_capture import AdbError, capture_frame, decode_frame, parse_raw_screencap, screen_info
+
+
+class ParseRawScreencapTest(unittest.TestCase):
+
+    def test_16_byte_header(self):
+        # Android 9 이상: width, height, format, colorspace
+        data = fake_adb.raw_screencap(2, 5, 3, header=16)
+        image = parse_raw_screencap(data)
+        self.assertEqual(image.size, (5, 3))
+        self.assertEqual(image.tobytes(), fake_adb.frame_pixels(2, 5, 3))
+
+    def test_12_byte_header(self):
+        # Android 8 이하: colorspace 필드 없음
+        data = fake_adb.raw_screencap(2, 5, 3, header=12)
+        image = parse_raw_screencap(data)
+        self.assertEqual(image.size, (5, 3))
+        self.assertEqual(image.tobytes(), fake_adb.frame_pixels(2, 5, 3))
+
+    def test_truncated_pixels(self):
+        data = fake_adb.raw_screencap(0, 5, 3, header=12)[:-4]
+        with self.assertRaises(AdbError):
+            parse_raw_screencap(data)
+
+    def test_short_header(self):
+        with self.assertRaises(AdbError):
+            parse_raw_screencap(b'\x05\x00\x00\x00')
+
+    def test_unknown_pixel_format(self):
+        data = bytearray(fake_adb.raw_screencap(0, 5, 3))
+        data[8] = 99
+        with self.assertRaises(AdbError):
+            parse_raw_screencap(bytes(data))
+
+
+class CaptureFrameTest(FakeAdbTestCase):
+
+    def test_raw_capture_with_16_byte_header(self):
+        self.set_adb_state(header=16, frames=[3])
+        image = decode_frame(capture_frame('emulator-5554', raw=True), raw=True)
+        self.assertEqual(image.tobytes(), self.expected_image(3).tobytes())
+        self.assertEqual(self.adb_calls(), [['exec-out', 'screencap']])
+
+    def test_raw_capture_with_12_byte_header(self):
+        self.set_adb_state(header=12, frames=[3])
+        image = decode_frame(capture_frame('emulator-5554', raw=True), raw=True)
+        self.assertEqual(image.tobytes(), self.expected_image(3).tobytes())
+
+    def test_png_capture(self):
+        self.set_adb_state(frames=[4])
+        image = decode_frame(capture_frame('emulator-5554'), raw=False)
+        self.assertEqual(image.convert('RGBA').tobytes(), self.expected_image(4).tobytes())
+        self.assertEqual(self.adb_calls(), [['exec-out', 'screencap', '-p']])
+
+    def test_failed_command_raises_adb_error(self):
+        self.set_adb_state(fail={'screencap': 'error: device offline'})
+        with self.assertRaisesRegex(AdbError, 'device offline'):
+            capture_frame('emulator-5554', raw=True)
+
+    def test_screen_info_prefers_override(self):
+        self.set_adb_state(wm_size="Physical size: 1080x2400\nOverride size: 720x1600",
+                           wm_density="Physical density: 420\nOverride density: 320")
+        self.assertEqual(screen_info('emulator-5554'), (720, 1600, 320))
+
+
+if __name__ == '__main__':
+    unittest.main()
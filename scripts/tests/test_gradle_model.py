@@ -0,0 +1,87 @@
+"""gradle_model: gradle.properties/루트 ext 참조를 정수 설정으로 해석하는지 확인 (Groovy/Kotlin DSL)"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import support  # noqa: F401  (scripts/를 임포트 경로에 추가)
+
+from gradle_model import Ref, scan_project
+
+GRADLE_PROPERTIES = """\
+VERSION_CODE=12
+VERSION_NAME=1.2.0
+MIN_SDK=24
+TARGET_SDK=34
+COMPILE_SDK=35
+"""
+
+
+class GradlePropertiesTest(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        (self.root / "gradle.properties").write_text(GRADLE_PROPERTIES, encoding='utf-8')
+        (self.root / "app").mkdir()
+
+    def scan(self, app_build, root_build='', kotlin=False):
+        suffix = '.kts' if kotlin else ''
+        (self.root / f"settings.gradle{suffix}").write_text('include(":app")\n', encoding='utf-8')
+        (self.root / f"build.gradle{suffix}").write_text(root_build, encoding='utf-8')
+        (self.root / "app" / f"build.gradle{suffix}").write_text(app_build, encoding='utf-8')
+        return scan_project(self.root).app
+
+    def test_groovy_property_lookups(self):
+        app = self.scan("""
+android {
+    compileSdk rootProject.ext.compileSdkVersion
+    defaultConfig {
+        versionCode project.property("VERSION_CODE") as Integer
+        versionName project.property("VERSION_NAME")
+        minSdkVersion findProperty("MIN_SDK").toInteger()
+        targetSdkVersion TARGET_SDK
+    }
+}
+""", root_build="ext {\n    compileSdkVersion = COMPILE_SDK.toInteger()\n}\n")
+
+        self.assertEqual(app.get('android', 'compileSdk'), 35)
+        self.assertEqual(app.get('defaultConfig', 'versionCode'), 12)
+        self.assertEqual(app.get('defaultConfig', 'versionName'), '1.2.0')
+        self.assertEqual(app.get('defaultConfig', 'minSdk'), 24)
+        self.assertEqual(app.get('defaultConfig', 'targetSdk'), 34)
+
+    def test_kotlin_cast_and_conversion(self):
+        app = self.scan("""
+android {
+    compileSdk = (rootProject.extra["compileSdkVersion"] as String).toInt()
+    defaultConfig {
+        versionCode = (project.property("VERSION_CODE") as String).toInt()
+        versionName = project.property("VERSION_NAME") as String
+        minSdk = (findProperty("MIN_SDK") as String).toInt()
+        targetSdk = (project.findProperty("TARGET_SDK") as String?)?.toInt()
+    }
+}
+""", root_build='extra["compileSdkVersion"] = "35"\n', kotlin=True)
+
+        self.assertEqual(app.get('android', 'compileSdk'), 35)
+        self.assertEqual(app.get('defaultConfig', 'versionCode'), 12)
+        self.assertEqual(app.get('defaultConfig', 'versionName'), '1.2.0')
+        self.assertEqual(app.get('defaultConfig', 'minSdk'), 24)
+        self.assertEqual(app.get('defaultConfig', 'targetSdk'), 34)
+
+    def test_missing_property_stays_reference(self):
+        app = self.scan("""
+android {
+    defaultConfig {
+        versionCode = (project.property("MISSING") as String).toInt()
+    }
+}
+""", kotlin=True)
+
+        self.assertEqual(app.get('defaultConfig', 'versionCode'), Ref('project.property("MISSING")'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""scenario_runner: 가짜 adb로 화면 안정화 대기와 시나리오 실패 처리 확인"""
+
+import unittest
+from unittest import mock
+
+from support import FakeAdbTestCase
+
+import fake_adb
+import scenario_runner
+from scenario_runner import ScenarioRunner, wait_for_stable_frame
+
+DEVICE = 'emulator-5554'
+# 테스트용 짧은 안정화 설정 (밀리초)
+FAST_SETTLE = {'stable_ms': 50, 'timeout_ms': 3000, 'interval_ms': 10}
+
+
+class WaitForStableFrameTest(FakeAdbTestCase):
+
+    def test_waits_until_frame_stops_changing(self):
+        self.set_adb_state(frames=[0, 1, 2, 2])
+        stable, data, elapsed = wait_for_stable_frame(DEVICE, **FAST_SETTLE)
+        self.assertTrue(stable)
+        self.assertEqual(data, fake_adb.raw_screencap(2, 5, 3))
+        # 바뀐 프레임 3개 이후 같은 프레임을 한 번 이상 더 확인
+        self.assertGreaterEqual(self.screencap_count(), 4)
+        self.assertGreaterEqual(elapsed, FAST_SETTLE['stable_ms'] / 1000)
+
+    def test_returns_last_frame_on_timeout(self):
+        self.set_adb_state(frames=[0, 1], cycle=True)
+        stable, data, elapsed = wait_for_stable_frame(DEVICE, stable_ms=50, timeout_ms=200, interval_ms=10)
+        self.assertFalse(stable)
+        self.assertIsNotNone(data)
+        self.assertGreaterEqual(elapsed, 0.2)
+
+
+class ScenarioRunnerTest(FakeAdbTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.captures = []
+        self.messages = []
+
+    def on_capture(self, device_id, key, image, data):
+        self.captures.append((device_id, key, image.tobytes()))
+        return key
+
+    def runner(self, on_capture=None, raw=True):
+        config = {'package': 'com.soksol', 'activity': '.MainActivity', 'settle': FAST_SETTLE}
+        return ScenarioRunner(DEVICE, config, on_capture or self.on_capture, log=self.messages.append, raw=raw)
+
+    def test_capture_format_follows_runner_default(self):
+        self.runner(raw=False).run([{'key': 'png', 'steps': [{'action': 'capture'}]},
+                                    {'key': 'raw', 'steps': [{'action': 'capture', 'raw': True}]}])
+        self.runner(raw=True).run([{'key': 'raw', 'steps': [{'action': 'capture'}]}])
+
+        self.assertEqual(self.adb_calls(), [['exec-out', 'screencap', '-p'], ['exec-out', 'screencap'],
+                                            ['exec-out', 'screencap']])
+        self.assertEqual(len(self.captures), 3)
+
+    def test_capture_reuses_stable_frame(self):
+        self.set_adb_state(frames=[0, 1, 1])
+        settled = []
+
+        def wait(*args):
+            result = wait_for_stable_frame(*args)
+            settled.append(self.screencap_count())
+            return result
+
+        with mock.patch.object(scenario_runner, 'wait_for_stable_frame', wait):
+            results = self.runner().run([{'key': 'main', 'steps': [
+                {'action': 'launch'}, {'action': 'wait_idle'}, {'action': 'capture'}]}])
+
+        self.assertTrue(results[0]['ok'], results[0]['error'])
+        self.assertEqual(results[0]['captures'], ['main'])
+        self.assertEqual(self.captures, [(DEVICE, 'main', self.expected_image(1).tobytes())])
+        self.assertIn(['shell', 'am', 'start', '-W', '-n', 'com.soksol/.MainActivity'], self.adb_calls())
+        # capture 단계는 wait_idle의 마지막 프레임을 사용하므로 추가 screencap 없음
+        self.assertEqual(settled, [self.screencap_count()])
+
+    def test_adb_failure_fails_only_that_scenario(self):
+        self.set_adb_state(fail={'input tap': 'error: device offline'})
+        results = self.runner().run([
+            {'key': 'broken', 'steps': [{'action': 'tap', 'x': 1, 'y': 2}, {'action': 'capture'}]},
+            {'key': 'next', 'steps': [{'action': 'capture', 'raw': False}]},
+        ])
+
+        self.assertFalse(results[0]['ok'])
+        self.assertIn('device offline', results[0]['error'])
+        self.assertEqual(results[0]['captures'], [])
+        self.assertTrue(results[1]['ok'], results[1]['error'])
+        self.assertEqual([key for _, key, _ in self.captures], ['next'])
+        self.assertTrue(any('broken' in message for message in self.messages))
+
+    def test_capture_callback_error_is_recorded(self):
+        def on_capture(device_id, key, image, data):
+            raise OSError("No space left on device")
+
+        results = self.runner(on_capture).run([
+            {'key': 'main', 'steps': [{'action': 'capture'}]},
+            {'key': 'next', 'steps': [{'action': 'keyevent', 'code': 4}]},
+        ])
+
+        self.assertFalse(results[0]['ok'])
+        self.assertEqual(results[0]['error'], "OSError: No space left on device")
+        self.assertTrue(results[1]['ok'])
+
+    def test_missing_step_field_is_recorded(self):
+        results = self.runner().run([{'key': 'main', 'steps': [{'action': 'tap', 'x': 1}]}])
+        self.assertFalse(results[0]['ok'])
+        self.assertEqual(results[0]['error'], "KeyError: 'y'")
+
+    def test_required_wait_idle_timeout_fails(self):
+        self.set_adb_state(frames=[0, 1], cycle=True)
+        results = self.runner().run([
+            {'key': 'optional', 'steps': [{'action': 'wait_idle', 'timeout_ms': 100}]},
+            {'key': 'required', 'steps': [{'action': 'wait_idle', 'timeout_ms': 100, 'required': True}]},
+        ])
+
+        self.assertTrue(results[0]['ok'])
+        self.assertGreater(results[0]['settle_time'], 0)
+        self.assertFalse(results[1]['ok'])
+        self.assertIn('100ms', results[1]['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
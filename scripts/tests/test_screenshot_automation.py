@@ -0,0 +1,104 @@
+"""screenshot-automation: 가짜 adb로 디바이스 조회와 스크린샷 촬영 확인"""
+
+import dataclasses
+import unittest
+
+from PIL import Image
+
+from support import SCRIPTS_PATH, FakeAdbTestCase
+
+import fake_adb
+from script_runner import load_script
+from store_assets import build_store_index
+
+automation = load_script(SCRIPTS_PATH / "screenshot-automation.py")
+qa_validator = load_script(SCRIPTS_PATH / "qa-validator.py")
+
+DEVICE = 'emulator-5554'
+
+
+class CaptureScreenshotTest(FakeAdbTestCase):
+
+    def test_lists_connected_devices(self):
+        self.set_adb_state(devices=[DEVICE, 'R58M123ABC'])
+        self.assertTrue(automation.check_adb())
+        self.assertEqual(automation.get_connected_devices(), [DEVICE, 'R58M123ABC'])
+
+    def test_raw_capture_is_saved_as_png(self):
+        self.set_adb_state(header=12, frames=[5])
+        path, image, data = automation.capture_screenshot(DEVICE, self.temp_path / "shots", "main", raw=True)
+
+        self.assertIsNotNone(path)
+        with Image.open(path) as saved:
+            self.assertEqual(saved.format, 'PNG')
+            self.assertEqual(saved.convert('RGBA').tobytes(), self.expected_image(5).tobytes())
+        self.assertEqual(image.tobytes(), self.expected_image(5).tobytes())
+        self.assertEqual(fake_adb.read_calls(self.state_path),
+                         [{'device': DEVICE, 'args': ['exec-out', 'screencap']}])
+
+    def test_png_capture_is_written_unchanged(self):
+        self.set_adb_state(frames=[6])
+        path, image, data = automation.capture_screenshot(DEVICE, self.temp_path / "shots", raw=False)
+
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), data)
+        self.assertEqual(image.convert('RGBA').tobytes(), self.expected_image(6).tobytes())
+
+    def test_failed_capture_returns_none(self):
+        self.set_adb_state(fail={'screencap': 'error: device unauthorized'})
+        self.assertIsNone(automation.take_screenshot(DEVICE, self.temp_path / "shots", raw=True))
+        self.assertFalse((self.temp_path / "shots").exists())
+
+
+
+class RunTest(FakeAdbTestCase):
+    """run()이 모드별 결과를 ScriptResult.data로 돌려주는지 확인"""
+
+    def test_normalize_reports_outputs(self):
+        source_dir = self.temp_path / "raw"
+        source_dir.mkdir()
+        self.expected_image(1).convert('RGB').save(source_dir / "main.png")
+        output_dir = self.temp_path / "playstore"
+
+        result = automation.run(['--normalize', str(source_dir), '--output', str(output_dir), '--no-cache'])
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.data['mode'], 'normalize')
+        self.assertEqual(result.data['outputs'], [str(output_dir / "playstore_main.png")])
+
+    def test_auto_without_devices_fails(self):
+        self.set_adb_state(devices=[])
+        result = automation.run(['--auto', '--scenario', str(SCRIPTS_PATH / "screenshot_scenarios.json")])
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(result.data, {'mode': 'auto', 'scenario': str(SCRIPTS_PATH / "screenshot_scenarios.json"),
+                                       'devices': {}})
+
+
+class AllDevicesCaptureTest(FakeAdbTestCase):
+    """모든 디바이스 촬영 결과를 QA 스토어 자료 검증이 같은 폴더 구조로 집계하는지 확인"""
+
+    def test_store_check_counts_per_device_captures(self):
+        self.set_adb_state(devices=[DEVICE, 'R52T90TABLET'], header=16, frames=[1])
+        store_path = self.temp_path / "assets" / "store"
+        screenshots_dir = store_path / "screenshots"
+        form_factors = {DEVICE: 'phone', 'R52T90TABLET': 'foldable'}
+        for key in ('main', 'chat'):
+            results = automation.capture_on_all_devices(list(form_factors), form_factors, screenshots_dir,
+                                                        screenshots_dir / "playstore", key, raw=True)
+            self.assertTrue(all(path and playstore_path for _, path, playstore_path in results))
+
+        validator = qa_validator.QAValidator()
+        validator.project = dataclasses.replace(validator.project, store_assets=build_store_index(store_path))
+        validator.validate_store_materials()
+
+        counts = [item['description'] for item in validator.warnings + validator.passed
+                  if '스크린샷' in item['description'] and '개' in item['description']]
+        self.assertIn("스크린샷 2개 준비됨", counts)
+        self.assertIn("tablet_7 스크린샷 2개 준비됨", counts)
+        self.assertFalse([description for description in counts if '부족' in description])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+개발 도구 확인
+git, node, Inkscape, ImageMagick의 경로와 버전, 렌더링에 쓰는 Python 모듈(cairosvg, Pillow)의
+설치 여부를 동시에 확인하고 결과를 .cache/toolchain.json에 저장
+
+PATH가 같고 도구 실행 파일(모듈은 소스 파일)의 경로와 mtime이 이전과 같으면 저장된 결과를
+그대로 사용하므로 --version 프로세스를 다시 실행하지 않는다. 확인에 실패한 항목(시간 초과,
+libcairo 누락으로 임포트 실패 등)은 파일이 바뀌지 않아도 해결될 수 있으므로 매번 다시 확인한다.
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tracing import span
+
+BASE_PATH = Path(__file__).parent.parent
+DEFAULT_TOOLCHAIN_PATH = BASE_PATH / ".cache" / "toolchain.json"
+TOOLCHAIN_VERSION = 1
+PROBE_TIMEOUT = 10  # 도구 버전 확인 명령 시간 제한 (초)
+
+# 도구 이름 → 실행 파일 후보 (앞에서부터 PATH에서 찾음)
+TOOLS = {
+    'git': ('git',),
+    'node': ('node',),
+    'inkscape': ('inkscape',),
+    # ImageMagick 7은 magick, 6은 convert
+    'imagemagick': ('magick', 'convert'),
+}
+
+# 기능 이름 → 모듈 이름
+MODULES = {
+    'cairosvg': 'cairosvg',
+    'pil': 'PIL',
+}
+
+# 렌더링 백엔드 (빠른 순서: 프로세스 내부 렌더링 우선)
+SVG_BACKENDS = ('cairosvg', 'inkscape')
+RASTER_BACKENDS = ('pil', 'imagemagick')
+
+
+@dataclass(frozen=True)
+class ToolInfo:
+    name: str
+    path: str = None          # 실행 파일(모듈은 소스 파일) 경로, 없으면 None
+    mtime: float = 0.0
+    version: str = ''
+    error: str = None
+    cached: bool = False      # 이전 확인 결과를 재사용했으면 True
+
+    @property
+    def available(self):
+        return self.path is not None and self.error is None
+
+    @property
+    def summary(self):
+        """버전 출력의 첫 줄"""
+        return self.version.splitlines()[0] if self.version else ''
+
+
+@dataclass(frozen=True)
+class Toolchain:
+    tools: dict = field(default_factory=dict)      # 도구 이름 → ToolInfo
+    modules: dict = field(default_factory=dict)    # 기능 이름 → ToolInfo
+
+    def available(self, name):
+        info = self.tools.get(name) or self.modules.get(name)
+        return info is not None and info.available
+
+    def version(self, name):
+        info = self.tools.get(name) or self.modules.get(name)
+        return info.version if info is not None else ''
+
+    @property
+    def capabilities(self):
+        """기능 이름 → 사용 가능 여부"""
+        return {name: self.available(name) for name in SVG_BACKENDS + RASTER_BACKENDS}
+
+    @property
+    def svg_backends(self):
+        """사용 가능한 SVG 렌더링 백엔드 (빠른 순서)"""
+        return [name for name in SVG_BACKENDS if self.available(name)]
+
+    @property
+    def raster_backends(self):
+        """사용 가능한 래스터 이미지 처리 백엔드 (빠른 순서)"""
+        return [name for name in RASTER_BACKENDS if self.available(name)]
+
+    @property
+    def cached(self):
+        return all(info.cached for info in (*self.tools.values(), *self.modules.values()))
+
+    def to_dict(self):
+        def entries(infos):
+            return {name: {'path': info.path, 'version': info.summary, 'available': info.available,
+                           'cached': info.cached} for name, info in infos.items()}
+        return {'tools': entries(self.tools), 'modules': entries(self.modules),
+                'capabilities': self.capabilities}
+
+
+def path_digest():
+    """PATH와 Python 인터프리터의 해시 (바뀌면 저장된 결과 전체를 무효화)"""
+    value = os.pathsep.join([os.environ.get('PATH', ''), sys.executable])
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()[:16]
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+
+
+def _locate_tool(name):
+    for command in TOOLS[name]:
+        path = shutil.which(command)
+        if path:
+            return path
+    return None
+
+
+def _locate_module(name):
+    try:
+        spec = importlib.util.find_spec(MODULES[name])
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec is not None and spec.origin else None
+
+
+def _probe_tool(name, path, timeout):
+    if path is None:
+        return ToolInfo(name)
+    try:
+        with span(f"{name} --version", 'subprocess'):
+            result = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return ToolInfo(name, path, _mtime(path), error=f"버전 확인 시간 초과 ({timeout}초)")
+    except OSError as e:
+        return ToolInfo(name, path, _mtime(path), error=str(e))
+    if result.returncode != 0:
+        return ToolInfo(name, path, _mtime(path), error=f"--version 종료 코드 {result.returncode}")
+    return ToolInfo(name, path, _mtime(path), result.stdout.strip())
+
+
+def _probe_module(name, origin):
+    if origin is None:
+        return ToolInfo(name)
+    try:
+        # cairosvg는 설치되어 있어도 libcairo가 없으면 임포트할 때 OSError
+        module = importlib.import_module(MODULES[name])
+    except (ImportError, OSError) as e:
+        return ToolInfo(name, origin, _mtime(origin), error=str(e))
+    return ToolInfo(name, origin, _mtime(origin), str(getattr(module, '__version__', '')))
+
+
+def _load_cache(cache_path):
+    try:
+        cache = json.loads(Path(cache_path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != TOOLCHAIN_VERSION or cache.get('path') != path_digest():
+        return {}
+    return cache
+
+
+def _save_cache(cache_path, toolchain):
+    cache_path = Path(cache_path)
+    def entries(infos):
+        return {name: {'path': info.path, 'mtime': info.mtime, 'version': info.version, 'error': info.error}
+                for name, info in infos.items()}
+    cache = {'version': TOOLCHAIN_VERSION, 'path': path_digest(),
+             'tools': entries(toolchain.tools), 'modules': entries(toolchain.modules)}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding='utf-8')
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # 캐시를 쓰지 못해도 확인 결과는 그대로 사용
+        pass
+
+
+def _reuse(name, path, entry):
+    """저장된 항목이 현재 경로/mtime과 같고 확인에 성공했으면 ToolInfo, 아니면 None"""
+    if entry is None or entry.get('path') != path or entry.get('error'):
+        return None
+    if path is not None and entry.get('mtime') != _mtime(path):
+        return None
+    return ToolInfo(name, path, entry.get('mtime', 0.0), entry.get('version', ''), entry.get('error'), cached=True)
+
+
+def detect_toolchain(cache_path=DEFAULT_TOOLCHAIN_PATH, refresh=False, timeout=PROBE_TIMEOUT):
+    """도구/모듈 확인 (바뀐 항목만 스레드 풀에서 동시에 확인, refresh=True이면 모두 다시 확인)"""
+    cache = {} if refresh else _load_cache(cache_path)
+    tools, modules, probes = {}, {}, []
+
+    for name in TOOLS:
+        path = _locate_tool(name)
+        info = _reuse(name, path, cache.get('tools', {}).get(name))
+        if info is None:
+            probes.append((tools, name, _probe_tool, path, timeout))
+        else:
+            tools[name] = info
+    for name in MODULES:
+        origin = _locate_module(name)
+        info = _reuse(name, origin, cache.get('modules', {}).get(name))
+        if info is None:
+            probes.append((modules, name, _probe_module, origin))
+        else:
+            modules[name] = info
+
+    if probes:
+        with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+            futures = [(target, name, pool.submit(probe, name, *args)) for target, name, probe, *args in probes]
+            for target, name, future in futures:
+                target[name] = future.result()
+
+    # 선언 순서 유지
+    toolchain = Toolchain({name: tools[name] for name in TOOLS}, {name: modules[name] for name in MODULES})
+    if probes:
+        _save_cache(cache_path, toolchain)
+    return toolchain
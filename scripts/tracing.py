@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+실행 구간 추적
+단계, 검증기, 렌더링 작업, ADB 호출, 하위 프로세스를 중첩된 구간(span)으로 기록하고
+실행이 끝나면 Chrome trace-event JSON(chrome://tracing, Perfetto)과 구간별 요약 표를 출력
+
+    with tracing.session('master-prep', summary=True):
+        with tracing.span('build_app', 'step'):
+            ...
+
+구간은 스레드별 스택으로 중첩을 추적하며 self 시간(하위 구간을 뺀 시간)을 함께 기록한다.
+스레드 풀에서 실행하는 작업은 within=current_span()으로 작업을 나눠 준 구간을 부모로 지정한다
+(동시에 실행된 하위 구간의 합이 부모보다 길면 부모의 self 시간은 0으로 본다).
+최상위 세션은 SOKSOL_TRACE_DIR에 임시 폴더를 지정하고, 하위 프로세스(격리 실행 스크립트,
+렌더링 워커)는 자기 구간을 그 폴더에 JSON Lines로 추가한다. 세션이 끝나면 모두 합쳐 내보낸다.
+하위 프로세스를 실행한 구간의 self 시간에서는 그 프로세스 세션 시간을 빼므로, 남는 값은
+인터프리터 시작과 모듈 임포트 같은 프로세스 비용이다.
+
+구간 하나는 리스트에 튜플 하나를 추가하는 정도의 비용이라 기본으로 켜 둔다.
+SOKSOL_TRACE=0이면 기록하지 않는다.
+"""
+
+import atexit
+import itertools
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent.parent
+DEFAULT_TRACE_DIR = BASE_PATH / ".cache" / "traces"
+TRACE_DIR_ENV = 'SOKSOL_TRACE_DIR'
+TRACE_PARENT_ENV = 'SOKSOL_TRACE_PARENT'  # 하위 프로세스를 실행한 구간 id
+SUMMARY_LIMIT = 15  # 요약 표에 출력할 구간 수
+
+ENABLED = os.environ.get('SOKSOL_TRACE') != '0'
+
+# perf_counter는 기간 측정용, 프로세스 간 시각 정렬은 벽시계 기준
+_EPOCH_OFFSET = time.time_ns() - time.perf_counter_ns()
+
+_events = []             # (이름, 분류, 시작 ns, 기간 ns, self ns, 스레드 id, 인자)
+_thread_names = {}
+_local = threading.local()
+_flushed = 0             # 하위 프로세스에서 이미 파일로 내보낸 구간 수
+_is_root = False         # 이 프로세스가 최상위 세션이면 True
+_span_ids = itertools.count(1)
+_children_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    # fork된 워커는 부모가 기록한 구간과 열린 구간 스택을 물려받으므로 비움
+    global _events, _thread_names, _local, _flushed, _is_root
+    _events = []
+    _thread_names = {}
+    _local = threading.local()
+    _flushed = 0
+    _is_root = False
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class span:
+    """구간 기록 컨텍스트 관리자 (args는 trace 뷰어에 표시할 값)
+
+    within은 다른 스레드에서 열린 부모 구간이다 (이 스레드에 열린 구간이 없을 때만 사용).
+    """
+
+    __slots__ = ('name', 'category', 'args', 'within', 'started', 'children')
+
+    def __init__(self, name, category='', within=None, **args):
+        self.name = name
+        self.category = category
+        self.within = within
+        self.args = args
+
+    def __enter__(self):
+        if ENABLED:
+            stack = getattr(_local, 'stack', None)
+            if stack is None:
+                stack = _local.stack = []
+            stack.append(self)
+            self.children = 0
+            self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not ENABLED:
+            return False
+        duration = time.perf_counter_ns() - self.started
+        stack = _local.stack
+        stack.pop()
+        if stack:
+            stack[-1].children += duration
+        elif self.within is not None:
+            with _children_lock:
+                self.within.children += duration
+        thread = threading.current_thread()
+        if thread.ident not in _thread_names:
+            _thread_names[thread.ident] = thread.name
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        _events.append((self.name, self.category, self.started, duration,
+                        duration - self.children, thread.ident, self.args))
+        return False
+
+    def child_env(self, env=None):
+        """이 구간에서 실행하는 하위 프로세스의 환경 변수 (하위 세션이 이 구간을 부모로 기록)"""
+        span_id = self.args.setdefault('span_id', f"{os.getpid()}:{next(_span_ids)}")
+        return dict(os.environ if env is None else env, **{TRACE_PARENT_ENV: span_id})
+
+
+def current_span():
+    """이 스레드에서 가장 안쪽에 열린 구간 (없으면 None)"""
+    stack = getattr(_local, 'stack', None)
+    return stack[-1] if stack else None
+
+
+def _chrome_events(events, pid):
+    for name, category, started, duration, self_time, tid, args in events:
+        yield {'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': tid,
+               'ts': (started + _EPOCH_OFFSET) / 1000, 'dur': duration / 1000,
+               'args': dict(args, self_ms=round(max(self_time, 0) / 1e6, 3))}
+
+
+def _metadata_events(pid, process_name):
+    yield {'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': process_name}}
+    for tid, thread_name in list(_thread_names.items()):
+        yield {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}}
+
+
+def _process_name():
+    return Path(sys.argv[0]).name if sys.argv and sys.argv[0] else 'python'
+
+
+def flush():
+    """하위 프로세스에서 지금까지 기록한 구간을 세션 폴더에 추가 (최상위 세션이거나 세션이 없으면 무시)
+
+    atexit을 거치지 않고 종료되는 워커 프로세스는 작업마다 호출한다.
+    """
+    global _flushed
+    trace_dir = os.environ.get(TRACE_DIR_ENV)
+    if not ENABLED or _is_root or not trace_dir or _flushed == len(_events):
+        return
+    events = _events[_flushed:]
+    pid = os.getpid()
+    lines = list(_metadata_events(pid, _process_name())) + list(_chrome_events(events, pid))
+    try:
+        with open(Path(trace_dir) / f"{pid}.jsonl", 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(line, ensure_ascii=False) + '\n' for line in lines))
+    except OSError:
+        # 세션 폴더가 이미 정리되었으면 버림
+        pass
+    _flushed += len(events)
+
+
+# 세션 없이 실행된 하위 프로세스도 종료 시 구간을 남김
+atexit.register(flush)
+
+
+def collect(trace_dir):
+    """이 프로세스와 하위 프로세스의 구간을 Chrome trace 이벤트 목록으로 합침"""
+    pid = os.getpid()
+    events = list(_metadata_events(pid, _process_name())) + list(_chrome_events(list(_events), pid))
+    if trace_dir is None:
+        return events
+    for path in sorted(Path(trace_dir).glob('*.jsonl')):
+        for line in path.read_text(encoding='utf-8').splitlines():
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                # 종료 중에 잘린 마지막 줄
+                continue
+    return events
+
+
+def summarize(events):
+    """구간 이름별 [호출 수, 전체 ms, self ms] (self 시간 내림차순)"""
+    spans = [event for event in events if event.get('ph') == 'X']
+    # 하위 프로세스 세션 시간은 그 프로세스를 실행한 구간의 self 시간에서 뺌
+    children = {}
+    for event in spans:
+        parent = event['args'].get('parent')
+        if event['cat'] == 'session' and parent:
+            children[parent] = children.get(parent, 0.0) + event['dur'] / 1000
+    totals = {}
+    for event in spans:
+        entry = totals.setdefault(event['name'], [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += event['dur'] / 1000
+        self_time = event['args']['self_ms'] - children.get(event['args'].get('span_id'), 0.0)
+        entry[2] += max(self_time, 0.0)
+    return sorted(totals.items(), key=lambda item: item[1][2], reverse=True)
+
+
+def print_summary(events, limit=SUMMARY_LIMIT):
+    rows = summarize(events)
+    if not rows:
+        return
+    width = min(max(len(name) for name, _ in rows[:limit]), 40)
+    print(f"\n⏱️  구간별 시간 (self 시간 상위 {min(limit, len(rows))}개)")
+    # 한글 머리글은 글자당 두 칸을 차지하므로 그만큼 덜 채움
+    print(f"   {'구간':<{width - 2}} {'호출':>4} {'전체':>8} {'self':>10}")
+    for name, (count, total, self_time) in rows[:limit]:
+        print(f"   {name[:width]:<{width}} {count:>6} {total / 1000:>9.2f}s {self_time / 1000:>9.2f}s")
+
+
+class session:
+    """실행 전체를 하나의 trace로 묶는 컨텍스트 관리자
+
+    다른 세션의 하위 프로세스로 실행되면(SOKSOL_TRACE_DIR가 이미 있으면) 최상위 구간만 열고
+    종료할 때 구간을 세션 폴더에 추가한다. 최상위 세션이면 종료할 때 하위 프로세스의 구간을
+    합쳐 output(기본: .cache/traces/<이름>.json)에 저장하고 summary=True이면 요약 표를 출력한다.
+    """
+
+    def __init__(self, name, output=None, summary=False):
+        self.name = name
+        self.output = Path(output) if output else DEFAULT_TRACE_DIR / f"{name}.json"
+        self.summary = summary
+        self.root = False
+        self.trace_dir = None
+        self._span = None
+
+    def __enter__(self):
+        global _is_root
+        parent = os.environ.get(TRACE_PARENT_ENV)
+        self._span = span(self.name, 'session', parent=parent) if parent else span(self.name, 'session')
+        if ENABLED and not os.environ.get(TRACE_DIR_ENV):
+            trace_dir = DEFAULT_TRACE_DIR / f"run-{os.getpid()}"
+            try:
+                trace_dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                # 폴더를 만들 수 없으면 이 프로세스의 구간만 내보냄
+                trace_dir = None
+            self.root = _is_root = True
+            self.trace_dir = trace_dir
+            if trace_dir is not None:
+                os.environ[TRACE_DIR_ENV] = str(trace_dir)
+        self._span.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _is_root
+        self._span.__exit__(exc_type, exc, tb)
+        if not self.root:
+            flush()
+            return False
+
+        os.environ.pop(TRACE_DIR_ENV, None)
+        _is_root = False
+        try:
+            events = collect(self.trace_dir)
+            # 같은 프로세스에서 다음 세션이 구간을 중복으로 내보내지 않도록 비움
+            del _events[:]
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+            self.output.write_text(json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'},
+                                              ensure_ascii=False), encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️  trace 저장 실패: {e}")
+            return False
+        finally:
+            if self.trace_dir is not None:
+                shutil.rmtree(self.trace_dir, ignore_errors=True)
+        if self.summary:
+            print_summary(events)
+            print(f"🧭 trace: {self.output} (chrome://tracing 또는 https://ui.perfetto.dev)")
+        return False